@@ -6,8 +6,12 @@ from sqlalchemy import pool
 
 from app.core.config import get_settings
 from app.db.base import Base
+from app.db.fts import TRANSACTIONS_FTS_TABLE
 from app.models.user import User
 from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.daily_category_total import DailyCategoryTotal
+from app.models.transaction_tombstone import TransactionTombstone
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -28,6 +32,14 @@ config.set_main_option("sqlalchemy.url", settings.database_url)
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    # The FTS5 index and its shadow tables are managed by hand in migrations
+    if type_ == "table" and name.startswith(TRANSACTIONS_FTS_TABLE):
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -50,6 +62,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -73,7 +86,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
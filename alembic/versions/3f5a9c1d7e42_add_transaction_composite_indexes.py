@@ -0,0 +1,41 @@
+"""Add transaction composite indexes
+
+Revision ID: 3f5a9c1d7e42
+Revises: 8c2ddfe0e967
+Create Date: 2025-08-11 09:27:44.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f5a9c1d7e42'
+down_revision: Union[str, None] = '8c2ddfe0e967'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ix_transactions_id duplicates the primary key
+    op.drop_index('ix_transactions_id', table_name='transactions')
+    op.create_index('ix_transactions_user_date_id', 'transactions',
+                    ['user_id', 'date', 'id'], unique=False)
+    op.create_index('ix_transactions_user_category_date', 'transactions',
+                    ['user_id', 'category_id', 'date'], unique=False)
+    op.create_index('ix_transactions_user_amount_id', 'transactions',
+                    ['user_id', 'amount', 'id'], unique=False)
+    op.create_index('ix_transactions_user_last_changed_id', 'transactions',
+                    ['user_id', 'last_changed', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_user_last_changed_id',
+                  table_name='transactions')
+    op.drop_index('ix_transactions_user_amount_id', table_name='transactions')
+    op.drop_index('ix_transactions_user_category_date',
+                  table_name='transactions')
+    op.drop_index('ix_transactions_user_date_id', table_name='transactions')
+    op.create_index('ix_transactions_id', 'transactions', ['id'], unique=False)
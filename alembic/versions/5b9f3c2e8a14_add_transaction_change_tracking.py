@@ -0,0 +1,51 @@
+"""Add transaction change tracking
+
+Revision ID: 5b9f3c2e8a14
+Revises: d4e8a1f07b36
+Create Date: 2025-08-15 16:40:09.273851
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b9f3c2e8a14'
+down_revision: Union[str, None] = 'd4e8a1f07b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows predate every sync token, so version 0 is exact
+    op.add_column('transactions', sa.Column('change_version', sa.Integer(),
+                                            server_default='0', nullable=False))
+    op.create_index('ix_transactions_user_change_version', 'transactions',
+                    ['user_id', 'change_version'], unique=False)
+
+    op.create_table('transaction_tombstones',
+                    sa.Column('id', sa.Integer(), nullable=False),
+                    sa.Column('user_id', sa.Integer(), nullable=False),
+                    sa.Column('transaction_id', sa.Integer(), nullable=False),
+                    sa.Column('change_version', sa.Integer(), nullable=False),
+                    sa.Column('deleted_at', sa.DateTime(timezone=True),
+                              server_default=sa.text('(CURRENT_TIMESTAMP)'),
+                              nullable=False),
+                    sa.ForeignKeyConstraint(
+                        ['user_id'], ['users.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('id')
+                    )
+    op.create_index('ix_transaction_tombstones_user_change_version',
+                    'transaction_tombstones', ['user_id', 'change_version'],
+                    unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transaction_tombstones_user_change_version',
+                  table_name='transaction_tombstones')
+    op.drop_table('transaction_tombstones')
+    op.drop_index('ix_transactions_user_change_version',
+                  table_name='transactions')
+    op.drop_column('transactions', 'change_version')
@@ -0,0 +1,53 @@
+"""Add daily category totals rollup
+
+Revision ID: 8c2ddfe0e967
+Revises: 6209866ebb3e
+Create Date: 2025-08-10 14:12:03.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2ddfe0e967'
+down_revision: Union[str, None] = '6209866ebb3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_category_totals',
+                    sa.Column('user_id', sa.Integer(), nullable=False),
+                    sa.Column('category_id', sa.Integer(), nullable=False),
+                    sa.Column('date', sa.Date(), nullable=False),
+                    sa.Column('total_amount', sa.DECIMAL(
+                        precision=14, scale=2), nullable=False),
+                    sa.Column('transaction_count',
+                              sa.Integer(), nullable=False),
+                    sa.Column('max_amount', sa.DECIMAL(
+                        precision=10, scale=2), nullable=False),
+                    sa.ForeignKeyConstraint(
+                        ['category_id'], ['categories.id'], ),
+                    sa.ForeignKeyConstraint(
+                        ['user_id'], ['users.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('user_id', 'category_id', 'date')
+                    )
+    op.create_index('ix_daily_category_totals_user_date',
+                    'daily_category_totals', ['user_id', 'date'], unique=False)
+
+    # Backfill the rollup from existing transactions
+    op.execute(
+        "INSERT INTO daily_category_totals "
+        "(user_id, category_id, date, total_amount, transaction_count, max_amount) "
+        "SELECT user_id, category_id, date, SUM(amount), COUNT(*), MAX(amount) "
+        "FROM transactions GROUP BY user_id, category_id, date"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_daily_category_totals_user_date',
+                  table_name='daily_category_totals')
+    op.drop_table('daily_category_totals')
@@ -0,0 +1,60 @@
+"""Add transactions full-text search index
+
+Revision ID: b71e4d2a9c05
+Revises: 3f5a9c1d7e42
+Create Date: 2025-08-12 17:55:21.630948
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e4d2a9c05'
+down_revision: Union[str, None] = '3f5a9c1d7e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # FTS5 is SQLite only; other backends keep searching with LIKE
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+        "description, content='transactions', content_rowid='id')"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+        "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+        "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+        "VALUES ('delete', old.id, old.description); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_au AFTER UPDATE OF description ON transactions BEGIN "
+        "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+        "VALUES ('delete', old.id, old.description); "
+        "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); "
+        "END"
+    )
+
+    # Index the descriptions of existing transactions
+    op.execute(
+        "INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS transactions_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS transactions_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS transactions_fts_ai")
+    op.execute("DROP TABLE IF EXISTS transactions_fts")
@@ -0,0 +1,27 @@
+"""Add users data version
+
+Revision ID: d4e8a1f07b36
+Revises: b71e4d2a9c05
+Create Date: 2025-08-14 10:12:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e8a1f07b36'
+down_revision: Union[str, None] = 'b71e4d2a9c05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('data_version', sa.Integer(),
+                                     server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'data_version')
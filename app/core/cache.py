@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a TTL."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RecentWrites:
+    """When each user last wrote, kept for `window_seconds` after the write.
+
+    Lets a user's reads go to the writer right after their own write. Only
+    this process's writes are seen; cache invalidation uses the persisted
+    users.data_version instead.
+    """
+
+    def __init__(self, window_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.window_seconds = window_seconds
+        self._clock = clock
+        # Oldest write first, so expired entries are dropped from the front
+        self._written_at: "OrderedDict[int, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, user_id: int) -> None:
+        with self._lock:
+            now = self._clock()
+            self._written_at.pop(user_id, None)
+            while (self._written_at
+                   and next(iter(self._written_at.values())) <= now - self.window_seconds):
+                self._written_at.popitem(last=False)
+            self._written_at[user_id] = now
+
+    def written_recently(self, user_id: int) -> bool:
+        written_at = self._written_at.get(user_id)
+        return written_at is not None and self._clock() - written_at < self.window_seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._written_at.clear()
+
+    def __len__(self) -> int:
+        return len(self._written_at)
+
+
+recent_writes = RecentWrites(settings.read_your_writes_seconds)
@@ -0,0 +1,215 @@
+import dataclasses
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.crud.user import get_user_data_version
+from app.models.category import Category, CategoryType
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class CachedCategory:
+    """Read-only copy of a category row, safe to share across sessions."""
+    id: int
+    name: str
+    category_type: CategoryType
+    last_changed: datetime
+    user_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    version: int
+    categories: Tuple[CachedCategory, ...]
+    by_id: Mapping[int, CachedCategory]
+    by_name: Mapping[str, CachedCategory]
+    by_type: Mapping[CategoryType, Tuple[CachedCategory, ...]]
+    # Digest of the rows, equal in every process that loaded the same data
+    fingerprint: str
+    # The owner's persisted users.data_version the rows belong to
+    data_version: Optional[int] = None
+
+    @classmethod
+    def build(cls, version: int, categories: Iterable[CachedCategory],
+              data_version: Optional[int] = None) -> "CategorySnapshot":
+        categories = tuple(categories)
+        by_name = {}
+        for category in categories:
+            # Keep the first (lowest id) category of a name, as the query did
+            by_name.setdefault(category.name, category)
+        fingerprint = hashlib.blake2b(repr([
+            (category.id, category.name, category.category_type.value,
+             category.last_changed.isoformat() if category.last_changed else None)
+            for category in categories
+        ]).encode(), digest_size=8).hexdigest()
+        return cls(
+            version=version,
+            categories=categories,
+            by_id=MappingProxyType({category.id: category for category in categories}),
+            by_name=MappingProxyType(by_name),
+            by_type=MappingProxyType({
+                category_type: tuple(category for category in categories
+                                     if category.category_type == category_type)
+                for category_type in CategoryType
+            }),
+            fingerprint=fingerprint,
+            data_version=data_version
+        )
+
+
+def _load_snapshot(db: Session, version: int, user_id: Optional[int],
+                   data_version: Optional[int] = None) -> CategorySnapshot:
+    owner = Category.user_id.is_(None) if user_id is None else Category.user_id == user_id
+    rows = db.query(
+        Category.id, Category.name, Category.category_type, Category.last_changed
+    ).filter(owner).order_by(Category.id).all()
+    return CategorySnapshot.build(version, (
+        CachedCategory(id=row.id, name=row.name, category_type=row.category_type,
+                       last_changed=row.last_changed, user_id=user_id)
+        for row in rows
+    ), data_version)
+
+
+class GlobalCategoryCache:
+    """Process-wide snapshot of the global categories (user_id IS NULL).
+
+    The snapshot is loaded on startup (or first use) and reused until the
+    version moves. Committed ORM writes to a global category bump the
+    version; changes made outside this process (migrations) take effect on
+    restart or `invalidate`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot: Optional[CategorySnapshot] = None
+        self.loads = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, db: Session) -> CategorySnapshot:
+        version = self._version
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        # Queried without the lock: on the async path the query yields to the
+        # event loop, where a request waiting on the lock would block it.
+        # An invalidation during the query leaves this snapshot stale, so the
+        # next call loads again
+        snapshot = _load_snapshot(db, version, user_id=None)
+        with self._lock:
+            current = self._snapshot
+            # Concurrent cold loads may race; keep the newest version
+            if current is None or current.version <= version:
+                self._snapshot = snapshot
+            self.loads += 1
+        return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+            self.loads = 0
+
+
+class UserCategoryCache:
+    """Snapshots of each user's own categories in a bounded LRU.
+
+    A snapshot is tagged with the user's persisted data version and used
+    only while that version is current, so category writes from any
+    process retire it. The category write paths in this process also drop
+    it (write-through invalidation).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._entries = TTLCache(max_entries, ttl_seconds)
+        self._lock = threading.Lock()
+        # Bumped by every invalidation so a load racing a write is not stored
+        self._generation = 0
+
+    def get(self, db: Session, user_id: int, data_version: Optional[int] = None) -> CategorySnapshot:
+        """The user's categories as of `data_version`, the persisted version
+        (read when not given)."""
+        if data_version is None:
+            data_version = get_user_data_version(db, user_id)
+        snapshot = self._entries.get(user_id)
+        if snapshot is not None and snapshot.data_version == data_version:
+            return snapshot
+
+        generation = self._generation
+        snapshot = _load_snapshot(db, generation, user_id, data_version)
+        with self._lock:
+            if generation == self._generation:
+                self._entries.set(user_id, snapshot)
+        return snapshot
+
+    def advance(self, user_id: int, from_version: int, to_version: int) -> None:
+        """Re-tag a snapshot after a committed write that left the categories alone."""
+        with self._lock:
+            snapshot = self._entries.get(user_id)
+            if snapshot is not None and snapshot.data_version == from_version:
+                self._entries.set(user_id, dataclasses.replace(snapshot, data_version=to_version))
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.delete(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._entries.stats()
+
+
+global_categories = GlobalCategoryCache()
+user_categories = UserCategoryCache(settings.category_cache_max_entries,
+                                    settings.category_cache_ttl_seconds)
+
+_PENDING_KEY = "global_categories_changed"
+
+
+def _touches_global_category(instance) -> bool:
+    if not isinstance(instance, Category):
+        return False
+    if instance.user_id is None:
+        return True
+    # A category moved away from global scope
+    return None in inspect(instance).attrs.user_id.history.deleted
+
+
+@event.listens_for(Session, "after_flush")
+def _track_global_category_writes(session, flush_context):
+    if any(_touches_global_category(instance)
+           for instance in (*session.new, *session.dirty, *session.deleted)):
+        session.info[_PENDING_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop(_PENDING_KEY, False):
+        global_categories.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_rolled_back_writes(session, previous_transaction):
+    session.info.pop(_PENDING_KEY, None)
@@ -1,5 +1,6 @@
 from functools import lru_cache
 from decimal import Decimal
+from typing import Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -11,19 +12,74 @@ class Settings(BaseSettings):
     port: int = Field(8000)
     reload: bool = Field(True)
     log_level: str = Field("INFO")
+    request_query_budget: int = Field(
+        20, description="SQL statements per request above which it is logged as a warning, 0 disables")
+    metrics_enabled: bool = Field(
+        True, description="Serve Prometheus metrics on /metrics")
 
     database_url: str = Field("sqlite:///./data/homebudget.db")
+    async_database_url: Optional[str] = Field(
+        None, description="Async driver URL; derived from database_url when unset")
+    read_database_url: Optional[str] = Field(
+        None, description="Replica URL for reads; SQLite files default to a read-only URI")
+    read_your_writes_seconds: float = Field(
+        5.0, description="Seconds after a write during which the user's reads use the writer")
+
+    sqlite_journal_mode: str = Field(
+        "WAL", description="SQLite journal_mode; WAL lets readers run alongside the writer")
+    sqlite_synchronous: str = Field(
+        "NORMAL", description="SQLite synchronous level; NORMAL is durable under WAL except on power loss")
+    sqlite_busy_timeout_ms: int = Field(
+        5000, description="Milliseconds a connection waits for a lock before failing")
+    sqlite_cache_size_kib: int = Field(
+        20000, description="Page cache per connection in KiB")
+    sqlite_mmap_size_bytes: int = Field(
+        268435456, description="Bytes of the database file to memory-map, 0 disables")
+    sqlite_temp_store: str = Field(
+        "MEMORY", description="Where SQLite keeps temporary tables and indices")
+    sqlite_foreign_keys: bool = Field(
+        True, description="Enforce foreign key constraints")
+    sqlite_housekeeping_interval_seconds: float = Field(
+        300.0, description="Seconds between WAL checkpoint/optimize runs, 0 disables")
 
     secret_key: str = Field(
         "09d25e094faa6ca2556c818166b7a9563b93f7099f6f0f4caa6cf63b88e8d3e7")
     jwt_algorithm: str = Field("HS256")
     access_token_expire_minutes: int = Field(30)
 
+    password_hash_workers: int = Field(
+        4, description="Threads dedicated to bcrypt hashing and verification")
+    password_hash_max_queue: int = Field(
+        64, description="Password hashes allowed to wait for a worker before logins get 503")
+
+    user_cache_max_entries: int = Field(
+        4096, description="Maximum number of cached user rows")
+    user_cache_ttl_seconds: float = Field(
+        300.0, description="Seconds a cached user row stays valid")
+    category_cache_max_entries: int = Field(
+        4096, description="Maximum number of users whose categories are cached")
+    category_cache_ttl_seconds: float = Field(
+        300.0, description="Seconds a user's cached categories stay valid")
+
     initial_transaction_amount: Decimal = Field(
         Decimal("1000.00"),
         description="Predefined amount of money on user account "
     )
 
+    bulk_import_max_rows: int = Field(
+        50000, description="Maximum number of rows in one bulk import")
+    bulk_import_chunk_size: int = Field(
+        1000, description="Rows inserted and committed together during bulk import")
+    bulk_change_max_ids: int = Field(
+        10000, description="Maximum number of ids in one bulk update or delete")
+
+    summary_cache_max_entries: int = Field(
+        1024, description="Maximum number of cached summary responses")
+    summary_cache_ttl_seconds: float = Field(
+        60.0, description="Seconds a cached summary response stays valid")
+    summary_series_max_buckets: int = Field(
+        5000, description="Maximum number of points in one summary series")
+
     model_config = SettingsConfigDict(env_file=".env")
 
 
@@ -1,31 +1,71 @@
 from typing import Optional
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from app.core.cache import TTLCache, recent_writes
+from app.core.config import get_settings
 from app.core.exceptions import UserExceptions
-from app.core.security import get_current_user_email, verify_token
+from app.core.security import Principal, oauth2_scheme, verify_token_principal
 from app.crud.user import get_user_by_email
-from app.db.session import get_db
+from app.db.session import get_async_db, get_async_reader_db, get_db, get_reader_db
 from app.models.user import User
 
+settings = get_settings()
 optional_bearer = HTTPBearer(auto_error=False)
 
+READ_METHODS = frozenset({"GET", "HEAD"})
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    current_user_email: str = Depends(get_current_user_email)
-) -> User:
-    user = get_user_by_email(db, email=current_user_email)
+# Detached user rows keyed by id; merged into the request session on use
+user_cache = TTLCache(settings.user_cache_max_entries,
+                      settings.user_cache_ttl_seconds)
+
+
+def _detached_copy(user: User) -> User:
+    copy = User(**{column.key: getattr(user, column.key)
+                   for column in User.__table__.columns})
+    make_transient_to_detached(copy)
+    return copy
+
+
+def _load_user(db: Session, principal: Principal) -> Optional[User]:
+    if principal.id is not None:
+        cached = user_cache.get(principal.id)
+        if cached is not None:
+            return db.merge(cached, load=False)
+        user = db.get(User, principal.id)
+    else:
+        user = get_user_by_email(db, email=principal.email)
+
+    if user is not None:
+        user_cache.set(user.id, _detached_copy(user))
+    return user
+
+
+def _resolve_principal(db: Session, principal: Principal) -> Principal:
+    # Tokens issued before the uid claim still need one lookup by email
+    user = _load_user(db, principal)
     if user is None:
         raise UserExceptions.user_not_found()
-    return user
+    return Principal(id=user.id, email=user.email)
+
 
+async def get_current_principal(
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(oauth2_scheme)
+) -> Principal:
+    """Authenticated user's id and email, taken from the token alone."""
+    principal = verify_token_principal(token)
+    if principal.id is not None:
+        return principal
+    return await db.run_sync(_resolve_principal, principal)
 
-def get_current_user_optional(
-    db: Session = Depends(get_db),
+
+async def get_current_principal_optional(
+    db: AsyncSession = Depends(get_async_db),
     token: Optional[str] = Depends(optional_bearer)
-) -> Optional[User]:
+) -> Optional[Principal]:
     if token is None:
         return None
 
@@ -35,9 +75,62 @@ def get_current_user_optional(
         else:
             token_str = str(token)
 
-        user_email = verify_token(token_str)
-        user = get_user_by_email(db, email=user_email)
-        return user
+        principal = verify_token_principal(token_str)
+        if principal.id is not None:
+            return principal
+        return await db.run_sync(_resolve_principal, principal)
     except HTTPException:
         # Invalid token, but no error raised for optional auth
         return None
+
+
+def _get_user(db: Session, principal: Principal) -> User:
+    user = _load_user(db, principal)
+    if user is None:
+        raise UserExceptions.user_not_found()
+    return user
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal)
+) -> User:
+    """Full user row, for endpoints that need more than the id."""
+    return await db.run_sync(_get_user, principal)
+
+
+def _use_reader(principal: Optional[Principal]) -> bool:
+    # A user who just wrote reads from the writer, so a lagging replica
+    # never hides their own change
+    return principal is None or not recent_writes.written_recently(principal.id)
+
+
+def get_read_db(
+    principal: Optional[Principal] = Depends(get_current_principal_optional),
+    writer: Session = Depends(get_db),
+    reader: Session = Depends(get_reader_db)
+) -> Session:
+    """Session for read-only work, on the reader unless the user just wrote."""
+    return reader if _use_reader(principal) else writer
+
+
+async def get_async_read_db(
+    principal: Optional[Principal] = Depends(get_current_principal_optional),
+    writer: AsyncSession = Depends(get_async_db),
+    reader: AsyncSession = Depends(get_async_reader_db)
+) -> AsyncSession:
+    """Async session for read-only work, on the reader unless the user just wrote."""
+    return reader if _use_reader(principal) else writer
+
+
+async def get_async_routed_db(
+    request: Request,
+    principal: Optional[Principal] = Depends(get_current_principal_optional),
+    writer: AsyncSession = Depends(get_async_db),
+    reader: AsyncSession = Depends(get_async_reader_db)
+) -> AsyncSession:
+    """Async session chosen by HTTP method: GET and HEAD read like
+    get_async_read_db, everything else goes to the writer."""
+    if request.method in READ_METHODS and _use_reader(principal):
+        return reader
+    return writer
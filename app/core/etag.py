@@ -0,0 +1,49 @@
+"""
+Weak ETags for the polled read endpoints.
+
+A tag digests the user's persisted data version with the request URL, so it
+changes with every committed write and is the same in every process. Clients
+send it back in If-None-Match and get 304 Not Modified until it moves.
+"""
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+# Bump when a response body changes shape, to retire tags held by clients
+REPRESENTATION_VERSION = 1
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def weak_etag(request: Request, *parts: Any) -> str:
+    key = "\x1f".join(str(part) for part in (
+        REPRESENTATION_VERSION, request.url.path, request.url.query, *parts))
+    return f'W/"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison against an If-None-Match list (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == opaque for tag in if_none_match.split(","))
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    # no-cache: clients may store the body but revalidate before each use
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """A 304 response when the request already holds `etag`, else None."""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=etag_headers(etag))
+    return None
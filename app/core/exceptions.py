@@ -20,6 +20,14 @@ class AuthExceptions:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    @staticmethod
+    def password_hashing_busy() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-ins in progress, please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+
 
 class UserExceptions:
     """Centralized user-related exceptions."""
@@ -101,3 +109,49 @@ class TransactionExceptions:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid category ID."
         )
+
+    @staticmethod
+    def invalid_bulk_payload() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expected a JSON array of transactions or a CSV file."
+        )
+
+    @staticmethod
+    def bulk_limit_exceeded() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Too many transactions in one request."
+        )
+
+    @staticmethod
+    def invalid_cursor() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor."
+        )
+
+    @staticmethod
+    def invalid_sync_token() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync token; sync again without `since`."
+        )
+
+
+class SummaryExceptions:
+    """Summary-related exceptions."""
+
+    @staticmethod
+    def invalid_date_range() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="from_date must not be after to_date."
+        )
+
+    @staticmethod
+    def too_many_buckets() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Date range has too many buckets; narrow it or use a larger bucket."
+        )
@@ -1,7 +1,7 @@
 import logging
 import os
 from enum import StrEnum
-from typing import Optional
+from typing import Any, Optional
 
 
 class LogLevels(StrEnum):
@@ -49,3 +49,15 @@ class Logger:
     @classmethod
     def configure(cls, log_level: Optional[LogLevels] = None) -> 'Logger':
         return cls(log_level)
+
+    @staticmethod
+    def log_fields(logger: logging.Logger, level: int, message: str, **fields: Any) -> None:
+        """Log `message` followed by key=value pairs.
+
+        The fields are also attached to the record as `fields` for handlers
+        that emit structured output.
+        """
+        if not logger.isEnabledFor(level):
+            return
+        pairs = " ".join(f"{key}={value}" for key, value in fields.items())
+        logger.log(level, f"{message} {pairs}", extra={"fields": fields})
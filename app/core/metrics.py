@@ -0,0 +1,208 @@
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request latency bucket bounds in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+
+OTHER_GROUP = "other"
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts are kept per bucket, not cumulative."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        # The last slot is the +Inf bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class RouteGroupMetrics:
+    def __init__(self):
+        self.latency = Histogram()
+        # Indexed by status // 100 - 1
+        self.responses = [0] * len(STATUS_CLASSES)
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+class RequestMetrics:
+    """Request counters and latency histograms grouped by router prefix.
+
+    Everything is allocated when a group is added, so observing a request
+    only increments existing counters. Observations come from the ASGI
+    middleware on the event loop thread and are not locked.
+    """
+
+    def __init__(self):
+        self._prefixes: List[Tuple[str, str, RouteGroupMetrics]] = []
+        self.groups: Dict[str, RouteGroupMetrics] = {
+            OTHER_GROUP: RouteGroupMetrics()}
+
+    def add_group(self, prefix: str) -> None:
+        prefix = prefix.rstrip("/")
+        name = prefix.lstrip("/")
+        if not name or name in self.groups:
+            return
+        group = RouteGroupMetrics()
+        self.groups[name] = group
+        self._prefixes.append((prefix, prefix + "/", group))
+
+    def group_for(self, path: str) -> RouteGroupMetrics:
+        for prefix, prefix_slash, group in self._prefixes:
+            if path == prefix or path.startswith(prefix_slash):
+                return group
+        return self.groups[OTHER_GROUP]
+
+    def observe(self, path: str, status_code: int, seconds: float,
+                queries: int, db_seconds: float) -> None:
+        group = self.group_for(path)
+        group.latency.observe(seconds)
+        status_index = status_code // 100 - 1
+        if 0 <= status_index < len(STATUS_CLASSES):
+            group.responses[status_index] += 1
+        group.queries += queries
+        group.db_seconds += db_seconds
+
+
+request_metrics = RequestMetrics()
+
+
+def pool_stats(engine: Engine) -> Optional[Dict[str, int]]:
+    """Connection counts of a pooling engine, None when it does not pool."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return None
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow()
+    }
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, float):
+        if value == float("inf"):
+            return "+Inf"
+        return repr(value)
+    return str(value)
+
+
+def _format_labels(labels: Mapping[str, Any]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_format_value(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+class _Exposition:
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def family(self, name: str, metric_type: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+
+    def sample(self, name: str, value: Any, **labels: Any) -> None:
+        self.lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_metrics(metrics: RequestMetrics,
+                   engines: Iterable[Tuple[str, Engine]],
+                   password_hash_stats: Mapping[str, Any]) -> str:
+    """Render the Prometheus text exposition format."""
+    out = _Exposition()
+    groups = sorted(metrics.groups.items())
+
+    out.family("homebudget_http_request_duration_seconds", "histogram",
+               "HTTP request latency by router.")
+    for name, group in groups:
+        for bound, count in group.latency.cumulative():
+            out.sample("homebudget_http_request_duration_seconds_bucket",
+                       count, router=name, le=bound)
+        out.sample("homebudget_http_request_duration_seconds_sum",
+                   group.latency.sum, router=name)
+        out.sample("homebudget_http_request_duration_seconds_count",
+                   group.latency.count, router=name)
+
+    out.family("homebudget_http_responses_total", "counter",
+               "HTTP responses by router and status class.")
+    for name, group in groups:
+        for status_class, count in zip(STATUS_CLASSES, group.responses):
+            out.sample("homebudget_http_responses_total",
+                       count, router=name, status=status_class)
+
+    out.family("homebudget_http_request_queries_total", "counter",
+               "SQL statements run while serving requests.")
+    for name, group in groups:
+        out.sample("homebudget_http_request_queries_total", group.queries, router=name)
+
+    out.family("homebudget_http_request_db_seconds_total", "counter",
+               "Time spent in SQL statements while serving requests.")
+    for name, group in groups:
+        out.sample("homebudget_http_request_db_seconds_total",
+                   group.db_seconds, router=name)
+
+    pools = [(name, stats) for name, stats in
+             ((name, pool_stats(engine)) for name, engine in engines)
+             if stats is not None]
+    for key, help_text in (
+        ("size", "Configured connection pool size."),
+        ("checked_in", "Idle connections in the pool."),
+        ("checked_out", "Connections in use."),
+        ("overflow", "Connections opened beyond the pool size."),
+    ):
+        metric = f"homebudget_db_pool_{key}"
+        out.family(metric, "gauge", help_text)
+        for name, stats in pools:
+            out.sample(metric, stats[key], engine=name)
+
+    for key, metric_type, metric, help_text in (
+        ("workers", "gauge", "homebudget_password_hash_workers",
+         "Password hashing threads."),
+        ("max_queue", "gauge", "homebudget_password_hash_max_queue",
+         "Password hashing jobs allowed to wait for a thread."),
+        ("in_flight", "gauge", "homebudget_password_hash_in_flight",
+         "Password hashing jobs running or queued."),
+        ("completed", "counter", "homebudget_password_hash_completed_total",
+         "Password hashing jobs completed."),
+        ("rejected", "counter", "homebudget_password_hash_rejected_total",
+         "Password hashing jobs refused because the queue was full."),
+        ("hash_seconds_total", "counter", "homebudget_password_hash_seconds_total",
+         "Time spent hashing and verifying passwords."),
+        ("hash_seconds_max", "gauge", "homebudget_password_hash_seconds_max",
+         "Longest single hash or verify."),
+        ("wait_seconds_total", "counter", "homebudget_password_hash_wait_seconds_total",
+         "Time jobs spent queued for a thread."),
+        ("wait_seconds_max", "gauge", "homebudget_password_hash_wait_seconds_max",
+         "Longest queue wait."),
+    ):
+        out.family(metric, metric_type, help_text)
+        out.sample(metric, password_hash_stats[key])
+
+    return out.render()
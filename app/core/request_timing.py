@@ -0,0 +1,128 @@
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.logger import Logger
+from app.core.metrics import RequestMetrics, request_metrics
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+# Set by the middleware for the duration of a request. Threadpool calls and
+# run_sync greenlets inherit the context, so they add to the same object.
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info["query_started_at"].pop()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started_at
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count statements and database time of `engine` per request."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def server_timing_header(total_seconds: float, stats: RequestStats) -> bytes:
+    return (
+        f'total;dur={total_seconds * 1000:.1f}, '
+        f'db;dur={stats.db_seconds * 1000:.1f}, '
+        f'queries;desc="{stats.queries}"'
+    ).encode("latin-1")
+
+
+class RequestTimingMiddleware:
+    """Times each HTTP request and counts the SQL it runs.
+
+    The totals go out in a Server-Timing header, a log line and the
+    per-router metrics; requests running more statements than
+    REQUEST_QUERY_BUDGET are logged as warnings.
+    """
+
+    def __init__(self, app: ASGIApp, query_budget: Optional[int] = None,
+                 metrics: Optional[RequestMetrics] = None):
+        self.app = app
+        self.query_budget = (settings.request_query_budget
+                             if query_budget is None else query_budget)
+        self.metrics = request_metrics if metrics is None else metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing_header(
+                    time.perf_counter() - started, stats)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            seconds = time.perf_counter() - started
+            self.metrics.observe(scope["path"], status_code, seconds,
+                                 stats.queries, stats.db_seconds)
+            self._log(scope, status_code, seconds, stats)
+
+    def _log(self, scope: Scope, status_code: int, seconds: float, stats: RequestStats) -> None:
+        over_budget = 0 < self.query_budget < stats.queries
+        Logger.log_fields(
+            logger,
+            logging.WARNING if over_budget else logging.INFO,
+            "query budget exceeded" if over_budget else "request",
+            method=scope["method"],
+            path=scope["path"],
+            status=status_code,
+            duration_ms=round(seconds * 1000, 1),
+            db_ms=round(stats.db_seconds * 1000, 1),
+            queries=stats.queries,
+            query_budget=self.query_budget
+        )
@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Union, Any
+from typing import Optional, Union, Any
 
 import jwt
 from fastapi import Depends, HTTPException, status
@@ -15,6 +16,16 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
 
+@dataclass(frozen=True)
+class Principal:
+    """Identity carried by a verified access token.
+
+    `id` is None for tokens issued before the `uid` claim was added.
+    """
+    id: Optional[int]
+    email: str
+
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -23,8 +34,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
+def create_access_token(
+    subject: Union[str, Any],
+    expires_delta: timedelta = None,
+    user_id: Optional[int] = None
+) -> str:
     to_encode = {"sub": str(subject)}
+    if user_id is not None:
+        to_encode["uid"] = user_id
 
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -38,17 +55,29 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta = Non
     return encoded_jwt
 
 
-def verify_token(token: str) -> str:
+def _decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, settings.secret_key,
                              algorithms=[settings.jwt_algorithm])
-        email = payload.get("sub")
-        if email is None:
-            raise AuthExceptions.invalid_token()
-        return email
     except InvalidTokenError:
         raise AuthExceptions.invalid_token()
 
+    if payload.get("sub") is None:
+        raise AuthExceptions.invalid_token()
+    return payload
+
+
+def verify_token(token: str) -> str:
+    return _decode_token(token)["sub"]
+
+
+def verify_token_principal(token: str) -> Principal:
+    payload = _decode_token(token)
+    user_id = payload.get("uid")
+    if user_id is not None and not isinstance(user_id, int):
+        raise AuthExceptions.invalid_token()
+    return Principal(id=user_id, email=payload["sub"])
+
 
 def get_current_user_email(token: str = Depends(oauth2_scheme)) -> str:
     return verify_token(token)
@@ -1,32 +1,49 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import and_, update
 
-from app.models.category import Category
+from app.core.cache import recent_writes
+from app.core.category_cache import CachedCategory, global_categories, user_categories
+from app.crud.user import bump_user_data_version
+from app.models.category import Category, CategoryType
+from app.models.transaction import Transaction
 from app.schemas.category import CategoryCreate, CategoryUpdate
 
+# Lookups return cached snapshot rows; writes return ORM rows
+AnyCategory = Union[Category, CachedCategory]
 
-def get_categories_for_user(db: Session, user_id: Optional[int] = None) -> List[Category]:
-    if user_id is None:
-        return db.query(Category).filter(Category.user_id.is_(None)).all()
-    else:
-        return db.query(Category).filter(
-            or_(Category.user_id.is_(None), Category.user_id == user_id)
-        ).all()
 
+# `data_version` is the user's persisted data version when the caller has
+# already read it; the user's snapshot is checked against it
 
-def get_category_by_id(db: Session, category_id: int, user_id: Optional[int] = None) -> Optional[Category]:
-    if user_id is None:
-        return db.query(Category).filter(
-            and_(Category.id == category_id, Category.user_id.is_(None))
-        ).first()
-    else:
-        return db.query(Category).filter(
-            and_(
-                Category.id == category_id,
-                or_(Category.user_id.is_(None), Category.user_id == user_id)
-            )
-        ).first()
+
+def get_categories_for_user(
+    db: Session,
+    user_id: Optional[int] = None,
+    data_version: Optional[int] = None
+) -> List[AnyCategory]:
+    categories: List[AnyCategory] = list(global_categories.get(db).categories)
+    if user_id is not None:
+        categories.extend(user_categories.get(db, user_id, data_version).categories)
+    return categories
+
+
+def get_category_by_id(
+    db: Session,
+    category_id: int,
+    user_id: Optional[int] = None,
+    data_version: Optional[int] = None
+) -> Optional[AnyCategory]:
+    category = global_categories.get(db).by_id.get(category_id)
+    if category is not None or user_id is None:
+        return category
+
+    category = user_categories.get(db, user_id, data_version).by_id.get(category_id)
+    if category is None and _owned_category_ids(db, {category_id}, user_id):
+        # Written without bumping the data version (e.g. by a migration)
+        user_categories.invalidate(user_id)
+        category = user_categories.get(db, user_id, data_version).by_id.get(category_id)
+    return category
 
 
 def create_category(db: Session, category_in: CategoryCreate, user_id: int) -> Category:
@@ -36,7 +53,10 @@ def create_category(db: Session, category_in: CategoryCreate, user_id: int) -> C
         user_id=user_id
     )
     db.add(db_category)
+    bump_user_data_version(db, user_id)
     db.commit()
+    recent_writes.record(user_id)
+    user_categories.invalidate(user_id)
     db.refresh(db_category)
     return db_category
 
@@ -53,7 +73,20 @@ def update_category(db: Session, category_id: int, category_update: CategoryUpda
     for field, value in update_data.items():
         setattr(db_category, field, value)
 
+    version = bump_user_data_version(db, user_id)
+    if update_data:
+        # Transactions carry the category name and type, so the delta sync
+        # has to resend them; last_changed stays, the transaction did not
+        db.execute(
+            update(Transaction)
+            .where(Transaction.user_id == user_id,
+                   Transaction.category_id == category_id)
+            .values(change_version=version, last_changed=Transaction.last_changed)
+            .execution_options(synchronize_session=False)
+        )
     db.commit()
+    recent_writes.record(user_id)
+    user_categories.invalidate(user_id)
     db.refresh(db_category)
     return db_category
 
@@ -67,31 +100,52 @@ def delete_category(db: Session, category_id: int, user_id: int) -> bool:
         return False
 
     db.delete(db_category)
+    bump_user_data_version(db, user_id)
     db.commit()
+    recent_writes.record(user_id)
+    user_categories.invalidate(user_id)
     return True
 
 
-def get_categories_by_type(db: Session, category_type: str, user_id: Optional[int] = None) -> List[Category]:
-    base_query = db.query(Category).filter(
-        Category.category_type == category_type)
-
-    if user_id is None:
-        return base_query.filter(Category.user_id.is_(None)).all()
-    else:
-        return base_query.filter(
-            or_(Category.user_id.is_(None), Category.user_id == user_id)
-        ).all()
-
-
-def get_category_by_name(db: Session, name: str, user_id: Optional[int] = None) -> Optional[Category]:
-    if user_id is None:
-        return db.query(Category).filter(
-            and_(Category.name == name, Category.user_id.is_(None))
-        ).first()
-    else:
-        return db.query(Category).filter(
-            and_(
-                Category.name == name,
-                or_(Category.user_id.is_(None), Category.user_id == user_id)
-            )
-        ).first()
+def get_categories_by_type(
+    db: Session,
+    category_type: str,
+    user_id: Optional[int] = None,
+    data_version: Optional[int] = None
+) -> List[AnyCategory]:
+    category_type = CategoryType(category_type)
+    categories: List[AnyCategory] = list(
+        global_categories.get(db).by_type.get(category_type, ()))
+    if user_id is not None:
+        categories.extend(
+            user_categories.get(db, user_id, data_version).by_type.get(category_type, ()))
+    return categories
+
+
+def get_category_by_name(db: Session, name: str, user_id: Optional[int] = None) -> Optional[AnyCategory]:
+    category = global_categories.get(db).by_name.get(name)
+    if category is not None or user_id is None:
+        return category
+    return user_categories.get(db, user_id).by_name.get(name)
+
+
+def _owned_category_ids(db: Session, category_ids: Set[int], user_id: int) -> Set[int]:
+    rows = db.query(Category.id).filter(
+        and_(Category.id.in_(category_ids), Category.user_id == user_id)
+    ).all()
+    return {row.id for row in rows}
+
+
+def get_accessible_category_ids(db: Session, category_ids: Iterable[int], user_id: int) -> Set[int]:
+    category_ids = set(category_ids)
+    accessible = category_ids & (global_categories.get(db).by_id.keys()
+                                 | user_categories.get(db, user_id).by_id.keys())
+    unknown = category_ids - accessible
+    if not unknown:
+        return accessible
+
+    # Unknown ids are usually invalid; check them in case the snapshot is stale
+    owned = _owned_category_ids(db, unknown, user_id)
+    if owned:
+        user_categories.invalidate(user_id)
+    return accessible | owned
@@ -0,0 +1,198 @@
+from typing import Iterable, Optional, Tuple
+from decimal import Decimal
+from datetime import date
+
+from sqlalchemy import and_, case, delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.daily_category_total import DailyCategoryTotal
+from app.models.transaction import Transaction
+
+_UPSERT_DIALECTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _cell_filter(user_id: int, category_id: int, day: date):
+    return and_(
+        DailyCategoryTotal.user_id == user_id,
+        DailyCategoryTotal.category_id == category_id,
+        DailyCategoryTotal.date == day
+    )
+
+
+def add_to_daily_total(
+    db: Session,
+    user_id: int,
+    category_id: int,
+    day: date,
+    amount: Decimal,
+    count: int = 1,
+    max_amount: Optional[Decimal] = None
+) -> None:
+    """Add amount(s) to a rollup cell, creating the cell when missing."""
+    if max_amount is None:
+        max_amount = amount
+
+    values = {
+        "user_id": user_id,
+        "category_id": category_id,
+        "date": day,
+        "total_amount": amount,
+        "transaction_count": count,
+        "max_amount": max_amount
+    }
+
+    dialect_insert = _UPSERT_DIALECTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(DailyCategoryTotal).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                DailyCategoryTotal.user_id,
+                DailyCategoryTotal.category_id,
+                DailyCategoryTotal.date
+            ],
+            set_={
+                "total_amount": DailyCategoryTotal.total_amount + stmt.excluded.total_amount,
+                "transaction_count": DailyCategoryTotal.transaction_count + stmt.excluded.transaction_count,
+                "max_amount": case(
+                    (DailyCategoryTotal.max_amount < stmt.excluded.max_amount,
+                     stmt.excluded.max_amount),
+                    else_=DailyCategoryTotal.max_amount
+                )
+            }
+        )
+        db.execute(stmt)
+        return
+
+    result = db.execute(
+        update(DailyCategoryTotal).where(
+            _cell_filter(user_id, category_id, day)
+        ).values(
+            total_amount=DailyCategoryTotal.total_amount + amount,
+            transaction_count=DailyCategoryTotal.transaction_count + count,
+            max_amount=case(
+                (DailyCategoryTotal.max_amount < max_amount, max_amount),
+                else_=DailyCategoryTotal.max_amount
+            )
+        )
+    )
+    if result.rowcount == 0:
+        db.execute(insert(DailyCategoryTotal).values(**values))
+
+
+def _cell_max_amount(user_id: int, category_id: int, day: date):
+    return select(
+        func.coalesce(func.max(Transaction.amount), 0)
+    ).where(
+        and_(
+            Transaction.user_id == user_id,
+            Transaction.category_id == category_id,
+            Transaction.date == day
+        )
+    ).scalar_subquery()
+
+
+def replace_in_daily_total(
+    db: Session,
+    user_id: int,
+    category_id: int,
+    day: date,
+    old_amount: Decimal,
+    new_amount: Decimal
+) -> None:
+    """Swap one amount for another within a rollup cell, in one statement.
+
+    Must run after the transaction change has been flushed, because the
+    cell maximum is recomputed when the old amount was the maximum.
+    """
+    db.execute(
+        update(DailyCategoryTotal).where(
+            _cell_filter(user_id, category_id, day)
+        ).values(
+            total_amount=DailyCategoryTotal.total_amount - old_amount + new_amount,
+            max_amount=case(
+                (DailyCategoryTotal.max_amount <= new_amount, new_amount),
+                (DailyCategoryTotal.max_amount <= old_amount,
+                 _cell_max_amount(user_id, category_id, day)),
+                else_=DailyCategoryTotal.max_amount
+            )
+        )
+    )
+
+
+def remove_from_daily_total(
+    db: Session,
+    user_id: int,
+    category_id: int,
+    day: date,
+    amount: Decimal
+) -> None:
+    """Remove one amount from a rollup cell.
+
+    Must run after the transaction change has been flushed, because the
+    cell maximum is recomputed from the remaining transactions when the
+    removed amount was the maximum.
+    """
+    remaining_max = _cell_max_amount(user_id, category_id, day)
+
+    remaining = db.execute(
+        update(DailyCategoryTotal).where(
+            _cell_filter(user_id, category_id, day)
+        ).values(
+            total_amount=DailyCategoryTotal.total_amount - amount,
+            transaction_count=DailyCategoryTotal.transaction_count - 1,
+            max_amount=case(
+                (DailyCategoryTotal.max_amount <= amount, remaining_max),
+                else_=DailyCategoryTotal.max_amount
+            )
+        ).returning(DailyCategoryTotal.transaction_count)
+    ).scalar_one_or_none()
+    # Only an emptied cell needs the second statement
+    if remaining is not None and remaining <= 0:
+        db.execute(
+            delete(DailyCategoryTotal).where(_cell_filter(user_id, category_id, day))
+        )
+
+
+def rebuild_daily_totals(
+    db: Session,
+    user_id: int,
+    cells: Iterable[Tuple[int, date]],
+    chunk_size: int = 500
+) -> None:
+    """Recompute rollup cells from the transactions they cover.
+
+    Used after set-based writes, where the per-row deltas are unknown.
+    Must run after those writes have been flushed.
+    """
+    cells = list(cells)
+    for start in range(0, len(cells), chunk_size):
+        chunk = cells[start:start + chunk_size]
+        db.execute(
+            delete(DailyCategoryTotal).where(
+                DailyCategoryTotal.user_id == user_id,
+                tuple_(DailyCategoryTotal.category_id, DailyCategoryTotal.date).in_(chunk)
+            )
+        )
+        db.execute(
+            insert(DailyCategoryTotal).from_select(
+                ["user_id", "category_id", "date",
+                 "total_amount", "transaction_count", "max_amount"],
+                select(
+                    Transaction.user_id,
+                    Transaction.category_id,
+                    Transaction.date,
+                    func.sum(Transaction.amount),
+                    func.count(),
+                    func.max(Transaction.amount)
+                ).where(
+                    Transaction.user_id == user_id,
+                    tuple_(Transaction.category_id, Transaction.date).in_(chunk)
+                ).group_by(
+                    Transaction.user_id, Transaction.category_id, Transaction.date
+                )
+            )
+        )
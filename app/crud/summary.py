@@ -0,0 +1,145 @@
+from typing import Dict, List, Optional
+from datetime import date
+
+from sqlalchemy import and_, desc, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.models.daily_category_total import DailyCategoryTotal
+from app.models.transaction import Transaction
+from app.models.category import Category, CategoryType
+
+
+def _summary_filters(
+    user_id: int,
+    category_id: Optional[int] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> list:
+    filters = [DailyCategoryTotal.user_id == user_id]
+
+    if category_id:
+        filters.append(DailyCategoryTotal.category_id == category_id)
+
+    if from_date:
+        filters.append(DailyCategoryTotal.date >= from_date)
+
+    if to_date:
+        filters.append(DailyCategoryTotal.date <= to_date)
+
+    return filters
+
+
+def get_category_totals(
+    db: Session,
+    user_id: int,
+    category_id: Optional[int] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> List[Row]:
+    """Per category name/type totals with the date span they cover."""
+    filters = _summary_filters(user_id, category_id, from_date, to_date)
+
+    query = select(
+        Category.name.label("category_name"),
+        Category.category_type.label("category_type"),
+        func.sum(DailyCategoryTotal.total_amount).label("total"),
+        func.sum(DailyCategoryTotal.transaction_count).label("count"),
+        func.min(DailyCategoryTotal.date).label("first_date"),
+        func.max(DailyCategoryTotal.date).label("last_date")
+    ).join(
+        Category, DailyCategoryTotal.category_id == Category.id
+    ).where(
+        and_(*filters)
+    ).group_by(
+        Category.name, Category.category_type
+    )
+
+    return db.execute(query).all()
+
+
+def get_daily_type_totals(
+    db: Session,
+    user_id: int,
+    category_id: Optional[int] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> List[Row]:
+    """Per day and category type totals, oldest day first."""
+    filters = _summary_filters(user_id, category_id, from_date, to_date)
+
+    query = select(
+        DailyCategoryTotal.date,
+        Category.category_type.label("category_type"),
+        func.sum(DailyCategoryTotal.total_amount).label("total")
+    ).join(
+        Category, DailyCategoryTotal.category_id == Category.id
+    ).where(
+        and_(*filters)
+    ).group_by(
+        DailyCategoryTotal.date, Category.category_type
+    ).order_by(
+        DailyCategoryTotal.date
+    )
+
+    return db.execute(query).all()
+
+
+def get_largest_transactions(
+    db: Session,
+    user_id: int,
+    category_id: Optional[int] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> Dict[CategoryType, Row]:
+    """Largest transaction per category type, newest first on ties.
+
+    The rollup locates the day/category cell holding each maximum, so only
+    the transactions of at most two cells are read.
+    """
+    filters = _summary_filters(user_id, category_id, from_date, to_date)
+
+    rank = func.row_number().over(
+        partition_by=Category.category_type,
+        order_by=(desc(DailyCategoryTotal.max_amount),
+                  desc(DailyCategoryTotal.date),
+                  desc(DailyCategoryTotal.category_id))
+    ).label("rank")
+
+    top_cells = select(
+        DailyCategoryTotal.category_id,
+        DailyCategoryTotal.date,
+        DailyCategoryTotal.max_amount,
+        Category.name.label("category_name"),
+        Category.category_type.label("category_type"),
+        rank
+    ).join(
+        Category, DailyCategoryTotal.category_id == Category.id
+    ).where(
+        and_(*filters)
+    ).subquery()
+
+    query = select(
+        Transaction.id,
+        Transaction.description,
+        Transaction.amount,
+        Transaction.date,
+        top_cells.c.category_name,
+        top_cells.c.category_type
+    ).join(
+        top_cells,
+        and_(
+            Transaction.category_id == top_cells.c.category_id,
+            Transaction.date == top_cells.c.date,
+            Transaction.amount == top_cells.c.max_amount
+        )
+    ).where(
+        and_(Transaction.user_id == user_id, top_cells.c.rank == 1)
+    ).order_by(
+        desc(Transaction.id)
+    )
+
+    largest = {}
+    for row in db.execute(query):
+        largest.setdefault(row.category_type, row)
+    return largest
@@ -1,21 +1,97 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, desc, asc
-from decimal import Decimal
-from datetime import date
-
+import base64
+import binascii
+import json
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query, Session, joinedload
+from sqlalchemy import (
+    String, and_, delete, desc, asc, insert, literal, literal_column, select, text,
+    tuple_, union_all, update
+)
+from decimal import Decimal, InvalidOperation
+from datetime import date, datetime
+
+from app.core.cache import recent_writes
+from app.core.category_cache import user_categories
+from app.db.fts import TRANSACTIONS_FTS_TABLE, build_fts_match
+from app.crud.category import AnyCategory, get_category_by_id
+from app.crud.daily_category_total import (
+    add_to_daily_total, rebuild_daily_totals, remove_from_daily_total, replace_in_daily_total
+)
+from app.crud.user import bump_user_data_version
 from app.models.transaction import Transaction
+from app.models.transaction_tombstone import TransactionTombstone
 from app.models.category import Category, CategoryType
 from app.schemas.transaction import TransactionCreate, TransactionUpdate
 
 
-def _validate_category_access(db: Session, category_id: int, user_id: int) -> Optional[Category]:
-    return db.query(Category).filter(
-        and_(
-            Category.id == category_id,
-            (Category.user_id == user_id) | (Category.user_id.is_(None))
-        )
-    ).first()
+_CURSOR_VALUE_PARSERS = {
+    "date": date.fromisoformat,
+    "amount": Decimal,
+    "description": str,
+    "last_changed": datetime.fromisoformat,
+}
+
+
+def encode_cursor(transaction: Transaction, sort_by: str) -> str:
+    """Opaque cursor pointing just past transaction in the sort_by order."""
+    value = getattr(transaction, sort_by)
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+
+    # UTF-8 rather than \u escapes keeps non-ASCII descriptions short
+    payload = json.dumps([sort_by, value, transaction.id],
+                         ensure_ascii=False, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str) -> Optional[Tuple[Any, int]]:
+    """Return (sort value, id) of a cursor, or None if it is malformed or
+    was issued for a different sort field."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort_by, value, transaction_id = json.loads(
+            base64.urlsafe_b64decode(padded))
+        if cursor_sort_by != sort_by or not isinstance(transaction_id, int):
+            return None
+        return _CURSOR_VALUE_PARSERS[sort_by](value), transaction_id
+    except (binascii.Error, ValueError, TypeError, KeyError, InvalidOperation):
+        return None
+
+
+def _description_search_filter(db: Session, description_query: str):
+    """Word prefix search through the FTS5 index on SQLite, LIKE elsewhere."""
+    fts_match = build_fts_match(description_query)
+    if db.get_bind().dialect.name != "sqlite" or fts_match is None:
+        return Transaction.description.ilike(f"%{description_query}%")
+
+    matching_ids = select(literal_column("rowid")).select_from(
+        text(TRANSACTIONS_FTS_TABLE)
+    ).where(
+        text(f"{TRANSACTIONS_FTS_TABLE} MATCH :fts_match").bindparams(
+            fts_match=fts_match)
+    )
+    return Transaction.id.in_(matching_ids)
+
+
+def _validate_category_access(
+    db: Session,
+    category_id: int,
+    user_id: int,
+    data_version: Optional[int] = None
+) -> Optional[AnyCategory]:
+    return get_category_by_id(db, category_id, user_id, data_version)
+
+
+def _commit_write(db: Session, user_id: int, version: int) -> None:
+    """Commit a transaction write made at data version `version`."""
+    db.commit()
+    recent_writes.record(user_id)
+    # The write left the categories alone, so a snapshot of the version
+    # before it is still current
+    user_categories.advance(user_id, version - 1, version)
 
 
 def _get_transaction_with_category(db: Session, transaction_id: int, user_id: int) -> Optional[Transaction]:
@@ -33,78 +109,410 @@ def get_transaction_by_id(db: Session, transaction_id: int, user_id: int) -> Opt
     return _get_transaction_with_category(db, transaction_id, user_id)
 
 
-def get_transactions_for_user(
+def _transaction_filters(
     db: Session,
     user_id: int,
-    offset: int = 0,
-    limit: Optional[int] = 100,
     category_id: Optional[int] = None,
     min_amount: Optional[Decimal] = None,
     max_amount: Optional[Decimal] = None,
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
     category_type: Optional[CategoryType] = None,
-    description_query: Optional[str] = None,
-    sort_by: str = "date",
-    order: str = "desc"
-) -> List[Transaction]:
-
-    query = db.query(Transaction).options(
-        joinedload(Transaction.category)
-    ).filter(Transaction.user_id == user_id)
+    description_query: Optional[str] = None
+) -> list:
+    """Filter conditions; category_type requires Category to be joined."""
+    filters = [Transaction.user_id == user_id]
 
     if category_id:
-        query = query.filter(Transaction.category_id == category_id)
+        filters.append(Transaction.category_id == category_id)
 
     if min_amount is not None:
-        query = query.filter(Transaction.amount >= min_amount)
+        filters.append(Transaction.amount >= min_amount)
 
     if max_amount is not None:
-        query = query.filter(Transaction.amount <= max_amount)
+        filters.append(Transaction.amount <= max_amount)
 
     if from_date:
-        query = query.filter(Transaction.date >= from_date)
+        filters.append(Transaction.date >= from_date)
 
     if to_date:
-        query = query.filter(Transaction.date <= to_date)
+        filters.append(Transaction.date <= to_date)
 
     if category_type:
-        query = query.join(Category).filter(
-            Category.category_type == category_type)
+        filters.append(Category.category_type == category_type)
 
     if description_query:
-        query = query.filter(
-            Transaction.description.ilike(f"%{description_query}%"))
+        filters.append(_description_search_filter(db, description_query))
 
+    return filters
+
+
+def _sort_order(sort_by: str, order: str) -> tuple:
     sort_column = getattr(Transaction, sort_by, Transaction.date)
     if order.lower() == "asc":
-        query = query.order_by(asc(sort_column))
+        return asc(sort_column), asc(Transaction.id)
+    return desc(sort_column), desc(Transaction.id)
+
+
+# Columns of a list row, labelled and ordered like TransactionResponse
+TRANSACTION_ROW_COLUMNS = (
+    Transaction.category_id,
+    Transaction.description,
+    Transaction.amount,
+    Transaction.date,
+    Transaction.id,
+    Transaction.user_id,
+    Transaction.last_changed,
+    Category.name.label("category_name"),
+    Category.category_type.label("category_type"),
+)
+
+# Transaction columns of TRANSACTION_ROW_COLUMNS, returned by single-row writes
+_WRITTEN_COLUMNS = TRANSACTION_ROW_COLUMNS[:7]
+
+
+class TransactionRecord(NamedTuple):
+    """A written transaction, shaped like a list row and TransactionResponse.
+
+    Built from the RETURNING row and the category checked before the
+    write, so nothing is read back after the commit.
+    """
+    category_id: int
+    description: str
+    amount: Decimal
+    date: date
+    id: int
+    user_id: int
+    last_changed: datetime
+    category_name: str
+    category_type: str
+
+
+def _record(row: Row, category: AnyCategory) -> TransactionRecord:
+    return TransactionRecord(*row, category_name=category.name,
+                             category_type=category.category_type.value)
+
+
+def _cursor_anchor(db: Session, sort_column, value: Any):
+    """Bind a cursor's sort value in the representation stored for the column."""
+    if (sort_column is Transaction.last_changed and not value.microsecond
+            and db.get_bind().dialect.name == "sqlite"):
+        # CURRENT_TIMESTAMP stores whole seconds as text, without the
+        # fraction the DateTime type would bind
+        return literal(value.strftime("%Y-%m-%d %H:%M:%S"), String())
+    return literal(value, sort_column.type)
+
+
+def build_transactions_query(
+    db: Session,
+    user_id: int,
+    offset: int = 0,
+    limit: Optional[int] = 100,
+    category_id: Optional[int] = None,
+    min_amount: Optional[Decimal] = None,
+    max_amount: Optional[Decimal] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    category_type: Optional[CategoryType] = None,
+    description_query: Optional[str] = None,
+    sort_by: str = "date",
+    order: str = "desc",
+    after: Optional[Tuple[Any, int]] = None,
+    as_rows: bool = False
+) -> Query:
+    """Filtered, sorted page of a user's transactions.
+
+    With `as_rows` the query selects TRANSACTION_ROW_COLUMNS instead of
+    Transaction entities with their category.
+    """
+    if as_rows:
+        query = db.query(*TRANSACTION_ROW_COLUMNS).join(
+            Category, Transaction.category_id == Category.id)
     else:
-        query = query.order_by(desc(sort_column))
+        query = db.query(Transaction).options(
+            joinedload(Transaction.category)
+        )
+        if category_type:
+            query = query.join(Category)
+
+    query = query.filter(*_transaction_filters(
+        db=db,
+        user_id=user_id,
+        category_id=category_id,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        from_date=from_date,
+        to_date=to_date,
+        category_type=category_type,
+        description_query=description_query
+    ))
 
-    query = query.offset(offset)
+    sort_column = getattr(Transaction, sort_by, Transaction.date)
+    ascending = order.lower() == "asc"
+
+    if after is not None:
+        # Seek past the cursor position on (sort column, id). Only the
+        # encoded value is used: re-reading the row would move the page
+        # boundary when the row is edited between pages.
+        after_value, after_id = after
+        anchor = _cursor_anchor(db, sort_column, after_value)
+        if ascending:
+            query = query.filter(
+                tuple_(sort_column, Transaction.id) > tuple_(anchor, after_id))
+        else:
+            query = query.filter(
+                tuple_(sort_column, Transaction.id) < tuple_(anchor, after_id))
+
+    query = query.order_by(*_sort_order(sort_by, order))
+
+    if after is None:
+        query = query.offset(offset)
     if limit is not None:
         query = query.limit(limit)
 
-    return query.all()
+    return query
 
 
-def create_transaction(db: Session, transaction: TransactionCreate, user_id: int) -> Optional[Transaction]:
-    category = _validate_category_access(db, transaction.category_id, user_id)
-    if not category:
+def get_transactions_for_user(
+    db: Session,
+    user_id: int,
+    offset: int = 0,
+    limit: Optional[int] = 100,
+    category_id: Optional[int] = None,
+    min_amount: Optional[Decimal] = None,
+    max_amount: Optional[Decimal] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    category_type: Optional[CategoryType] = None,
+    description_query: Optional[str] = None,
+    sort_by: str = "date",
+    order: str = "desc",
+    after: Optional[Tuple[Any, int]] = None
+) -> List[Transaction]:
+    return build_transactions_query(
+        db=db,
+        user_id=user_id,
+        offset=offset,
+        limit=limit,
+        category_id=category_id,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        from_date=from_date,
+        to_date=to_date,
+        category_type=category_type,
+        description_query=description_query,
+        sort_by=sort_by,
+        order=order,
+        after=after
+    ).all()
+
+
+def get_transaction_rows_for_user(db: Session, user_id: int, **filters: Any) -> List[Row]:
+    """Like get_transactions_for_user, as plain column rows (no ORM objects)."""
+    return build_transactions_query(db=db, user_id=user_id, as_rows=True, **filters).all()
+
+
+def encode_sync_token(user_id: int, version: int) -> str:
+    """Opaque watermark: the user's data version a sync has caught up to."""
+    payload = json.dumps(["sync", user_id, version]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_sync_token(token: str, user_id: int) -> Optional[int]:
+    """Return the version of a sync token, or None if it is malformed or
+    was issued to another user."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        kind, token_user_id, version = json.loads(base64.urlsafe_b64decode(padded))
+        if kind != "sync" or token_user_id != user_id or not isinstance(version, int):
+            return None
+        return version
+    except (binascii.Error, ValueError, TypeError):
         return None
 
-    db_transaction = Transaction(
-        user_id=user_id,
-        category_id=transaction.category_id,
-        description=transaction.description,
-        amount=transaction.amount,
-        date=transaction.date
-    )
-    db.add(db_transaction)
-    db.commit()
 
-    return _get_transaction_with_category(db, db_transaction.id, user_id)
+def _version_window(model, user_id: int, since: Optional[int], until: int) -> list:
+    conditions = [model.user_id == user_id, model.change_version <= until]
+    if since is not None:
+        conditions.append(model.change_version > since)
+    return conditions
+
+
+def get_transaction_changes(
+    db: Session,
+    user_id: int,
+    since: Optional[int],
+    until: int,
+    limit: int
+) -> Tuple[int, List[Row], List[int]]:
+    """Transactions written and ids deleted after version `since`, up to `until`.
+
+    Returns (version covered, changed rows, deleted ids). A page ends on a
+    version boundary so the rows of one write are never split; it holds at
+    most `limit` changes unless a single write has more. Without `since`
+    (a full sync) deletions are not reported.
+    """
+    versions = select(Transaction.change_version.label("version")).where(
+        *_version_window(Transaction, user_id, since, until))
+    if since is not None:
+        versions = union_all(versions, select(
+            TransactionTombstone.change_version.label("version")
+        ).where(*_version_window(TransactionTombstone, user_id, since, until)))
+    versions = versions.subquery()
+    head = db.execute(
+        select(versions.c.version).order_by(versions.c.version).limit(limit + 1)
+    ).scalars().all()
+
+    covered = until
+    if len(head) > limit:
+        next_version = head[limit]
+        covered = next_version - 1 if head[0] < next_version else next_version
+
+    rows = db.query(*TRANSACTION_ROW_COLUMNS).join(
+        Category, Transaction.category_id == Category.id
+    ).filter(
+        *_version_window(Transaction, user_id, since, covered)
+    ).order_by(Transaction.change_version, Transaction.id).all()
+
+    deleted = []
+    if since is not None:
+        deleted = db.execute(
+            select(TransactionTombstone.transaction_id).where(
+                *_version_window(TransactionTombstone, user_id, since, covered)
+            ).order_by(TransactionTombstone.change_version, TransactionTombstone.id)
+        ).scalars().all()
+        # An id can be deleted twice when SQLite reuses the highest rowid
+        deleted = list(dict.fromkeys(deleted))
+
+    return covered, rows, deleted
+
+
+def iter_transactions_for_export(
+    db: Session,
+    user_id: int,
+    category_id: Optional[int] = None,
+    min_amount: Optional[Decimal] = None,
+    max_amount: Optional[Decimal] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    category_type: Optional[CategoryType] = None,
+    description_query: Optional[str] = None,
+    sort_by: str = "date",
+    order: str = "desc",
+    batch_size: int = 1000
+) -> Iterator[Row]:
+    """Stream plain transaction rows in batches without building ORM objects."""
+    query = select(
+        Transaction.id,
+        Transaction.date,
+        Transaction.description,
+        Transaction.amount,
+        Transaction.category_id,
+        Category.name.label("category_name"),
+        Category.category_type.label("category_type"),
+        Transaction.last_changed
+    ).join(
+        Category, Transaction.category_id == Category.id
+    ).where(
+        *_transaction_filters(
+            db=db,
+            user_id=user_id,
+            category_id=category_id,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            from_date=from_date,
+            to_date=to_date,
+            category_type=category_type,
+            description_query=description_query
+        )
+    ).order_by(
+        *_sort_order(sort_by, order)
+    ).execution_options(yield_per=batch_size)
+
+    yield from db.execute(query)
+
+
+def create_transaction(db: Session, transaction: TransactionCreate, user_id: int) -> Optional[TransactionRecord]:
+    # Bumped first: while the user row is locked, version - 1 is the
+    # current version of the categories, so no read is needed to check it
+    version = bump_user_data_version(db, user_id)
+    category = _validate_category_access(db, transaction.category_id, user_id, version - 1)
+    if not category:
+        db.rollback()
+        return None
+
+    values = {
+        "user_id": user_id,
+        "category_id": transaction.category_id,
+        "description": transaction.description,
+        "amount": transaction.amount,
+        "change_version": version
+    }
+    if transaction.date is not None:
+        # Left out otherwise, so the column default applies
+        values["date"] = transaction.date
+    row = db.execute(
+        insert(Transaction).values(**values).returning(*_WRITTEN_COLUMNS)
+    ).one()
+    add_to_daily_total(db, user_id, row.category_id, row.date, row.amount)
+    _commit_write(db, user_id, version)
+
+    return _record(row, category)
+
+
+def bulk_create_transactions(
+    db: Session,
+    transactions: Sequence[TransactionCreate],
+    user_id: int,
+    chunk_size: int = 1000
+) -> int:
+    """Insert transactions whose categories were already validated.
+
+    Rows are written with one multi-row INSERT and one rollup upsert per
+    day/category cell, committing once per chunk.
+    """
+    today = date.today()
+    created = 0
+
+    try:
+        for start in range(0, len(transactions), chunk_size):
+            version = bump_user_data_version(db, user_id)
+            values = [
+                {
+                    "user_id": user_id,
+                    "category_id": transaction.category_id,
+                    "description": transaction.description,
+                    "amount": transaction.amount,
+                    "date": transaction.date or today,
+                    "change_version": version
+                }
+                for transaction in transactions[start:start + chunk_size]
+            ]
+            db.execute(insert(Transaction), values)
+
+            cells = {}
+            for row in values:
+                key = (row["category_id"], row["date"])
+                total, count, max_amount = cells.get(
+                    key, (Decimal("0"), 0, row["amount"]))
+                cells[key] = (total + row["amount"], count + 1,
+                              max(max_amount, row["amount"]))
+            for (category_id, day), (total, count, max_amount) in cells.items():
+                add_to_daily_total(db, user_id, category_id, day, total,
+                                   count=count, max_amount=max_amount)
+
+            db.commit()
+            user_categories.advance(user_id, version - 1, version)
+            created += len(values)
+    finally:
+        if created:
+            recent_writes.record(user_id)
+
+    return created
+
+
+def _owned_transaction(transaction_id: int, user_id: int) -> tuple:
+    return (Transaction.id == transaction_id, Transaction.user_id == user_id)
 
 
 def update_transaction(
@@ -112,38 +520,164 @@ def update_transaction(
     transaction_id: int,
     transaction_update: TransactionUpdate,
     user_id: int
-) -> Optional[Transaction]:
-    db_transaction = _get_transaction_with_category(
-        db, transaction_id, user_id)
-    if not db_transaction:
+) -> Optional[TransactionRecord]:
+    # The previous cell is needed for the rollup; RETURNING only has new values
+    previous_cell = db.execute(
+        select(Transaction.category_id, Transaction.date, Transaction.amount)
+        .where(*_owned_transaction(transaction_id, user_id))
+    ).first()
+    if previous_cell is None:
         return None
 
     update_data = transaction_update.model_dump(exclude_unset=True)
 
-    if "category_id" in update_data:
-        category = _validate_category_access(
-            db, update_data["category_id"], user_id)
-        if not category:
-            return None
+    version = bump_user_data_version(db, user_id)
+    # Served from the category caches, as in create_transaction; also names
+    # the category in the result
+    category = _validate_category_access(
+        db, update_data.get("category_id", previous_cell.category_id), user_id, version - 1)
+    if not category:
+        db.rollback()
+        return None
 
-    for field, value in update_data.items():
-        setattr(db_transaction, field, value)
+    row = db.execute(
+        update(Transaction)
+        .where(*_owned_transaction(transaction_id, user_id))
+        .values(**update_data, change_version=version)
+        .returning(*_WRITTEN_COLUMNS)
+    ).one()
 
-    db.commit()
+    if (row.category_id, row.date) != (previous_cell.category_id, previous_cell.date):
+        remove_from_daily_total(db, user_id, *previous_cell)
+        add_to_daily_total(db, user_id, row.category_id, row.date, row.amount)
+    elif row.amount != previous_cell.amount:
+        replace_in_daily_total(db, user_id, row.category_id, row.date,
+                               previous_cell.amount, row.amount)
 
-    if "category_id" in update_data:
-        return _get_transaction_with_category(db, transaction_id, user_id)
-    else:
-        db.refresh(db_transaction)
-        return db_transaction
+    _commit_write(db, user_id, version)
+    return _record(row, category)
 
 
 def delete_transaction(db: Session, transaction_id: int, user_id: int) -> bool:
-    db_transaction = _get_transaction_with_category(
-        db, transaction_id, user_id)
-    if not db_transaction:
+    deleted = db.execute(
+        delete(Transaction)
+        .where(*_owned_transaction(transaction_id, user_id))
+        .returning(Transaction.category_id, Transaction.date, Transaction.amount)
+    ).first()
+    if deleted is None:
+        db.rollback()
         return False
 
-    db.delete(db_transaction)
-    db.commit()
+    version = bump_user_data_version(db, user_id)
+    db.execute(insert(TransactionTombstone).values(
+        user_id=user_id, transaction_id=transaction_id, change_version=version))
+    remove_from_daily_total(db, user_id, *deleted)
+    _commit_write(db, user_id, version)
     return True
+
+
+# Fields whose change moves a transaction to another rollup cell
+_ROLLUP_FIELDS = {"category_id", "date", "amount"}
+
+
+def _selection_filters(
+    db: Session,
+    user_id: int,
+    ids: Optional[Sequence[int]] = None,
+    filters: Optional[dict] = None
+) -> list:
+    """WHERE conditions for set-based writes, which cannot join Category."""
+    if ids is not None:
+        return [Transaction.user_id == user_id, Transaction.id.in_(ids)]
+
+    filters = dict(filters or {})
+    category_type = filters.pop("category_type", None)
+    conditions = _transaction_filters(db=db, user_id=user_id, **filters)
+    if category_type:
+        conditions.append(Transaction.category_id.in_(
+            select(Category.id).where(Category.category_type == category_type)))
+    return conditions
+
+
+def _selected_cells(db: Session, conditions: list) -> set:
+    return set(db.execute(
+        select(Transaction.category_id, Transaction.date).where(*conditions).distinct()
+    ).all())
+
+
+def bulk_update_transactions(
+    db: Session,
+    user_id: int,
+    changes: dict,
+    ids: Optional[Sequence[int]] = None,
+    filters: Optional[dict] = None
+) -> Optional[int]:
+    """Apply `changes` to the selected transactions with one UPDATE.
+
+    Selects by id list or by list filters. Returns the number of updated
+    transactions, or None when the new category is not accessible.
+    """
+    # Bumped first: the user row lock orders this write against others
+    version = bump_user_data_version(db, user_id)
+    if "category_id" in changes and not _validate_category_access(
+            db, changes["category_id"], user_id, version - 1):
+        db.rollback()
+        return None
+
+    conditions = _selection_filters(db, user_id, ids, filters)
+
+    moves_cells = bool(_ROLLUP_FIELDS & changes.keys())
+    cells = _selected_cells(db, conditions) if moves_cells else set()
+
+    updated = db.execute(
+        update(Transaction)
+        .where(*conditions)
+        .values(**changes, change_version=version)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not updated:
+        db.rollback()
+        return 0
+
+    if moves_cells:
+        cells |= _selected_cells(db, [Transaction.user_id == user_id,
+                                      Transaction.change_version == version])
+        rebuild_daily_totals(db, user_id, cells)
+
+    _commit_write(db, user_id, version)
+    return updated
+
+
+def bulk_delete_transactions(
+    db: Session,
+    user_id: int,
+    ids: Optional[Sequence[int]] = None,
+    filters: Optional[dict] = None
+) -> int:
+    """Delete the selected transactions with one DELETE, leaving tombstones.
+
+    Selects by id list or by list filters. Returns the number deleted.
+    """
+    version = bump_user_data_version(db, user_id)
+    conditions = _selection_filters(db, user_id, ids, filters)
+
+    cells = _selected_cells(db, conditions)
+    if not cells:
+        db.rollback()
+        return 0
+
+    db.execute(
+        insert(TransactionTombstone).from_select(
+            ["user_id", "transaction_id", "change_version"],
+            select(Transaction.user_id, Transaction.id, literal(version)).where(*conditions)
+        )
+    )
+    deleted = db.execute(
+        delete(Transaction)
+        .where(*conditions)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    rebuild_daily_totals(db, user_id, cells)
+
+    _commit_write(db, user_id, version)
+    return deleted
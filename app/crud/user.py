@@ -1,3 +1,6 @@
+from typing import Optional
+
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash, verify_password
@@ -9,8 +12,13 @@ def get_user_by_email(db: Session, email: str) -> User | None:
     return db.query(User).filter(User.email == email).first()
 
 
-def create_user(db: Session, user_in: UserCreate) -> User:
-    hashed_password = get_password_hash(user_in.password)
+def create_user(
+    db: Session,
+    user_in: UserCreate,
+    hashed_password: Optional[str] = None
+) -> User:
+    if hashed_password is None:
+        hashed_password = get_password_hash(user_in.password)
     db_user = User(
         email=user_in.email,
         full_name=user_in.full_name,
@@ -29,3 +37,27 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
     if not verify_password(password, user.hashed_password):
         return None
     return user
+
+
+def get_user_data_version(db: Session, user_id: int) -> int:
+    version = db.execute(
+        select(User.data_version).where(User.id == user_id)
+    ).scalar_one_or_none()
+    return version or 0
+
+
+def bump_user_data_version(db: Session, user_id: int) -> int:
+    """Count a write to the user's transactions or categories and return
+    the new version.
+
+    Runs inside the caller's transaction, so the version moves exactly when
+    the write commits, whichever process makes it. The row lock it takes
+    also orders concurrent writes of one user by version.
+    """
+    return db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(data_version=User.data_version + 1)
+        .returning(User.data_version)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
@@ -0,0 +1,55 @@
+import re
+from typing import Optional
+
+from sqlalchemy import DDL, Table, event
+
+TRANSACTIONS_FTS_TABLE = "transactions_fts"
+
+# External content FTS5 index over transactions.description, kept in sync
+# by triggers. Mirrored by the migration that adds it to existing databases.
+TRANSACTIONS_FTS_CREATE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5("
+    "description, content='transactions', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+    "VALUES ('delete', old.id, old.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_au AFTER UPDATE OF description ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+    "VALUES ('delete', old.id, old.description); "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); "
+    "END",
+]
+
+TRANSACTIONS_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS transactions_fts_au",
+    "DROP TRIGGER IF EXISTS transactions_fts_ad",
+    "DROP TRIGGER IF EXISTS transactions_fts_ai",
+    "DROP TABLE IF EXISTS transactions_fts",
+]
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def build_fts_match(search: str) -> Optional[str]:
+    """Turn free text into an FTS5 query matching every word as a prefix.
+
+    Returns None when the text holds no searchable word.
+    """
+    tokens = _TOKEN_PATTERN.findall(search)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def install_transactions_fts(table: Table) -> None:
+    """Create the FTS index alongside the table on SQLite metadata.create_all."""
+    for statement in TRANSACTIONS_FTS_CREATE:
+        event.listen(table, "after_create",
+                     DDL(statement).execute_if(dialect="sqlite"))
+    for statement in TRANSACTIONS_FTS_DROP:
+        event.listen(table, "after_drop",
+                     DDL(statement).execute_if(dialect="sqlite"))
@@ -1,19 +1,102 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import get_settings
+from app.core.request_timing import instrument_engine
+from app.db.sqlite import install_sqlite_pragmas, sqlite_pragmas
 
 settings = get_settings()
 
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False}  # SQLite only
-)
+# Async drivers used when DATABASE_URL names a sync one
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def get_async_database_url(database_url: str, override: Optional[str] = None) -> URL:
+    if override:
+        return make_url(override)
+
+    url = make_url(database_url)
+    async_driver = ASYNC_DRIVERS.get(url.drivername)
+    if async_driver:
+        return url.set(drivername=async_driver)
+    return url
+
+
+def get_read_database_url(database_url: str, override: Optional[str] = None) -> Optional[URL]:
+    """URL for read-only traffic, or None when reads share the writer.
+
+    A SQLite file is reopened as a read-only URI; other backends need an
+    explicit replica URL.
+    """
+    if override:
+        return make_url(override)
+
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return None
+    if url.query.get("uri") == "true":
+        return url
+    return url.set(
+        database=f"file:{url.database}",
+        query={**url.query, "mode": "ro", "uri": "true"}
+    )
+
+
+def _connect_args(url: URL) -> dict:
+    return {"check_same_thread": False} if url.get_backend_name() == "sqlite" else {}
+
+
+database_url = make_url(settings.database_url)
+engine = create_engine(database_url, connect_args=_connect_args(database_url))
+install_sqlite_pragmas(engine, sqlite_pragmas(settings))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_database_url = get_async_database_url(
+    settings.database_url, settings.async_database_url)
+async_engine = create_async_engine(
+    async_database_url, connect_args=_connect_args(async_database_url))
+install_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas(settings))
+
+# Responses are serialized after the session work is done, outside the
+# greenlet that may load attributes, so nothing is expired on commit
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False)
+
+read_database_url = get_read_database_url(
+    settings.database_url, settings.read_database_url)
+if read_database_url is None:
+    read_engine = engine
+    async_read_engine = async_engine
+else:
+    async_read_database_url = get_async_database_url(
+        read_database_url.render_as_string(hide_password=False))
+    read_engine = create_engine(
+        read_database_url, connect_args=_connect_args(read_database_url))
+    async_read_engine = create_async_engine(
+        async_read_database_url, connect_args=_connect_args(async_read_database_url))
+    read_pragmas = sqlite_pragmas(settings, read_only=True)
+    install_sqlite_pragmas(read_engine, read_pragmas)
+    install_sqlite_pragmas(async_read_engine.sync_engine, read_pragmas)
+
+for instrumented_engine in {engine, async_engine.sync_engine,
+                            read_engine, async_read_engine.sync_engine}:
+    instrument_engine(instrumented_engine)
+
+ReadSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=read_engine)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine, autoflush=False, expire_on_commit=False)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -21,3 +104,21 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_reader_db() -> Generator[Session, None, None]:
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_reader_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncReadSessionLocal() as db:
+        yield db
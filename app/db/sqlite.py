@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Dict, List
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def sqlite_pragmas(settings: Settings, read_only: bool = False) -> Dict[str, str]:
+    """Per-connection PRAGMAs from settings, in the order they are applied.
+
+    journal_mode is persistent in the database file; the rest only last for
+    the connection, which is why they are issued on every connect. Read-only
+    connections leave the journal mode to the writer.
+    """
+    pragmas = {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "busy_timeout": str(settings.sqlite_busy_timeout_ms),
+        # Negative cache_size is in KiB rather than pages
+        "cache_size": str(-settings.sqlite_cache_size_kib),
+        "mmap_size": str(settings.sqlite_mmap_size_bytes),
+        "temp_store": settings.sqlite_temp_store,
+        "foreign_keys": "ON" if settings.sqlite_foreign_keys else "OFF",
+    }
+    if read_only:
+        del pragmas["journal_mode"]
+        pragmas["query_only"] = "ON"
+    return pragmas
+
+
+def install_sqlite_pragmas(engine: Engine, pragmas: Dict[str, str]) -> None:
+    """Apply `pragmas` to every new DBAPI connection of a SQLite engine."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def run_sqlite_housekeeping(engine: Engine) -> List[tuple]:
+    """Fold the WAL back into the database file and refresh planner stats.
+
+    Returns the wal_checkpoint result row: (busy, wal pages, checkpointed).
+    """
+    if engine.dialect.name != "sqlite":
+        return []
+
+    with engine.connect() as connection:
+        checkpoint = connection.exec_driver_sql(
+            "PRAGMA wal_checkpoint(TRUNCATE)").all()
+        connection.exec_driver_sql("PRAGMA optimize")
+    return checkpoint
+
+
+async def sqlite_housekeeping_loop(engine: Engine, interval_seconds: float) -> None:
+    """Run housekeeping every `interval_seconds` until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            checkpoint = await run_in_threadpool(run_sqlite_housekeeping, engine)
+            logger.debug("SQLite housekeeping done, wal_checkpoint=%s", checkpoint)
+        except Exception:
+            logger.exception("SQLite housekeeping failed")
@@ -1,10 +1,58 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.category_cache import global_categories
+from app.core.config import get_settings
+from app.core.metrics import request_metrics
+from app.core.request_timing import RequestTimingMiddleware
+from app.db.session import engine, get_db
+from app.db.sqlite import sqlite_housekeeping_loop
+from app.routers import (
+    auth_router, categories_router, transactions_router, summary_router, metrics_router
+)
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def warm_category_cache(app: FastAPI) -> None:
+    """Load the global category snapshot before the first request needs it."""
+    # Resolved like a request's session, so dependency overrides apply
+    sessions = app.dependency_overrides.get(get_db, get_db)()
+    try:
+        global_categories.get(next(sessions))
+    except SQLAlchemyError:
+        # Not fatal: the first request loads it instead
+        logger.warning("Could not preload global categories", exc_info=True)
+    finally:
+        sessions.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_category_cache(app)
+
+    housekeeping = None
+    if engine.dialect.name == "sqlite" and settings.sqlite_housekeeping_interval_seconds > 0:
+        housekeeping = asyncio.create_task(sqlite_housekeeping_loop(
+            engine, settings.sqlite_housekeeping_interval_seconds))
+
+    yield
+
+    if housekeeping:
+        housekeeping.cancel()
+
 
-from app.routers import auth_router, categories_router, transactions_router, summary_router
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(RequestTimingMiddleware)
 
-app = FastAPI()
+for api_router in (auth_router, categories_router, transactions_router, summary_router):
+    app.include_router(api_router)
+    request_metrics.add_group(api_router.prefix)
 
-app.include_router(auth_router)
-app.include_router(categories_router)
-app.include_router(transactions_router)
-app.include_router(summary_router)
+if settings.metrics_enabled:
+    app.include_router(metrics_router)
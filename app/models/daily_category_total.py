@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, DECIMAL, Date, ForeignKey, Index
+
+from app.db.base import Base
+
+
+class DailyCategoryTotal(Base):
+    """Per user, category and day rollup of transaction amounts."""
+    __tablename__ = "daily_category_totals"
+
+    user_id = Column(Integer, ForeignKey(
+        "users.id", ondelete="CASCADE"), primary_key=True)
+    category_id = Column(Integer, ForeignKey(
+        "categories.id"), primary_key=True)
+    date = Column(Date, primary_key=True)
+    total_amount = Column(DECIMAL(14, 2), nullable=False)
+    transaction_count = Column(Integer, nullable=False)
+    max_amount = Column(DECIMAL(10, 2), nullable=False)
+
+    __table_args__ = (
+        Index("ix_daily_category_totals_user_date", "user_id", "date"),
+    )
@@ -1,14 +1,15 @@
-from sqlalchemy import Column, Integer, Text, DECIMAL, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, DECIMAL, Date, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.fts import install_transactions_fts
 
 
 class Transaction(Base):
     __tablename__ = "transactions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey(
         "users.id", ondelete="CASCADE"), nullable=False)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
@@ -16,7 +17,25 @@ class Transaction(Base):
     amount = Column(DECIMAL(10, 2), nullable=False)
     date = Column(Date, default=func.current_date(), nullable=False)
     last_changed = Column(DateTime(timezone=True),
-                          server_default=func.current_timestamp(), nullable=False)
+                          server_default=func.current_timestamp(),
+                          onupdate=func.current_timestamp(), nullable=False)
+    # users.data_version of the write that last touched the row
+    change_version = Column(Integer, default=0, server_default="0",
+                            nullable=False)
+
+    # Every query is scoped to a user; trailing id columns serve keyset pages
+    __table_args__ = (
+        Index("ix_transactions_user_date_id", "user_id", "date", "id"),
+        Index("ix_transactions_user_category_date",
+              "user_id", "category_id", "date"),
+        Index("ix_transactions_user_amount_id", "user_id", "amount", "id"),
+        Index("ix_transactions_user_description_id",
+              "user_id", "description", "id"),
+        Index("ix_transactions_user_last_changed_id",
+              "user_id", "last_changed", "id"),
+        Index("ix_transactions_user_change_version",
+              "user_id", "change_version"),
+    )
 
     user = relationship("User", back_populates="transactions")
     category = relationship("Category", back_populates="transactions")
@@ -28,3 +47,6 @@ class Transaction(Base):
     @property
     def category_type(self) -> str:
         return self.category.category_type.value if self.category else ""
+
+
+install_transactions_fts(Transaction.__table__)
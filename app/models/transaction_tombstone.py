@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class TransactionTombstone(Base):
+    """Record of a deleted transaction, served by the delta sync."""
+    __tablename__ = "transaction_tombstones"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey(
+        "users.id", ondelete="CASCADE"), nullable=False)
+    transaction_id = Column(Integer, nullable=False)
+    # users.data_version of the delete
+    change_version = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True),
+                        server_default=func.current_timestamp(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_transaction_tombstones_user_change_version",
+              "user_id", "change_version"),
+    )
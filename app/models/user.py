@@ -15,6 +15,9 @@ class User(Base):
     hashed_password = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True),
                         server_default=func.now(), nullable=False)
+    # Incremented in the same transaction as every write to the user's data
+    data_version = Column(Integer, default=0, server_default="0",
+                          nullable=False)
 
     categories = relationship("Category", back_populates="user")
     transactions = relationship("Transaction", back_populates="user")
@@ -2,6 +2,7 @@ from .auth import router as auth_router
 from .categories import router as categories_router
 from .transactions import router as transactions_router
 from .summary import router as summary_router
+from .metrics import router as metrics_router
 
 __all__ = ["auth_router", "categories_router",
-           "transactions_router", "summary_router"]
+           "transactions_router", "summary_router", "metrics_router"]
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.core.config import get_settings
@@ -16,30 +17,31 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/token", response_model=Token, summary="Login with email and password")
-def login_for_access_token(
+async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     email = form_data.username
     password = form_data.password
 
-    user = auth_service.authenticate_user_credentials(email, password)
+    user = await auth_service.authenticate_user_credentials(email, password)
     if not user:
         raise AuthExceptions.invalid_credentials()
 
-    access_token = create_access_token(subject=user.email)
+    access_token = create_access_token(subject=user.email, user_id=user.id)
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.post("/register", response_model=UserResponse, summary="Register new user with email, password and optional full name")
-def register(
+async def register(
     user_in: UserCreate,
     auth_service: AuthService = Depends(get_auth_service)
 ):
-    existing_user = auth_service.get_user_by_email(user_in.email)
+    existing_user = await run_in_threadpool(
+        auth_service.get_user_by_email, user_in.email)
     if existing_user:
         raise UserExceptions.email_already_registered()
-    user = auth_service.create_new_user(user_in)
+    user = await auth_service.create_new_user(user_in)
     return user
 
 
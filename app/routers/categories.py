@@ -1,40 +1,54 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from app.core.deps import get_current_user, get_current_user_optional
+from app.core.deps import get_current_principal, get_current_principal_optional
+from app.core.etag import etag_headers, not_modified, weak_etag
 from app.core.exceptions import CategoryExceptions
-from app.models.user import User
+from app.core.security import Principal
 from app.models.category import CategoryType
 from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse
-from app.services.deps import get_category_service
-from app.services.category_service import CategoryService
+from app.services.deps import get_async_category_service
+from app.services.category_service import AsyncCategoryService
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
 
 @router.get("/", response_model=List[CategoryResponse], summary="Get all accessible categories")
-def get_categories(
+async def get_categories(
+    request: Request,
+    response: Response,
     category_type: Optional[CategoryType] = Query(
         None, description="Filter by category type"),
-    current_user: Optional[User] = Depends(get_current_user_optional),
-    category_service: CategoryService = Depends(get_category_service)
+    current_user: Optional[Principal] = Depends(get_current_principal_optional),
+    category_service: AsyncCategoryService = Depends(get_async_category_service)
 ):
     user_id = current_user.id if current_user else None
-    categories = category_service.get_user_categories(
+    # Read once, so the body and its ETag describe the same version
+    data_version = (await category_service.get_data_version(user_id)
+                    if user_id is not None else None)
+    etag = weak_etag(request, user_id,
+                     await category_service.get_categories_version(user_id, data_version))
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+
+    categories = await category_service.get_user_categories(
         user_id=user_id,
-        category_type=category_type
+        category_type=category_type,
+        data_version=data_version
     )
+    response.headers.update(etag_headers(etag))
     return categories
 
 
 @router.get("/{category_id}", response_model=CategoryResponse, summary="Get category by ID")
-def get_category(
+async def get_category(
     category_id: int,
-    current_user: Optional[User] = Depends(get_current_user_optional),
-    category_service: CategoryService = Depends(get_category_service)
+    current_user: Optional[Principal] = Depends(get_current_principal_optional),
+    category_service: AsyncCategoryService = Depends(get_async_category_service)
 ):
     user_id = current_user.id if current_user else None
-    category = category_service.get_user_category_by_id(
+    category = await category_service.get_user_category_by_id(
         category_id=category_id,
         user_id=user_id
     )
@@ -46,12 +60,12 @@ def get_category(
 
 
 @router.post("/", response_model=CategoryResponse, summary="Create a new category")
-def create_category_endpoint(
+async def create_category_endpoint(
     category_in: CategoryCreate,
-    current_user: User = Depends(get_current_user),
-    category_service: CategoryService = Depends(get_category_service)
+    current_user: Principal = Depends(get_current_principal),
+    category_service: AsyncCategoryService = Depends(get_async_category_service)
 ):
-    category = category_service.create_user_category(
+    category = await category_service.create_user_category(
         category_data=category_in,
         user_id=current_user.id
     )
@@ -59,13 +73,13 @@ def create_category_endpoint(
 
 
 @router.put("/{category_id}", response_model=CategoryResponse, summary="Update a category")
-def update_category_endpoint(
+async def update_category_endpoint(
     category_id: int,
     category_update: CategoryUpdate,
-    current_user: User = Depends(get_current_user),
-    category_service: CategoryService = Depends(get_category_service)
+    current_user: Principal = Depends(get_current_principal),
+    category_service: AsyncCategoryService = Depends(get_async_category_service)
 ):
-    category = category_service.update_user_category(
+    category = await category_service.update_user_category(
         category_id=category_id,
         category_data=category_update,
         user_id=current_user.id
@@ -78,12 +92,12 @@ def update_category_endpoint(
 
 
 @router.delete("/{category_id}", summary="Delete a category")
-def delete_category_endpoint(
+async def delete_category_endpoint(
     category_id: int,
-    current_user: User = Depends(get_current_user),
-    category_service: CategoryService = Depends(get_category_service)
+    current_user: Principal = Depends(get_current_principal),
+    category_service: AsyncCategoryService = Depends(get_async_category_service)
 ):
-    success = category_service.delete_user_category(
+    success = await category_service.delete_user_category(
         category_id=category_id,
         user_id=current_user.id
     )
@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import CONTENT_TYPE, render_metrics, request_metrics
+from app.core.password_hashing import password_hasher
+from app.db.session import async_engine, async_read_engine, engine, read_engine
+
+router = APIRouter(tags=["metrics"])
+
+
+def _engines():
+    seen = set()
+    for name, candidate in (("primary", engine),
+                            ("primary_async", async_engine.sync_engine),
+                            ("reader", read_engine),
+                            ("reader_async", async_read_engine.sync_engine)):
+        # Without a separate reader the read engines are the primary ones
+        if id(candidate) not in seen:
+            seen.add(id(candidate))
+            yield name, candidate
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    return PlainTextResponse(
+        render_metrics(request_metrics, _engines(), password_hasher.stats()),
+        media_type=CONTENT_TYPE
+    )
@@ -1,21 +1,73 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
-from app.services.deps import get_summary_service
-from app.services.summary_service import SummaryService
-from app.core.deps import get_current_user
-from app.models.user import User
-from app.schemas.summary import SummaryResponse, SummaryQueryParams
+from app.services.deps import get_async_summary_service
+from app.services.summary_service import AsyncSummaryService
+from app.core.deps import get_current_principal
+from app.core.etag import etag_headers, not_modified, weak_etag
+from app.core.exceptions import SummaryExceptions
+from app.core.security import Principal
+from app.schemas.summary import (
+    SummaryResponse,
+    SummaryQueryParams,
+    SummarySeriesResponse,
+    SeriesQueryParams
+)
 
 router = APIRouter(prefix="/summary", tags=["summary"])
 
 
+def _check_date_range(params: SummaryQueryParams) -> None:
+    if params.from_date and params.to_date and params.from_date > params.to_date:
+        raise SummaryExceptions.invalid_date_range()
+
+
 @router.get("/", response_model=SummaryResponse)
-def get_financial_summary(
+async def get_financial_summary(
+    request: Request,
+    response: Response,
     params: SummaryQueryParams = Depends(),
-    current_user: User = Depends(get_current_user),
-    summary_service: SummaryService = Depends(get_summary_service)
+    current_user: Principal = Depends(get_current_principal),
+    summary_service: AsyncSummaryService = Depends(get_async_summary_service)
 ):
-    return summary_service.get_user_summary(
+    _check_date_range(params)
+    data_version = await summary_service.get_data_version(current_user.id)
+    etag = weak_etag(request, current_user.id, data_version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+
+    # Cached under the version the ETag was built from
+    summary = await summary_service.get_user_summary(
+        user_id=current_user.id,
+        params=params,
+        data_version=data_version
+    )
+    response.headers.update(etag_headers(etag))
+    return summary
+
+
+@router.get("/series", response_model=SummarySeriesResponse,
+            summary="Get income, expense and net per day, week, month or year")
+async def get_financial_series(
+    request: Request,
+    response: Response,
+    params: SeriesQueryParams = Depends(),
+    current_user: Principal = Depends(get_current_principal),
+    summary_service: AsyncSummaryService = Depends(get_async_summary_service)
+):
+    _check_date_range(params)
+    data_version = await summary_service.get_data_version(current_user.id)
+    etag = weak_etag(request, current_user.id, data_version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+
+    series = await summary_service.get_user_series(
         user_id=current_user.id,
-        params=params
+        params=params,
+        data_version=data_version
     )
+    if series is None:
+        raise SummaryExceptions.too_many_buckets()
+    response.headers.update(etag_headers(etag))
+    return series
@@ -1,41 +1,204 @@
-from typing import List
-from fastapi import APIRouter, Depends
+from typing import Any, List
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from starlette.datastructures import UploadFile
 
-from app.core.deps import get_current_user
+from app.core.config import get_settings
+from app.core.deps import get_current_principal
+from app.core.etag import etag_headers, not_modified, weak_etag
 from app.core.exceptions import TransactionExceptions
-from app.models.user import User
+from app.core.security import Principal
 from app.schemas.transaction import (
     TransactionCreate,
     TransactionUpdate,
     TransactionResponse,
-    TransactionQueryParams
+    TransactionQueryParams,
+    TransactionExportParams,
+    TransactionChangesParams,
+    TransactionChangesResponse,
+    ExportFormat,
+    BulkImportResponse,
+    TransactionBulkSelection,
+    TransactionBulkUpdate,
+    TransactionBulkResponse
+)
+from app.services.deps import (
+    get_async_transaction_service,
+    get_read_transaction_service,
+    get_transaction_service
+)
+from app.services.transaction_service import (
+    AsyncTransactionService,
+    TransactionService,
+    parse_csv_rows,
+    serialize_transaction_changes,
+    serialize_transaction_rows
 )
-from app.services.deps import get_transaction_service
-from app.services.transaction_service import TransactionService
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
 
+async def _read_bulk_rows(request: Request) -> List[Any]:
+    content_type = request.headers.get("content-type", "")
+
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if not isinstance(upload, UploadFile):
+            raise TransactionExceptions.invalid_bulk_payload()
+        rows = parse_csv_rows(await upload.read())
+    elif content_type.startswith("text/csv"):
+        rows = parse_csv_rows(await request.body())
+    else:
+        try:
+            rows = await request.json()
+        except ValueError:
+            raise TransactionExceptions.invalid_bulk_payload()
+
+    if not isinstance(rows, list):
+        raise TransactionExceptions.invalid_bulk_payload()
+    return rows
+
+
 @router.get("/", response_model=List[TransactionResponse])
-def get_transactions(
+async def get_transactions(
+    request: Request,
     params: TransactionQueryParams = Depends(),
-    current_user: User = Depends(get_current_user),
-    transaction_service: TransactionService = Depends(get_transaction_service)
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: AsyncTransactionService = Depends(get_async_transaction_service)
+):
+    etag = weak_etag(request, current_user.id,
+                     await transaction_service.get_data_version(current_user.id))
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+
+    # Column rows serialized straight to JSON; response_model documents the shape
+    rows = await transaction_service.get_user_transaction_rows(
+        user_id=current_user.id,
+        params=params
+    )
+    if rows is None:
+        raise TransactionExceptions.invalid_cursor()
+
+    headers = etag_headers(etag)
+    next_cursor = transaction_service.get_next_cursor(rows, params)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return Response(
+        content=serialize_transaction_rows(rows),
+        media_type="application/json",
+        headers=headers
+    )
+
+
+@router.get("/export", response_class=StreamingResponse,
+            summary="Export all matching transactions as CSV or NDJSON")
+def export_transactions(
+    params: TransactionExportParams = Depends(),
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: TransactionService = Depends(get_read_transaction_service)
+):
+    if params.format == ExportFormat.NDJSON:
+        media_type = "application/x-ndjson"
+    else:
+        media_type = "text/csv"
+
+    return StreamingResponse(
+        transaction_service.export_user_transactions(
+            user_id=current_user.id,
+            params=params
+        ),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="transactions.{params.format}"'
+        }
+    )
+
+
+@router.get("/changes", response_model=TransactionChangesResponse,
+            summary="Transactions created, updated or deleted since a sync token")
+async def get_transaction_changes(
+    params: TransactionChangesParams = Depends(),
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: AsyncTransactionService = Depends(get_async_transaction_service)
 ):
-    transactions = transaction_service.get_user_transactions(
+    changes = await transaction_service.get_user_transaction_changes(
         user_id=current_user.id,
         params=params
     )
-    return transactions
+    if changes is None:
+        raise TransactionExceptions.invalid_sync_token()
+
+    return Response(
+        content=serialize_transaction_changes(changes),
+        media_type="application/json"
+    )
+
+
+@router.post("/bulk", response_model=BulkImportResponse,
+             summary="Import transactions from a JSON array or CSV file")
+async def import_transactions(
+    request: Request,
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: TransactionService = Depends(get_transaction_service)
+):
+    rows = await _read_bulk_rows(request)
+    if len(rows) > get_settings().bulk_import_max_rows:
+        raise TransactionExceptions.bulk_limit_exceeded()
+
+    return await run_in_threadpool(
+        transaction_service.import_user_transactions,
+        user_id=current_user.id,
+        rows=rows
+    )
+
+
+def _check_bulk_ids(selection: TransactionBulkSelection) -> None:
+    if selection.ids is not None and len(selection.ids) > get_settings().bulk_change_max_ids:
+        raise TransactionExceptions.bulk_limit_exceeded()
+
+
+@router.patch("/bulk", response_model=TransactionBulkResponse,
+              summary="Update transactions selected by ids or filter")
+async def update_transactions(
+    selection: TransactionBulkUpdate,
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: AsyncTransactionService = Depends(get_async_transaction_service)
+):
+    _check_bulk_ids(selection)
+    updated = await transaction_service.update_user_transactions(
+        selection=selection,
+        user_id=current_user.id
+    )
+    if updated is None:
+        raise TransactionExceptions.invalid_category()
+    return TransactionBulkResponse(affected=updated)
+
+
+@router.delete("/bulk", response_model=TransactionBulkResponse,
+               summary="Delete transactions selected by ids or filter")
+async def delete_transactions(
+    selection: TransactionBulkSelection,
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: AsyncTransactionService = Depends(get_async_transaction_service)
+):
+    _check_bulk_ids(selection)
+    deleted = await transaction_service.delete_user_transactions(
+        selection=selection,
+        user_id=current_user.id
+    )
+    return TransactionBulkResponse(affected=deleted)
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
-def get_transaction(
+async def get_transaction(
     transaction_id: int,
-    current_user: User = Depends(get_current_user),
-    transaction_service: TransactionService = Depends(get_transaction_service)
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: AsyncTransactionService = Depends(get_async_transaction_service)
 ):
-    transaction = transaction_service.get_user_transaction_by_id(
+    transaction = await transaction_service.get_user_transaction_by_id(
         transaction_id=transaction_id,
         user_id=current_user.id
     )
@@ -45,12 +208,12 @@ def get_transaction(
 
 
 @router.post("/", response_model=TransactionResponse)
-def create_new_transaction(
+async def create_new_transaction(
     transaction: TransactionCreate,
-    current_user: User = Depends(get_current_user),
-    transaction_service: TransactionService = Depends(get_transaction_service)
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: AsyncTransactionService = Depends(get_async_transaction_service)
 ):
-    created_transaction = transaction_service.create_user_transaction(
+    created_transaction = await transaction_service.create_user_transaction(
         transaction_data=transaction,
         user_id=current_user.id
     )
@@ -60,19 +223,19 @@ def create_new_transaction(
 
 
 @router.put("/{transaction_id}", response_model=TransactionResponse)
-def update_existing_transaction(
+async def update_existing_transaction(
     transaction_id: int,
     transaction: TransactionUpdate,
-    current_user: User = Depends(get_current_user),
-    transaction_service: TransactionService = Depends(get_transaction_service)
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: AsyncTransactionService = Depends(get_async_transaction_service)
 ):
-    updated_transaction = transaction_service.update_user_transaction(
+    updated_transaction = await transaction_service.update_user_transaction(
         transaction_id=transaction_id,
         transaction_data=transaction,
         user_id=current_user.id
     )
     if not updated_transaction:
-        existing = transaction_service.get_user_transaction_by_id(
+        existing = await transaction_service.get_user_transaction_by_id(
             transaction_id=transaction_id,
             user_id=current_user.id
         )
@@ -84,12 +247,12 @@ def update_existing_transaction(
 
 
 @router.delete("/{transaction_id}")
-def delete_existing_transaction(
+async def delete_existing_transaction(
     transaction_id: int,
-    current_user: User = Depends(get_current_user),
-    transaction_service: TransactionService = Depends(get_transaction_service)
+    current_user: Principal = Depends(get_current_principal),
+    transaction_service: AsyncTransactionService = Depends(get_async_transaction_service)
 ):
-    success = transaction_service.delete_user_transaction(
+    success = await transaction_service.delete_user_transaction(
         transaction_id=transaction_id,
         user_id=current_user.id
     )
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from enum import Enum
 from typing import List, Optional
 from datetime import date as date_type
 
@@ -56,3 +57,29 @@ class SummaryQueryParams(BaseModel):
         None, description="End date for summary")
     category_id: Optional[int] = Field(
         None, description="Filter by category ID")
+
+
+class SeriesBucket(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
+class SeriesQueryParams(SummaryQueryParams):
+    """Query parameters for summary series endpoint."""
+    bucket: SeriesBucket = Field(
+        SeriesBucket.MONTH, description="Bucket size: day, week (ISO), month or year")
+
+
+class SeriesPoint(BaseModel):
+    period_start: date_type = Field(...,
+                                    description="First day of the bucket")
+    income: Decimal = Field(..., description="Total income in the bucket")
+    expense: Decimal = Field(..., description="Total expenses in the bucket")
+    net: Decimal = Field(..., description="Net amount (income - expense)")
+
+
+class SummarySeriesResponse(BaseModel):
+    bucket: SeriesBucket
+    points: List[SeriesPoint] = Field(default_factory=list)
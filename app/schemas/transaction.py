@@ -1,12 +1,18 @@
 from datetime import date as date_type, datetime
 from decimal import Decimal
-from typing import Optional, Union
+from typing import List, Optional, Union
 from enum import Enum
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 
 from app.models.category import CategoryType
 
+DESCRIPTION_MAX_LENGTH = 500
+# Longest cursor the server issues: a description sort value of
+# DESCRIPTION_MAX_LENGTH characters, each up to 6 JSON bytes (\u escapes
+# of control characters), base64 encoded with the field name and id
+CURSOR_MAX_LENGTH = 4096
+
 
 def validate_transaction_amount(v: Optional[Decimal]) -> Optional[Decimal]:
     if v is not None:
@@ -21,7 +27,7 @@ def validate_transaction_amount(v: Optional[Decimal]) -> Optional[Decimal]:
 class TransactionBase(BaseModel):
     category_id: int = Field(...,
                              description="Category ID")
-    description: str = Field(..., min_length=1, max_length=500,
+    description: str = Field(..., min_length=1, max_length=DESCRIPTION_MAX_LENGTH,
                              description="Transaction description")
     amount: Decimal = Field(...,
                             description="Transaction amount (must be >= 0)")
@@ -42,7 +48,8 @@ class TransactionUpdate(BaseModel):
     category_id: Optional[int] = Field(
         default=None, description="Category ID")
     description: Optional[str] = Field(
-        default=None, min_length=1, max_length=500, description="Transaction description")
+        default=None, min_length=1, max_length=DESCRIPTION_MAX_LENGTH,
+        description="Transaction description")
     amount: Optional[Decimal] = Field(
         default=None, ge=0, description="Transaction amount (must be >= 0)")
     date: Union[date_type, None] = Field(
@@ -64,6 +71,17 @@ class TransactionResponse(TransactionBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BulkImportRowError(BaseModel):
+    row: int = Field(..., description="1-based position of the row in the upload")
+    errors: List[str] = Field(..., description="Why the row was rejected")
+
+
+class BulkImportResponse(BaseModel):
+    created: int = Field(..., description="Number of transactions created")
+    failed: int = Field(..., description="Number of rejected rows")
+    errors: List[BulkImportRowError] = Field(default_factory=list)
+
+
 class SortOrder(str, Enum):
     ASC = "asc"
     DESC = "desc"
@@ -76,12 +94,8 @@ class SortField(str, Enum):
     LAST_CHANGED = "last_changed"
 
 
-class TransactionQueryParams(BaseModel):
+class TransactionFilterParams(BaseModel):
     """Query parameters for filtering and sorting transactions."""
-    offset: int = Field(
-        default=0, ge=0, description="Number of transactions to skip")
-    limit: int = Field(default=100, ge=1, le=1000,
-                       description="Maximum number of transactions to return")
     category_id: Optional[int] = Field(
         default=None, description="Filter by category ID")
     min_amount: Optional[Decimal] = Field(
@@ -103,3 +117,77 @@ class TransactionQueryParams(BaseModel):
     model_config = ConfigDict(
         use_enum_values=True
     )
+
+
+class TransactionQueryParams(TransactionFilterParams):
+    """Query parameters for filtering, sorting and paginating transactions."""
+    offset: int = Field(
+        default=0, ge=0, description="Number of transactions to skip")
+    limit: int = Field(default=100, ge=1, le=1000,
+                       description="Maximum number of transactions to return")
+    cursor: Optional[str] = Field(
+        default=None, max_length=CURSOR_MAX_LENGTH,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page (replaces offset)")
+
+
+class TransactionBulkSelection(BaseModel):
+    """Transactions targeted by a bulk update or delete: ids or a filter."""
+    ids: Optional[List[int]] = Field(
+        default=None, min_length=1, description="IDs of the transactions to change")
+    filter: Optional[TransactionFilterParams] = Field(
+        default=None, description="Change every transaction matching these list filters")
+
+    @model_validator(mode="after")
+    def validate_selector(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of 'ids' or 'filter'")
+        return self
+
+    def filter_values(self) -> Optional[dict]:
+        if self.filter is None:
+            return None
+        return self.filter.model_dump(exclude={"sort_by", "order"})
+
+
+class TransactionBulkUpdate(TransactionBulkSelection):
+    changes: TransactionUpdate = Field(
+        ..., description="Fields to set on every selected transaction")
+
+    @model_validator(mode="after")
+    def validate_changes(self):
+        if not self.changes.model_dump(exclude_none=True):
+            raise ValueError("'changes' must set at least one field")
+        return self
+
+
+class TransactionBulkResponse(BaseModel):
+    affected: int = Field(..., description="Number of transactions updated or deleted")
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class TransactionExportParams(TransactionFilterParams):
+    """Query parameters for exporting transactions."""
+    format: ExportFormat = Field(
+        default=ExportFormat.CSV, description="Export format: csv or ndjson")
+
+
+class TransactionChangesParams(BaseModel):
+    """Query parameters for the delta sync."""
+    since: Optional[str] = Field(
+        default=None, max_length=1024,
+        description="next_since token of the previous sync; omit for a full sync")
+    limit: int = Field(default=500, ge=1, le=1000,
+                       description="Maximum number of changes to return (one write is never split)")
+
+
+class TransactionChangesResponse(BaseModel):
+    changed: List[TransactionResponse] = Field(
+        ..., description="Transactions created or updated since the token, in their current state")
+    deleted: List[int] = Field(
+        ..., description="IDs of transactions deleted since the token; apply before `changed`")
+    next_since: str = Field(..., description="Token to pass as `since` on the next sync")
+    has_more: bool = Field(..., description="Whether more changes are waiting past next_since")
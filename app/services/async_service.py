@@ -0,0 +1,39 @@
+"""
+Async adapters running the sync services on an AsyncSession.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud.user import get_user_data_version
+
+ServiceT = TypeVar("ServiceT")
+
+
+class AsyncServiceAdapter(ABC, Generic[ServiceT]):
+    """Base for async services wrapping a sync service class.
+
+    Each call runs the sync implementation through AsyncSession.run_sync,
+    so queries are written once and the event loop awaits database I/O
+    instead of parking a threadpool slot on it.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @abstractmethod
+    def _build_service(self, session: Session) -> ServiceT:
+        """The sync service bound to `session`."""
+
+    async def _run(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await self.db.run_sync(
+            lambda session: method(self._build_service(session), *args, **kwargs)
+        )
+
+    async def get_data_version(self, user_id: int) -> int:
+        """The user's persisted write counter, read on this service's session."""
+        return await self.db.run_sync(
+            lambda session: get_user_data_version(session, user_id)
+        )
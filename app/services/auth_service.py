@@ -2,9 +2,11 @@
 Auth service layer for handling authentication business logic.
 """
 from typing import Optional
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.crud.user import authenticate_user, create_user, get_user_by_email
+from app.core.password_hashing import password_hasher
+from app.crud.user import create_user, get_user_by_email
 from app.models.user import User
 from app.schemas.user import UserCreate
 
@@ -16,16 +18,17 @@ class AuthService:
         self.db = db
         self.transaction_service = transaction_service
 
-    def authenticate_user_credentials(
+    async def authenticate_user_credentials(
         self,
         email: str,
         password: str
     ) -> Optional[User]:
-        return authenticate_user(
-            db=self.db,
-            email=email,
-            password=password
-        )
+        user = await run_in_threadpool(self.get_user_by_email, email)
+        if not user:
+            return None
+        if not await password_hasher.verify(password, user.hashed_password):
+            return None
+        return user
 
     def get_user_by_email(
         self,
@@ -36,17 +39,32 @@ class AuthService:
             email=email
         )
 
-    def create_new_user(
+    async def create_new_user(
         self,
         user_data: UserCreate
+    ) -> User:
+        hashed_password = await password_hasher.hash(user_data.password)
+        return await run_in_threadpool(
+            self._create_user_with_initial_transaction,
+            user_data,
+            hashed_password
+        )
+
+    def _create_user_with_initial_transaction(
+        self,
+        user_data: UserCreate,
+        hashed_password: str
     ) -> User:
         created_user = create_user(
             db=self.db,
-            user_in=user_data
+            user_in=user_data,
+            hashed_password=hashed_password
         )
 
         if self.transaction_service:
             self.transaction_service.create_initial_transaction(
                 created_user.id)
+            # Reload what the commit expired while still off the event loop
+            self.db.refresh(created_user)
 
         return created_user
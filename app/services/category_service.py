@@ -4,7 +4,9 @@ Category service layer for handling business logic.
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from app.core.category_cache import global_categories
 from app.crud.category import (
+    AnyCategory,
     get_categories_for_user,
     get_category_by_id,
     create_category,
@@ -13,8 +15,10 @@ from app.crud.category import (
     get_categories_by_type,
     get_category_by_name
 )
+from app.crud.user import get_user_data_version
 from app.models.category import Category, CategoryType
 from app.schemas.category import CategoryCreate, CategoryUpdate
+from app.services.async_service import AsyncServiceAdapter
 
 
 class CategoryService:
@@ -26,25 +30,28 @@ class CategoryService:
     def get_user_categories(
         self,
         user_id: Optional[int] = None,
-        category_type: Optional[CategoryType] = None
-    ) -> List[Category]:
+        category_type: Optional[CategoryType] = None,
+        data_version: Optional[int] = None
+    ) -> List[AnyCategory]:
         if category_type:
             return get_categories_by_type(
                 db=self.db,
                 category_type=category_type.value,
-                user_id=user_id
+                user_id=user_id,
+                data_version=data_version
             )
         else:
             return get_categories_for_user(
                 db=self.db,
-                user_id=user_id
+                user_id=user_id,
+                data_version=data_version
             )
 
     def get_user_category_by_id(
         self,
         category_id: int,
         user_id: Optional[int] = None
-    ) -> Optional[Category]:
+    ) -> Optional[AnyCategory]:
         return get_category_by_id(
             db=self.db,
             category_id=category_id,
@@ -90,9 +97,103 @@ class CategoryService:
         self,
         name: str,
         user_id: Optional[int] = None
-    ) -> Optional[Category]:
+    ) -> Optional[AnyCategory]:
         return get_category_by_name(
             db=self.db,
             name=name,
             user_id=user_id
         )
+
+    def get_categories_version(
+        self,
+        user_id: Optional[int] = None,
+        data_version: Optional[int] = None
+    ) -> str:
+        """Moves whenever the categories visible to the user may have changed.
+
+        Pass the user's `data_version` the categories are listed at, so the
+        version and the list agree.
+        """
+        version = global_categories.get(self.db).fingerprint
+        if user_id is not None:
+            if data_version is None:
+                data_version = get_user_data_version(self.db, user_id)
+            version = f"{version}:{data_version}"
+        return version
+
+
+class AsyncCategoryService(AsyncServiceAdapter[CategoryService]):
+    """CategoryService for async endpoints."""
+
+    def _build_service(self, session: Session) -> CategoryService:
+        return CategoryService(session)
+
+    async def get_user_categories(
+        self,
+        user_id: Optional[int] = None,
+        category_type: Optional[CategoryType] = None,
+        data_version: Optional[int] = None
+    ) -> List[AnyCategory]:
+        return await self._run(
+            CategoryService.get_user_categories,
+            user_id=user_id,
+            category_type=category_type,
+            data_version=data_version
+        )
+
+    async def get_user_category_by_id(
+        self,
+        category_id: int,
+        user_id: Optional[int] = None
+    ) -> Optional[AnyCategory]:
+        return await self._run(
+            CategoryService.get_user_category_by_id,
+            category_id=category_id,
+            user_id=user_id
+        )
+
+    async def create_user_category(
+        self,
+        category_data: CategoryCreate,
+        user_id: int
+    ) -> Optional[Category]:
+        return await self._run(
+            CategoryService.create_user_category,
+            category_data=category_data,
+            user_id=user_id
+        )
+
+    async def update_user_category(
+        self,
+        category_id: int,
+        category_data: CategoryUpdate,
+        user_id: int
+    ) -> Optional[Category]:
+        return await self._run(
+            CategoryService.update_user_category,
+            category_id=category_id,
+            category_data=category_data,
+            user_id=user_id
+        )
+
+    async def delete_user_category(
+        self,
+        category_id: int,
+        user_id: int
+    ) -> bool:
+        return await self._run(
+            CategoryService.delete_user_category,
+            category_id=category_id,
+            user_id=user_id
+        )
+
+    async def get_categories_version(
+        self,
+        user_id: Optional[int] = None,
+        data_version: Optional[int] = None
+    ) -> str:
+        return await self._run(
+            CategoryService.get_categories_version,
+            user_id=user_id,
+            data_version=data_version
+        )
@@ -1,11 +1,12 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db
-from app.services.transaction_service import TransactionService
-from app.services.category_service import CategoryService
+from app.core.deps import get_async_read_db, get_async_routed_db, get_db, get_read_db
+from app.services.transaction_service import AsyncTransactionService, TransactionService
+from app.services.category_service import AsyncCategoryService, CategoryService
 from app.services.auth_service import AuthService
-from app.services.summary_service import SummaryService
+from app.services.summary_service import AsyncSummaryService
 
 
 def get_category_service(db: Session = Depends(get_db)) -> CategoryService:
@@ -26,7 +27,25 @@ def get_auth_service(
     return AuthService(db, transaction_service)
 
 
-def get_summary_service(
-    transaction_service: TransactionService = Depends(get_transaction_service)
-) -> SummaryService:
-    return SummaryService(transaction_service)
+def get_read_transaction_service(
+    db: Session = Depends(get_read_db)
+) -> TransactionService:
+    return TransactionService(db)
+
+
+def get_async_category_service(
+    db: AsyncSession = Depends(get_async_routed_db)
+) -> AsyncCategoryService:
+    return AsyncCategoryService(db)
+
+
+def get_async_transaction_service(
+    db: AsyncSession = Depends(get_async_routed_db)
+) -> AsyncTransactionService:
+    return AsyncTransactionService(db)
+
+
+def get_async_summary_service(
+    db: AsyncSession = Depends(get_async_read_db)
+) -> AsyncSummaryService:
+    return AsyncSummaryService(db)
@@ -1,10 +1,21 @@
 """
 Summary service layer for handling financial summary business logic.
 """
-from typing import List
+from typing import Dict, List, Optional
+from datetime import date, timedelta
 from decimal import Decimal
 
-from app.models.transaction import Transaction
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.crud.summary import (
+    get_category_totals,
+    get_daily_type_totals,
+    get_largest_transactions
+)
+from app.crud.user import get_user_data_version
 from app.models.category import CategoryType
 from app.schemas.summary import (
     SummaryResponse,
@@ -13,37 +24,188 @@ from app.schemas.summary import (
     CategoryBreakdown,
     CategoryBreakdownItem,
     Metrics,
-    TransactionSummary
+    TransactionSummary,
+    SeriesBucket,
+    SeriesPoint,
+    SeriesQueryParams,
+    SummarySeriesResponse
+)
+from app.services.async_service import AsyncServiceAdapter
+
+settings = get_settings()
+
+summary_cache = TTLCache(
+    max_entries=settings.summary_cache_max_entries,
+    ttl_seconds=settings.summary_cache_ttl_seconds
 )
-from app.schemas.transaction import TransactionQueryParams as TransactionFilters
+
+
+def _bucket_start(day: date, bucket: SeriesBucket) -> date:
+    if bucket == SeriesBucket.WEEK:
+        return day - timedelta(days=day.weekday())
+    if bucket == SeriesBucket.MONTH:
+        return day.replace(day=1)
+    if bucket == SeriesBucket.YEAR:
+        return day.replace(month=1, day=1)
+    return day
+
+
+def _next_bucket_start(start: date, bucket: SeriesBucket) -> Optional[date]:
+    """First day of the following bucket, or None past date.max."""
+    try:
+        if bucket == SeriesBucket.WEEK:
+            return start + timedelta(weeks=1)
+        if bucket == SeriesBucket.MONTH:
+            if start.month == 12:
+                return start.replace(year=start.year + 1, month=1)
+            return start.replace(month=start.month + 1)
+        if bucket == SeriesBucket.YEAR:
+            return start.replace(year=start.year + 1)
+        return start + timedelta(days=1)
+    except (OverflowError, ValueError):
+        return None
+
+
+def _bucket_count(first: date, last: date, bucket: SeriesBucket) -> int:
+    if bucket == SeriesBucket.WEEK:
+        return (_bucket_start(last, bucket) - _bucket_start(first, bucket)).days // 7 + 1
+    if bucket == SeriesBucket.MONTH:
+        return (last.year - first.year) * 12 + last.month - first.month + 1
+    if bucket == SeriesBucket.YEAR:
+        return last.year - first.year + 1
+    return (last - first).days + 1
 
 
 class SummaryService:
     """Service class for financial summary-related business logic."""
 
-    def __init__(self, transaction_service):
-        self.transaction_service = transaction_service
+    def __init__(self, db: Session):
+        self.db = db
 
     def get_user_summary(
         self,
         user_id: int,
-        params: SummaryQueryParams
+        params: SummaryQueryParams,
+        data_version: Optional[int] = None
     ) -> SummaryResponse:
-        transactions = self.transaction_service.get_all_user_transactions_for_summary(
+        """The summary, cached per persisted data version.
+
+        Pass `data_version` when it was already read, e.g. for the ETag.
+        """
+        if data_version is None:
+            data_version = get_user_data_version(self.db, user_id)
+        # The persisted version in the key retires every entry of a user on
+        # write, whichever process made it, and matches the ETag
+        cache_key = (
+            user_id,
+            data_version,
+            params.from_date,
+            params.to_date,
+            params.category_id
+        )
+        summary = summary_cache.get(cache_key)
+        if summary is None:
+            summary = self._build_user_summary(user_id, params)
+            summary_cache.set(cache_key, summary)
+        return summary
+
+    def get_user_series(
+        self,
+        user_id: int,
+        params: SeriesQueryParams,
+        data_version: Optional[int] = None
+    ) -> Optional[SummarySeriesResponse]:
+        """The series, or None when the range has too many buckets.
+
+        Cached like get_user_summary.
+        """
+        if data_version is None:
+            data_version = get_user_data_version(self.db, user_id)
+        cache_key = (
+            user_id,
+            data_version,
+            params.from_date,
+            params.to_date,
+            params.category_id,
+            params.bucket
+        )
+        series = summary_cache.get(cache_key)
+        if series is None:
+            series = self._build_user_series(user_id, params)
+            if series is not None:
+                summary_cache.set(cache_key, series)
+        return series
+
+    def _build_user_series(
+        self,
+        user_id: int,
+        params: SeriesQueryParams
+    ) -> Optional[SummarySeriesResponse]:
+        max_buckets = settings.summary_series_max_buckets
+        # An explicit range is checked before it is queried
+        if params.from_date and params.to_date and _bucket_count(
+                params.from_date, params.to_date, params.bucket) > max_buckets:
+            return None
+
+        daily_totals = get_daily_type_totals(
+            db=self.db,
             user_id=user_id,
             category_id=params.category_id,
             from_date=params.from_date,
             to_date=params.to_date
         )
 
-        total_income = sum(
-            t.amount for t in transactions
-            if t.category.category_type == CategoryType.income
-        )
-        total_expense = sum(
-            t.amount for t in transactions
-            if t.category.category_type == CategoryType.expense
+        first_date = params.from_date or (
+            daily_totals[0].date if daily_totals else None)
+        last_date = params.to_date or (
+            daily_totals[-1].date if daily_totals else None)
+        if first_date is None or last_date is None or first_date > last_date:
+            return SummarySeriesResponse(bucket=params.bucket)
+        if _bucket_count(first_date, last_date, params.bucket) > max_buckets:
+            return None
+
+        # Every bucket in the range is emitted so charts get a dense axis
+        buckets: Dict[date, Dict[CategoryType, Decimal]] = {}
+        start = _bucket_start(first_date, params.bucket)
+        while start is not None and start <= last_date:
+            buckets[start] = {
+                CategoryType.income: Decimal('0'),
+                CategoryType.expense: Decimal('0')
+            }
+            start = _next_bucket_start(start, params.bucket)
+
+        for row in daily_totals:
+            buckets[_bucket_start(row.date, params.bucket)
+                    ][row.category_type] += row.total
+
+        points = [
+            SeriesPoint(
+                period_start=start,
+                income=totals[CategoryType.income],
+                expense=totals[CategoryType.expense],
+                net=totals[CategoryType.income] - totals[CategoryType.expense]
+            )
+            for start, totals in buckets.items()
+        ]
+
+        return SummarySeriesResponse(bucket=params.bucket, points=points)
+
+    def _build_user_summary(
+        self,
+        user_id: int,
+        params: SummaryQueryParams
+    ) -> SummaryResponse:
+        category_totals = get_category_totals(
+            db=self.db,
+            user_id=user_id,
+            category_id=params.category_id,
+            from_date=params.from_date,
+            to_date=params.to_date
         )
+
+        total_income = self._sum_totals(category_totals, CategoryType.income)
+        total_expense = self._sum_totals(
+            category_totals, CategoryType.expense)
         net_total = total_income - total_expense
 
         totals = Totals(
@@ -52,9 +214,11 @@ class SummaryService:
             net=net_total
         )
 
-        category_breakdown = self._calculate_category_breakdown(transactions)
+        category_breakdown = self._calculate_category_breakdown(
+            category_totals)
 
-        metrics = self._calculate_metrics(transactions, params)
+        metrics = self._calculate_metrics(
+            user_id, category_totals, total_income, total_expense, params)
 
         return SummaryResponse(
             totals=totals,
@@ -62,20 +226,23 @@ class SummaryService:
             metrics=metrics
         )
 
-    def _calculate_category_breakdown(self, transactions: List[Transaction]) -> CategoryBreakdown:
+    @staticmethod
+    def _sum_totals(category_totals: List[Row], category_type: CategoryType) -> Decimal:
+        return sum(
+            (row.total for row in category_totals
+             if row.category_type == category_type),
+            Decimal('0')
+        )
+
+    def _calculate_category_breakdown(self, category_totals: List[Row]) -> CategoryBreakdown:
         income_breakdown = {}
         expense_breakdown = {}
 
-        for transaction in transactions:
-            category_name = transaction.category.name
-            amount = transaction.amount
-
-            if transaction.category.category_type == CategoryType.income:
-                income_breakdown[category_name] = income_breakdown.get(
-                    category_name, Decimal('0')) + amount
+        for row in category_totals:
+            if row.category_type == CategoryType.income:
+                income_breakdown[row.category_name] = row.total
             else:
-                expense_breakdown[category_name] = expense_breakdown.get(
-                    category_name, Decimal('0')) + amount
+                expense_breakdown[row.category_name] = row.total
 
         income_items = [
             CategoryBreakdownItem(category=name, total=total)
@@ -91,8 +258,15 @@ class SummaryService:
             expense=expense_items
         )
 
-    def _calculate_metrics(self, transactions: List[Transaction], params: SummaryQueryParams) -> Metrics:
-        if not transactions:
+    def _calculate_metrics(
+        self,
+        user_id: int,
+        category_totals: List[Row],
+        total_income: Decimal,
+        total_expense: Decimal,
+        params: SummaryQueryParams
+    ) -> Metrics:
+        if not category_totals:
             return Metrics(
                 average_daily_net=Decimal('0'),
                 average_daily_income=Decimal('0'),
@@ -104,21 +278,9 @@ class SummaryService:
         if params.from_date and params.to_date:
             days_in_period = (params.to_date - params.from_date).days + 1
         else:
-            dates = [t.date for t in transactions]
-            if dates:
-                days_in_period = (max(dates) - min(dates)).days + 1
-            else:
-                days_in_period = 1
-
-        income_transactions = [
-            t for t in transactions if t.category.category_type == CategoryType.income]
-        expense_transactions = [
-            t for t in transactions if t.category.category_type == CategoryType.expense]
-
-        total_income = sum((Decimal(str(t.amount))
-                           for t in income_transactions), Decimal('0'))
-        total_expense = sum((Decimal(str(t.amount))
-                            for t in expense_transactions), Decimal('0'))
+            first_date = min(row.first_date for row in category_totals)
+            last_date = max(row.last_date for row in category_totals)
+            days_in_period = (last_date - first_date).days + 1
 
         days_decimal = Decimal(str(days_in_period))
         avg_daily_income = (total_income / days_decimal if days_in_period >
@@ -128,35 +290,60 @@ class SummaryService:
         avg_daily_net = (avg_daily_income -
                          avg_daily_expense).quantize(Decimal('0.01'))
 
-        largest_income = None
-        largest_expense = None
-
-        if income_transactions:
-            largest_income_tx = max(
-                income_transactions, key=lambda t: t.amount)
-            largest_income = TransactionSummary(
-                id=largest_income_tx.id,
-                description=largest_income_tx.description,
-                amount=largest_income_tx.amount,
-                date=largest_income_tx.date,
-                category_name=largest_income_tx.category.name
-            )
-
-        if expense_transactions:
-            largest_expense_tx = max(
-                expense_transactions, key=lambda t: t.amount)
-            largest_expense = TransactionSummary(
-                id=largest_expense_tx.id,
-                description=largest_expense_tx.description,
-                amount=largest_expense_tx.amount,
-                date=largest_expense_tx.date,
-                category_name=largest_expense_tx.category.name
-            )
+        largest = get_largest_transactions(
+            db=self.db,
+            user_id=user_id,
+            category_id=params.category_id,
+            from_date=params.from_date,
+            to_date=params.to_date
+        )
 
         return Metrics(
             average_daily_net=avg_daily_net,
             average_daily_income=avg_daily_income,
             average_daily_expense=avg_daily_expense,
-            largest_expense=largest_expense,
-            largest_income=largest_income
+            largest_expense=self._to_transaction_summary(
+                largest.get(CategoryType.expense)),
+            largest_income=self._to_transaction_summary(
+                largest.get(CategoryType.income))
         )
+
+    @staticmethod
+    def _to_transaction_summary(row: Optional[Row]) -> Optional[TransactionSummary]:
+        if row is None:
+            return None
+
+        return TransactionSummary(
+            id=row.id,
+            description=row.description,
+            amount=row.amount,
+            date=row.date,
+            category_name=row.category_name
+        )
+
+
+class AsyncSummaryService(AsyncServiceAdapter[SummaryService]):
+    """SummaryService for async endpoints, sharing its response cache."""
+
+    def _build_service(self, session: Session) -> SummaryService:
+        return SummaryService(session)
+
+    async def get_user_summary(
+        self,
+        user_id: int,
+        params: SummaryQueryParams,
+        data_version: Optional[int] = None
+    ) -> SummaryResponse:
+        return await self._run(
+            SummaryService.get_user_summary, user_id=user_id, params=params,
+            data_version=data_version)
+
+    async def get_user_series(
+        self,
+        user_id: int,
+        params: SeriesQueryParams,
+        data_version: Optional[int] = None
+    ) -> Optional[SummarySeriesResponse]:
+        return await self._run(
+            SummaryService.get_user_series, user_id=user_id, params=params,
+            data_version=data_version)
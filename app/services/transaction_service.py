@@ -1,22 +1,151 @@
-from typing import List, Optional
+import csv
+import io
+import json
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from dataclasses import dataclass
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from datetime import date
 
+from app.crud.category import get_accessible_category_ids
 from app.crud.transaction import (
-    get_transactions_for_user,
+    bulk_create_transactions,
+    bulk_delete_transactions,
+    bulk_update_transactions,
+    decode_cursor,
+    decode_sync_token,
+    encode_cursor,
+    encode_sync_token,
+    get_transaction_changes,
+    get_transaction_rows_for_user,
     get_transaction_by_id,
+    iter_transactions_for_export,
+    TransactionRecord,
     create_transaction,
     update_transaction,
     delete_transaction
 )
+from app.crud.user import get_user_data_version
 from app.models.transaction import Transaction
 from app.models.category import CategoryType
 from app.schemas.transaction import (
+    BulkImportResponse,
+    BulkImportRowError,
+    ExportFormat,
+    TransactionBulkSelection,
+    TransactionBulkUpdate,
+    TransactionChangesParams,
     TransactionCreate,
+    TransactionExportParams,
     TransactionUpdate,
     TransactionQueryParams
 )
 from app.core.config import get_settings
+from app.services.async_service import AsyncServiceAdapter
+from app.services.category_service import CategoryService
+
+EXPORT_COLUMNS = [
+    "id",
+    "date",
+    "description",
+    "amount",
+    "category_id",
+    "category_name",
+    "category_type",
+    "last_changed"
+]
+EXPORT_CHUNK_ROWS = 500
+
+
+def parse_csv_rows(content: bytes) -> Optional[List[Dict[str, str]]]:
+    """Read an uploaded CSV into dicts keyed by its header row.
+
+    Blank cells are dropped so optional fields fall back to their defaults.
+    Returns None when the content is not UTF-8 text.
+    """
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return None
+
+    return [
+        {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key and isinstance(value, str) and value.strip()
+        }
+        for row in csv.DictReader(io.StringIO(text))
+    ]
+
+
+def _validation_messages(error: ValidationError) -> List[str]:
+    messages = []
+    for item in error.errors():
+        field = ".".join(str(part) for part in item["loc"])
+        messages.append(f"{field}: {item['msg']}" if field else item["msg"])
+    return messages
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _row_dicts(rows: Sequence[Row]) -> List[dict]:
+    if not rows:
+        return []
+    # zip over the shared field names is cheaper than Row._asdict()
+    keys = rows[0]._fields
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def serialize_transaction_rows(rows: Sequence[Row]) -> bytes:
+    """JSON array of TransactionResponse objects, built from column rows.
+
+    Produces the same document as validating ORM objects through the
+    response model, without building a model per row.
+    """
+    if not rows:
+        return b"[]"
+    return orjson.dumps(_row_dicts(rows), default=_json_default, option=orjson.OPT_UTC_Z)
+
+
+@dataclass(frozen=True)
+class TransactionChanges:
+    rows: List[Row]
+    deleted: List[int]
+    next_since: str
+    has_more: bool
+
+
+def serialize_transaction_changes(changes: TransactionChanges) -> bytes:
+    """TransactionChangesResponse JSON, with `changed` built like
+    serialize_transaction_rows."""
+    return orjson.dumps({
+        "changed": _row_dicts(changes.rows),
+        "deleted": changes.deleted,
+        "next_since": changes.next_since,
+        "has_more": changes.has_more,
+    }, default=_json_default, option=orjson.OPT_UTC_Z)
+
+
+def _export_values(row: Row) -> list:
+    return [
+        row.id,
+        row.date.isoformat(),
+        row.description,
+        str(row.amount),
+        row.category_id,
+        row.category_name,
+        row.category_type.value,
+        row.last_changed.isoformat()
+    ]
 
 
 class TransactionService:
@@ -26,12 +155,20 @@ class TransactionService:
         self.db = db
         self.category_service = category_service
 
-    def get_user_transactions(
+    def get_user_transaction_rows(
         self,
         user_id: int,
         params: TransactionQueryParams
-    ) -> List[Transaction]:
-        return get_transactions_for_user(
+    ) -> Optional[List[Row]]:
+        """A page of the user's transactions, as column rows for
+        serialize_transaction_rows."""
+        after = None
+        if params.cursor:
+            after = decode_cursor(params.cursor, params.sort_by)
+            if after is None:
+                return None
+
+        return get_transaction_rows_for_user(
             db=self.db,
             user_id=user_id,
             offset=params.offset,
@@ -44,9 +181,54 @@ class TransactionService:
             category_type=params.category_type,
             description_query=params.description_query,
             sort_by=params.sort_by,
-            order=params.order
+            order=params.order,
+            after=after
+        )
+
+    def get_user_transaction_changes(
+        self,
+        user_id: int,
+        params: TransactionChangesParams
+    ) -> Optional[TransactionChanges]:
+        """Changes after the `since` watermark, or None for an invalid token."""
+        since = None
+        if params.since:
+            since = decode_sync_token(params.since, user_id)
+            if since is None:
+                return None
+
+        # Read first: writes committing during the sync fall past `until`
+        # and are picked up by the next one
+        until = get_user_data_version(self.db, user_id)
+        if since is not None and since > until:
+            # Issued by another database, e.g. before a restore
+            return None
+        if since == until:
+            return TransactionChanges([], [], params.since, False)
+
+        covered, rows, deleted = get_transaction_changes(
+            db=self.db,
+            user_id=user_id,
+            since=since,
+            until=until,
+            limit=params.limit
+        )
+        return TransactionChanges(
+            rows=rows,
+            deleted=deleted,
+            next_since=encode_sync_token(user_id, covered),
+            has_more=covered < until
         )
 
+    @staticmethod
+    def get_next_cursor(
+        transactions: List[Transaction],
+        params: TransactionQueryParams
+    ) -> Optional[str]:
+        if len(transactions) < params.limit:
+            return None
+        return encode_cursor(transactions[-1], params.sort_by)
+
     def get_user_transaction_by_id(
         self,
         transaction_id: int,
@@ -58,38 +240,128 @@ class TransactionService:
             user_id=user_id
         )
 
+    def export_user_transactions(
+        self,
+        user_id: int,
+        params: TransactionExportParams
+    ) -> Iterator[str]:
+        rows = iter_transactions_for_export(
+            db=self.db,
+            user_id=user_id,
+            category_id=params.category_id,
+            min_amount=params.min_amount,
+            max_amount=params.max_amount,
+            from_date=params.from_date,
+            to_date=params.to_date,
+            category_type=params.category_type,
+            description_query=params.description_query,
+            sort_by=params.sort_by,
+            order=params.order
+        )
+
+        # The response streams after request dependencies have exited, so
+        # the export owns the session until the last row is written
+        try:
+            if params.format == ExportFormat.NDJSON:
+                yield from self._ndjson_chunks(rows)
+            else:
+                yield from self._csv_chunks(rows)
+        finally:
+            self.db.close()
+
+    @staticmethod
+    def _csv_chunks(rows: Iterable[Row]) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue()
+
+        pending = 0
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            writer.writerow(_export_values(row))
+            pending += 1
+            if pending == EXPORT_CHUNK_ROWS:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        if pending:
+            yield buffer.getvalue()
+
+    @staticmethod
+    def _ndjson_chunks(rows: Iterable[Row]) -> Iterator[str]:
+        lines = []
+        for row in rows:
+            lines.append(json.dumps(
+                dict(zip(EXPORT_COLUMNS, _export_values(row)))))
+            if len(lines) == EXPORT_CHUNK_ROWS:
+                yield "\n".join(lines) + "\n"
+                lines = []
+
+        if lines:
+            yield "\n".join(lines) + "\n"
+
     def create_user_transaction(
         self,
         transaction_data: TransactionCreate,
         user_id: int
-    ) -> Optional[Transaction]:
+    ) -> Optional[TransactionRecord]:
         return create_transaction(
             db=self.db,
             transaction=transaction_data,
             user_id=user_id
         )
 
-    def get_all_user_transactions_for_summary(
+    def import_user_transactions(
         self,
         user_id: int,
-        category_id: Optional[int] = None,
-        from_date: Optional[date] = None,
-        to_date: Optional[date] = None
-    ) -> List[Transaction]:
-        return get_transactions_for_user(
+        rows: List[Any]
+    ) -> BulkImportResponse:
+        """Validate every row, then insert the valid ones in chunks.
+
+        Invalid rows are reported by their 1-based position and never stop
+        the rest of the import.
+        """
+        settings = get_settings()
+        errors = []
+        validated = []
+
+        for number, row in enumerate(rows, start=1):
+            try:
+                validated.append((number, TransactionCreate.model_validate(row)))
+            except ValidationError as error:
+                errors.append(BulkImportRowError(
+                    row=number, errors=_validation_messages(error)))
+
+        accessible = get_accessible_category_ids(
+            self.db,
+            {transaction.category_id for _, transaction in validated},
+            user_id
+        )
+
+        transactions = []
+        for number, transaction in validated:
+            if transaction.category_id in accessible:
+                transactions.append(transaction)
+            else:
+                errors.append(BulkImportRowError(
+                    row=number, errors=["category_id: Invalid category ID."]))
+
+        created = bulk_create_transactions(
             db=self.db,
+            transactions=transactions,
             user_id=user_id,
-            offset=0,
-            limit=None,  # No limit for summary calculations
-            category_id=category_id,
-            min_amount=None,
-            max_amount=None,
-            from_date=from_date,
-            to_date=to_date,
-            category_type=None,
-            description_query=None,
-            sort_by="date",
-            order="desc"
+            chunk_size=settings.bulk_import_chunk_size
+        )
+
+        errors.sort(key=lambda error: error.row)
+        return BulkImportResponse(
+            created=created,
+            failed=len(errors),
+            errors=errors
         )
 
     def update_user_transaction(
@@ -97,7 +369,7 @@ class TransactionService:
         transaction_id: int,
         transaction_data: TransactionUpdate,
         user_id: int
-    ) -> Optional[Transaction]:
+    ) -> Optional[TransactionRecord]:
         return update_transaction(
             db=self.db,
             transaction_id=transaction_id,
@@ -116,7 +388,32 @@ class TransactionService:
             user_id=user_id
         )
 
-    def create_initial_transaction(self, user_id: int) -> Optional[Transaction]:
+    def update_user_transactions(
+        self,
+        selection: TransactionBulkUpdate,
+        user_id: int
+    ) -> Optional[int]:
+        return bulk_update_transactions(
+            db=self.db,
+            user_id=user_id,
+            changes=selection.changes.model_dump(exclude_none=True),
+            ids=selection.ids,
+            filters=selection.filter_values()
+        )
+
+    def delete_user_transactions(
+        self,
+        selection: TransactionBulkSelection,
+        user_id: int
+    ) -> int:
+        return bulk_delete_transactions(
+            db=self.db,
+            user_id=user_id,
+            ids=selection.ids,
+            filters=selection.filter_values()
+        )
+
+    def create_initial_transaction(self, user_id: int) -> Optional[TransactionRecord]:
         settings = get_settings()
 
         if not self.category_service:
@@ -142,3 +439,102 @@ class TransactionService:
             )
 
         return None
+
+
+class AsyncTransactionService(AsyncServiceAdapter[TransactionService]):
+    """TransactionService for async endpoints."""
+
+    def _build_service(self, session: Session) -> TransactionService:
+        return TransactionService(session, CategoryService(session))
+
+    async def get_user_transaction_rows(
+        self,
+        user_id: int,
+        params: TransactionQueryParams
+    ) -> Optional[List[Row]]:
+        return await self._run(
+            TransactionService.get_user_transaction_rows,
+            user_id=user_id,
+            params=params
+        )
+
+    get_next_cursor = staticmethod(TransactionService.get_next_cursor)
+
+    async def get_user_transaction_changes(
+        self,
+        user_id: int,
+        params: TransactionChangesParams
+    ) -> Optional[TransactionChanges]:
+        return await self._run(
+            TransactionService.get_user_transaction_changes,
+            user_id=user_id,
+            params=params
+        )
+
+    async def get_user_transaction_by_id(
+        self,
+        transaction_id: int,
+        user_id: int
+    ) -> Optional[Transaction]:
+        return await self._run(
+            TransactionService.get_user_transaction_by_id,
+            transaction_id=transaction_id,
+            user_id=user_id
+        )
+
+    async def create_user_transaction(
+        self,
+        transaction_data: TransactionCreate,
+        user_id: int
+    ) -> Optional[TransactionRecord]:
+        return await self._run(
+            TransactionService.create_user_transaction,
+            transaction_data=transaction_data,
+            user_id=user_id
+        )
+
+    async def update_user_transaction(
+        self,
+        transaction_id: int,
+        transaction_data: TransactionUpdate,
+        user_id: int
+    ) -> Optional[TransactionRecord]:
+        return await self._run(
+            TransactionService.update_user_transaction,
+            transaction_id=transaction_id,
+            transaction_data=transaction_data,
+            user_id=user_id
+        )
+
+    async def delete_user_transaction(
+        self,
+        transaction_id: int,
+        user_id: int
+    ) -> bool:
+        return await self._run(
+            TransactionService.delete_user_transaction,
+            transaction_id=transaction_id,
+            user_id=user_id
+        )
+
+    async def update_user_transactions(
+        self,
+        selection: TransactionBulkUpdate,
+        user_id: int
+    ) -> Optional[int]:
+        return await self._run(
+            TransactionService.update_user_transactions,
+            selection=selection,
+            user_id=user_id
+        )
+
+    async def delete_user_transactions(
+        self,
+        selection: TransactionBulkSelection,
+        user_id: int
+    ) -> int:
+        return await self._run(
+            TransactionService.delete_user_transactions,
+            selection=selection,
+            user_id=user_id
+        )
@@ -0,0 +1,129 @@
+"""
+Deterministic synthetic data for the benchmark scenarios.
+
+Users, categories and transactions come from a seeded random generator, so
+the same configuration always produces the same rows. Transactions are
+written with bulk_create_transactions, which keeps the daily rollup (and,
+on a migrated SQLite database, the FTS index) in step with the rows.
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, List
+
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.security import get_password_hash
+from app.crud.transaction import bulk_create_transactions
+from app.models.category import Category, CategoryType
+from app.models.user import User
+from app.schemas.transaction import TransactionCreate
+
+BENCHMARK_PASSWORD = "benchmark-password"
+
+MERCHANTS = ["Grocer", "Cafe", "Fuel", "Pharmacy", "Cinema", "Bookshop",
+             "Airline", "Hotel", "Market", "Bakery", "Electric", "Water"]
+ITEMS = ["weekly", "monthly", "refund", "subscription", "groceries", "tickets",
+         "invoice", "payment", "lunch", "dinner", "repair", "rent"]
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    users: int = 20
+    transactions_per_user: int = 5000
+    categories_per_user: int = 4
+    # Transactions are spread over this many days, ending on end_date
+    days: int = 5 * 365
+    end_date: date = date(2025, 6, 30)
+    seed: int = 42
+    chunk_size: int = 1000
+
+
+@dataclass
+class BenchmarkUser:
+    id: int
+    email: str
+    category_ids: List[int] = field(default_factory=list)
+
+
+@dataclass
+class Dataset:
+    config: DatasetConfig
+    users: List[BenchmarkUser]
+    global_category_ids: Dict[CategoryType, List[int]]
+
+    @property
+    def transactions(self) -> int:
+        return len(self.users) * self.config.transactions_per_user
+
+
+def random_description(rng: random.Random) -> str:
+    return f"{rng.choice(MERCHANTS)} {rng.choice(ITEMS)} {rng.randrange(1000)}"
+
+
+def random_amount(rng: random.Random) -> Decimal:
+    return Decimal(rng.randint(100, 50000)) / 100
+
+
+def generate_dataset(engine: Engine, config: DatasetConfig) -> Dataset:
+    """Fill a database that already has the schema (and seeded globals)."""
+    rng = random.Random(config.seed)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    with Session() as db:
+        global_category_ids = {category_type: [] for category_type in CategoryType}
+        for category_id, category_type in db.execute(
+            select(Category.id, Category.category_type)
+            .where(Category.user_id.is_(None))
+            .order_by(Category.id)
+        ):
+            global_category_ids[category_type].append(category_id)
+
+        # One bcrypt hash shared by every user keeps generation fast
+        hashed_password = get_password_hash(BENCHMARK_PASSWORD)
+        emails = [f"bench-{index}@example.com" for index in range(config.users)]
+        db.execute(insert(User), [
+            {"email": email, "hashed_password": hashed_password,
+             "full_name": f"Benchmark User {index}"}
+            for index, email in enumerate(emails)
+        ])
+        user_ids = dict(db.execute(
+            select(User.email, User.id).where(User.email.in_(emails))).all())
+        users = [BenchmarkUser(id=user_ids[email], email=email) for email in emails]
+        users_by_id = {user.id: user for user in users}
+
+        category_types = list(CategoryType)
+        db.execute(insert(Category), [
+            {"name": f"Custom {index}", "user_id": user.id,
+             "category_type": category_types[index % len(category_types)]}
+            for user in users
+            for index in range(config.categories_per_user)
+        ])
+        for user_id, category_id in db.execute(
+            select(Category.user_id, Category.id)
+            .where(Category.user_id.in_([user.id for user in users]))
+            .order_by(Category.id)
+        ):
+            users_by_id[user_id].category_ids.append(category_id)
+        db.commit()
+
+        all_global_ids = [category_id for ids in global_category_ids.values()
+                          for category_id in ids]
+        for user in users:
+            choices = all_global_ids + user.category_ids
+            # Categories were validated by the queries above
+            transactions = [
+                TransactionCreate.model_construct(
+                    category_id=rng.choice(choices),
+                    description=random_description(rng),
+                    amount=random_amount(rng),
+                    date=config.end_date - timedelta(days=rng.randrange(config.days))
+                )
+                for _ in range(config.transactions_per_user)
+            ]
+            bulk_create_transactions(db, transactions, user.id, config.chunk_size)
+
+    return Dataset(config=config, users=users, global_category_ids=global_category_ids)
@@ -0,0 +1,118 @@
+"""
+Run the load scenarios against a freshly generated database and print a
+JSON report with p50/p95/p99 latency, throughput and peak RSS.
+
+The database is migrated with Alembic (schema, seeded global categories,
+FTS index) and filled by benchmarks.data, then the app is driven in-process
+over ASGI. Identical arguments replay identical data and requests.
+
+    python -m benchmarks.load_test --users 20 --transactions-per-user 5000 --output report.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def migrate() -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(os.path.join(ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ROOT, "alembic"))
+    command.upgrade(config, "head")
+
+
+def build_report(args: argparse.Namespace, database_path: str) -> dict:
+    # Settings are read on import, so the app only loads after DATABASE_URL is set
+    os.environ["DATABASE_URL"] = f"sqlite:///{database_path}"
+    migrate()
+
+    from app.db.session import async_engine, async_read_engine, engine
+    from app.main import app
+    from benchmarks.data import DatasetConfig, generate_dataset
+    from benchmarks.scenarios import SCENARIOS, issue_tokens, peak_rss_mib, run_scenario
+
+    # Per-request log lines would dominate the output
+    logging.getLogger("app.core.request_timing").setLevel(logging.ERROR)
+
+    config = DatasetConfig(users=args.users,
+                           transactions_per_user=args.transactions_per_user,
+                           seed=args.seed)
+    started = time.perf_counter()
+    dataset = generate_dataset(engine, config)
+    setup_seconds = time.perf_counter() - started
+    tokens = issue_tokens(dataset)
+
+    selected = set(args.scenarios.split(",")) if args.scenarios else None
+
+    # One event loop for every scenario: pooled async connections are bound to it
+    async def run_all() -> dict:
+        try:
+            return {
+                scenario.name: await run_scenario(
+                    app, scenario, dataset, tokens,
+                    requests=args.requests, concurrency=args.concurrency, seed=args.seed)
+                for scenario in SCENARIOS
+                if selected is None or scenario.name in selected
+            }
+        finally:
+            # aiosqlite connections run on non-daemon threads that would
+            # keep the interpreter from exiting
+            await async_engine.dispose()
+            if async_read_engine is not async_engine:
+                await async_read_engine.dispose()
+
+    results = asyncio.run(run_all())
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "dataset": {**asdict(config), "end_date": config.end_date.isoformat(),
+                    "transactions": dataset.transactions,
+                    "setup_seconds": round(setup_seconds, 2)},
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "scenarios": results,
+        "peak_rss_mib": round(peak_rss_mib(), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--transactions-per-user", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=200,
+                        help="requests per scenario before its weight is applied")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenarios", default="",
+                        help="comma-separated scenario names, all when empty")
+    parser.add_argument("--output", help="write the report here instead of stdout")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        report = build_report(args, os.path.join(directory, "benchmark.db"))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Performance regression gate for the transaction and summary endpoints.
+
+A fast subset of the load scenarios runs through a TestClient against the
+test database. Latency percentiles and the SQL statement count from the
+Server-Timing header are compared with benchmarks/baseline.json, whose
+per-metric tolerances decide what counts as a regression.
+
+Wall-clock latency depends on the host, so by default only the
+deterministic metrics (the statement count) are gated; latencies are still
+measured and reported.
+
+    pytest tests/performance                     # check against the baseline
+    pytest tests/performance --gate-latency      # also gate p50/p95 latency
+    pytest tests/performance --update-baseline   # record a new baseline
+"""
+import json
+import os
+import random
+import re
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple
+
+from benchmarks.data import MERCHANTS, Dataset, DatasetConfig
+from benchmarks.scenarios import issue_tokens, percentile
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+GATE_DATASET = DatasetConfig(users=2, transactions_per_user=1500, categories_per_user=2)
+GATE_REQUESTS = 40
+
+# Allowed growth over the baseline: `ratio` of the baseline value, but never
+# less than `minimum`, so near-zero timings do not fail on noise
+DEFAULT_TOLERANCES = {
+    "p50_ms": {"ratio": 1.0, "minimum": 5.0},
+    "p95_ms": {"ratio": 1.5, "minimum": 10.0},
+    "queries": {"ratio": 0.0, "minimum": 0},
+}
+
+# Metrics that do not depend on the speed of the machine running the gate
+DETERMINISTIC_METRICS = ("queries",)
+
+_QUERIES_PATTERN = re.compile(r'queries;desc="(\d+)"')
+
+RequestBuilder = Callable[[random.Random, Dataset], Tuple[str, Dict[str, Any]]]
+
+
+def _window(rng: random.Random, end: date, days: int) -> Dict[str, str]:
+    to_date = end - timedelta(days=rng.randrange(30))
+    return {"from_date": (to_date - timedelta(days=days)).isoformat(),
+            "to_date": to_date.isoformat()}
+
+
+GATE_SCENARIOS: Dict[str, RequestBuilder] = {
+    "transactions_first_page": lambda rng, dataset: (
+        "/transactions/", {"limit": 50}),
+    "transactions_description_search": lambda rng, dataset: (
+        "/transactions/", {"limit": 50, "description_query": rng.choice(MERCHANTS)}),
+    "transactions_amount_filter": lambda rng, dataset: (
+        "/transactions/", {"limit": 50, "min_amount": "100", "max_amount": "250",
+                           "sort_by": "amount"}),
+    "summary_12_months": lambda rng, dataset: (
+        "/summary/", _window(rng, dataset.config.end_date, 365)),
+    "summary_60_months": lambda rng, dataset: (
+        "/summary/", _window(rng, dataset.config.end_date, 5 * 365)),
+}
+
+
+def measure(client, dataset: Dataset, requests: int = GATE_REQUESTS,
+            seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Run every gate scenario `requests` times through a (Test)Client."""
+    tokens = issue_tokens(dataset)
+    results = {}
+    for name, build_request in GATE_SCENARIOS.items():
+        rng = random.Random(f"{seed}:{name}")
+        latencies: List[float] = []
+        queries = 0
+        for _ in range(requests):
+            user = rng.choice(dataset.users)
+            path, params = build_request(rng, dataset)
+            started = time.perf_counter()
+            response = client.get(path, params=params, headers={
+                "Authorization": f"Bearer {tokens[user.id]}"})
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+            match = _QUERIES_PATTERN.search(response.headers.get("server-timing", ""))
+            # Cached responses run fewer statements; the gate tracks the uncached path
+            queries = max(queries, int(match.group(1)) if match else 0)
+
+        latencies.sort()
+        results[name] = {
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+            "queries": queries,
+        }
+    return results
+
+
+@dataclass(frozen=True)
+class Comparison:
+    scenario: str
+    metric: str
+    baseline: Optional[float]
+    current: float
+    limit: Optional[float]
+
+    @property
+    def regressed(self) -> bool:
+        return self.limit is not None and self.current > self.limit
+
+
+def compare(baseline: Dict[str, Any], results: Dict[str, Dict[str, float]],
+            gated: Optional[Collection[str]] = None) -> List[Comparison]:
+    """Compare results with the baseline; only `gated` metrics (all when
+    None) get a limit, the others are reported without one."""
+    tolerances = {**DEFAULT_TOLERANCES, **baseline.get("tolerances", {})}
+    recorded = baseline.get("scenarios", {})
+    comparisons = []
+    for scenario, metrics in results.items():
+        for metric, current in metrics.items():
+            previous = recorded.get(scenario, {}).get(metric)
+            limit = None
+            if (previous is not None and metric in tolerances
+                    and (gated is None or metric in gated)):
+                tolerance = tolerances[metric]
+                limit = previous + max(previous * tolerance["ratio"], tolerance["minimum"])
+            comparisons.append(Comparison(scenario, metric, previous, current, limit))
+    return comparisons
+
+
+def format_comparisons(comparisons: List[Comparison]) -> str:
+    """A table of every metric, regressions marked, for assertion output."""
+    rows = [("scenario", "metric", "baseline", "current", "limit", "")]
+    for item in comparisons:
+        rows.append((
+            item.scenario, item.metric,
+            "-" if item.baseline is None else f"{item.baseline:g}",
+            f"{item.current:g}",
+            "-" if item.limit is None else f"{item.limit:g}",
+            "REGRESSED" if item.regressed else (
+                "new" if item.baseline is None else
+                "not gated" if item.limit is None else "ok"),
+        ))
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(value.ljust(width) for value, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def write_baseline(results: Dict[str, Dict[str, float]], path: str = BASELINE_PATH) -> None:
+    """Replace the recorded metrics, keeping hand-edited tolerances."""
+    baseline = {
+        "tolerances": load_baseline(path).get("tolerances", DEFAULT_TOLERANCES),
+        "dataset": {"users": GATE_DATASET.users,
+                    "transactions_per_user": GATE_DATASET.transactions_per_user,
+                    "requests": GATE_REQUESTS},
+        "scenarios": results,
+    }
+    with open(path, "w") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
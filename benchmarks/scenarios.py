@@ -0,0 +1,195 @@
+"""
+Load scenarios driven in-process through the ASGI app.
+
+Each scenario runs a fixed number of requests from `concurrency` workers
+sharing one httpx client. Workers draw their parameters from their own
+seeded random generator, so a run replays the same request sequence.
+"""
+import asyncio
+import math
+import random
+import resource
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from app.core.security import create_access_token
+from benchmarks.data import (
+    BENCHMARK_PASSWORD, MERCHANTS, Dataset, random_amount, random_description
+)
+
+BULK_ROWS_PER_REQUEST = 100
+
+
+@dataclass
+class WorkerState:
+    rng: random.Random
+    dataset: Dataset
+    tokens: Dict[int, str]
+    values: Dict[str, Any] = field(default_factory=dict)
+
+    def user(self):
+        return self.rng.choice(self.dataset.users)
+
+    def headers(self, user) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens[user.id]}"}
+
+
+Operation = Callable[[httpx.AsyncClient, WorkerState], Awaitable[httpx.Response]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    operation: Operation
+    # Scales the default request count for slow or heavy operations
+    weight: float = 1.0
+
+
+async def login(client: httpx.AsyncClient, state: WorkerState) -> httpx.Response:
+    return await client.post("/auth/token", data={
+        "username": state.user().email, "password": BENCHMARK_PASSWORD})
+
+
+async def list_pagination(client: httpx.AsyncClient, state: WorkerState) -> httpx.Response:
+    # Each worker walks one user's pages and starts over at the last page
+    if state.values.get("cursor") is None:
+        state.values["user"] = state.user()
+    user = state.values["user"]
+    params = {"limit": 50}
+    if state.values.get("cursor"):
+        params["cursor"] = state.values["cursor"]
+    response = await client.get("/transactions/", params=params, headers=state.headers(user))
+    state.values["cursor"] = response.headers.get("x-next-cursor")
+    return response
+
+
+async def filtered_search(client: httpx.AsyncClient, state: WorkerState) -> httpx.Response:
+    rng = state.rng
+    user = state.user()
+    end_date = state.dataset.config.end_date - timedelta(days=rng.randrange(365))
+    params = {
+        "limit": 50,
+        "from_date": (end_date - timedelta(days=365)).isoformat(),
+        "to_date": end_date.isoformat(),
+    }
+    choice = rng.randrange(3)
+    if choice == 0:
+        params["description_query"] = rng.choice(MERCHANTS)
+    elif choice == 1:
+        params["category_id"] = rng.choice(user.category_ids)
+    else:
+        params["min_amount"] = "100"
+        params["max_amount"] = "250"
+        params["sort_by"] = "amount"
+    return await client.get("/transactions/", params=params, headers=state.headers(user))
+
+
+def summary(months: int) -> Operation:
+    async def operation(client: httpx.AsyncClient, state: WorkerState) -> httpx.Response:
+        user = state.user()
+        # Moving the window keeps most requests off the summary cache
+        to_date = state.dataset.config.end_date - timedelta(days=state.rng.randrange(60))
+        from_date = to_date - timedelta(days=round(months * 30.44))
+        return await client.get("/summary/", headers=state.headers(user), params={
+            "from_date": from_date.isoformat(), "to_date": to_date.isoformat()})
+    return operation
+
+
+async def bulk_write(client: httpx.AsyncClient, state: WorkerState) -> httpx.Response:
+    rng = state.rng
+    user = state.user()
+    end_date = state.dataset.config.end_date
+    rows = [
+        {
+            "category_id": rng.choice(user.category_ids),
+            "description": random_description(rng),
+            "amount": str(random_amount(rng)),
+            "date": (end_date - timedelta(days=rng.randrange(365))).isoformat()
+        }
+        for _ in range(BULK_ROWS_PER_REQUEST)
+    ]
+    return await client.post("/transactions/bulk", json=rows, headers=state.headers(user))
+
+
+SCENARIOS = [
+    Scenario("login_storm", login, weight=0.5),
+    Scenario("list_pagination", list_pagination),
+    Scenario("filtered_search", filtered_search),
+    Scenario("summary_1_month", summary(1)),
+    Scenario("summary_12_months", summary(12)),
+    Scenario("summary_60_months", summary(60)),
+    Scenario("bulk_writes", bulk_write, weight=0.25),
+]
+
+
+def issue_tokens(dataset: Dataset) -> Dict[int, str]:
+    """Tokens for every user, so only login_storm pays for bcrypt."""
+    return {user.id: create_access_token(subject=user.email, user_id=user.id)
+            for user in dataset.users}
+
+
+def percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _milliseconds(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value * 1000, 3)
+
+
+async def run_scenario(app, scenario: Scenario, dataset: Dataset, tokens: Dict[int, str],
+                       requests: int, concurrency: int, seed: int) -> Dict[str, Any]:
+    total = max(1, round(requests * scenario.weight))
+    latencies: List[float] = []
+    errors = 0
+    issued = 0
+
+    async def worker(index: int) -> None:
+        nonlocal errors, issued
+        state = WorkerState(rng=random.Random(f"{seed}:{scenario.name}:{index}"),
+                            dataset=dataset, tokens=tokens)
+        while issued < total:
+            issued += 1
+            started = time.perf_counter()
+            try:
+                response = await scenario.operation(client, state)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(index) for index in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "mean_ms": _milliseconds(sum(latencies) / len(latencies)),
+        "p50_ms": _milliseconds(percentile(latencies, 50)),
+        "p95_ms": _milliseconds(percentile(latencies, 95)),
+        "p99_ms": _milliseconds(percentile(latencies, 99)),
+        # Process-wide high-water mark at the end of the scenario
+        "peak_rss_mib": round(peak_rss_mib(), 1),
+    }
@@ -0,0 +1,102 @@
+"""
+Compare the per-row cost of serializing a transaction list page through
+ORM objects and the response model with the column-row orjson path used by
+GET /transactions/.
+
+The model path mirrors FastAPI: validate from attributes, dump in JSON mode,
+then json.dumps as JSONResponse renders it.
+
+    python -m benchmarks.serialization --rows 1000 --repeat 50
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, Dict, List, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.crud.transaction import get_transaction_rows_for_user, get_transactions_for_user
+from app.db.base import Base
+from app.schemas.transaction import TransactionResponse
+from app.services.transaction_service import serialize_transaction_rows
+from benchmarks.data import DatasetConfig, generate_dataset
+
+RESPONSE_ADAPTER = TypeAdapter(List[TransactionResponse])
+
+
+def model_path(db, user_id: int, rows: int) -> Tuple[float, float, bytes]:
+    started = time.perf_counter()
+    transactions = get_transactions_for_user(db, user_id, limit=rows)
+    fetched = time.perf_counter()
+    content = json.dumps(
+        RESPONSE_ADAPTER.dump_python(
+            RESPONSE_ADAPTER.validate_python(transactions, from_attributes=True),
+            mode="json"),
+        ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+    return fetched - started, time.perf_counter() - fetched, content
+
+
+def row_path(db, user_id: int, rows: int) -> Tuple[float, float, bytes]:
+    started = time.perf_counter()
+    transaction_rows = get_transaction_rows_for_user(db, user_id, limit=rows)
+    fetched = time.perf_counter()
+    content = serialize_transaction_rows(transaction_rows)
+    return fetched - started, time.perf_counter() - fetched, content
+
+
+def measure(Session, user_id: int, rows: int, repeat: int,
+            path: Callable) -> Dict[str, float]:
+    fetch, serialize = [], []
+    for _ in range(repeat):
+        # A fresh session per page, as each request gets
+        with Session() as db:
+            fetch_seconds, serialize_seconds, _ = path(db, user_id, rows)
+        fetch.append(fetch_seconds)
+        serialize.append(serialize_seconds)
+
+    per_row = 1_000_000 / rows
+    return {
+        "fetch_us_per_row": statistics.median(fetch) * per_row,
+        "serialize_us_per_row": statistics.median(serialize) * per_row,
+        "total_us_per_row": statistics.median(
+            [a + b for a, b in zip(fetch, serialize)]) * per_row,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000, help="rows per page")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool,
+                           connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    dataset = generate_dataset(engine, DatasetConfig(
+        users=1, transactions_per_user=args.rows, categories_per_user=4))
+    user_id = dataset.users[0].id
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    with Session() as db:
+        assert model_path(db, user_id, args.rows)[2] == row_path(db, user_id, args.rows)[2], \
+            "both paths must produce the same document"
+
+    results = {
+        "model": measure(Session, user_id, args.rows, args.repeat, model_path),
+        "rows": measure(Session, user_id, args.rows, args.repeat, row_path),
+    }
+    for label, stats in results.items():
+        print(f"{label:6} fetch {stats['fetch_us_per_row']:7.2f} us/row"
+              f"  serialize {stats['serialize_us_per_row']:7.2f} us/row"
+              f"  total {stats['total_us_per_row']:7.2f} us/row")
+    speedup = results["model"]["total_us_per_row"] / results["rows"]["total_us_per_row"]
+    print(f"rows path is {speedup:.1f}x faster per row")
+
+
+if __name__ == "__main__":
+    main()
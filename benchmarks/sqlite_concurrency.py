@@ -0,0 +1,150 @@
+"""
+Compare SQLite read/write concurrency with default settings and with the
+tuned PRAGMAs from app/db/sqlite.py.
+
+Writer threads create transactions through the CRUD layer, which includes
+the rollup upsert and FTS triggers. Reader threads list transactions and
+build the summary aggregates. Each configuration gets a fresh database file.
+
+    python -m benchmarks.sqlite_concurrency --seconds 10 --readers 8 --writers 2
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, List
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.crud.summary import get_category_totals
+from app.crud.transaction import create_transaction, get_transactions_for_user
+from app.db.base import Base
+from app.db.sqlite import install_sqlite_pragmas, sqlite_pragmas
+from app.models.category import Category, CategoryType
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.schemas.transaction import TransactionCreate
+
+
+def build_engine(path: str, tuned: bool) -> Engine:
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    if tuned:
+        install_sqlite_pragmas(engine, sqlite_pragmas(get_settings()))
+    return engine
+
+
+def seed(engine: Engine, rows: int) -> tuple:
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        user = User(email="bench@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        category = Category(
+            name="Bench", category_type=CategoryType.expense, user_id=user.id)
+        db.add(category)
+        db.flush()
+        start = date(2024, 1, 1)
+        db.execute(insert(Transaction), [
+            {
+                "user_id": user.id,
+                "category_id": category.id,
+                "description": f"Seed transaction {index}",
+                "amount": Decimal(index % 500) + Decimal("0.99"),
+                "date": start + timedelta(days=index % 365)
+            }
+            for index in range(rows)
+        ])
+        db.commit()
+        return user.id, category.id
+
+
+def run(engine: Engine, user_id: int, category_id: int,
+        seconds: float, readers: int, writers: int) -> Dict[str, dict]:
+    Session = sessionmaker(bind=engine, autoflush=False)
+    latencies: Dict[str, List[float]] = {"read": [], "write": []}
+    errors = {"read": 0, "write": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def loop(kind: str, operation) -> None:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                operation()
+            except OperationalError:
+                with lock:
+                    errors[kind] += 1
+                continue
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies[kind].append(elapsed)
+
+    def read() -> None:
+        with Session() as db:
+            get_transactions_for_user(db, user_id, limit=50)
+            get_category_totals(db, user_id)
+
+    payload = TransactionCreate(
+        category_id=category_id, description="Benchmark write",
+        amount=Decimal("12.34"), date=date(2024, 6, 1))
+
+    def write() -> None:
+        with Session() as db:
+            create_transaction(db, payload, user_id)
+
+    threads = (
+        [threading.Thread(target=loop, args=("read", read)) for _ in range(readers)]
+        + [threading.Thread(target=loop, args=("write", write)) for _ in range(writers)]
+    )
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    report = {}
+    for kind, values in latencies.items():
+        values.sort()
+        report[kind] = {
+            "ops_per_second": len(values) / seconds,
+            "p50_ms": statistics.median(values) * 1000 if values else None,
+            "p95_ms": values[int(len(values) * 0.95)] * 1000 if values else None,
+            "errors": errors[kind]
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    for label, tuned in (("default", False), ("tuned", True)):
+        with tempfile.TemporaryDirectory() as directory:
+            engine = build_engine(os.path.join(directory, "bench.db"), tuned)
+            user_id, category_id = seed(engine, args.rows)
+            report = run(engine, user_id, category_id,
+                         args.seconds, args.readers, args.writers)
+            engine.dispose()
+
+        for kind, stats in report.items():
+            p50 = f"{stats['p50_ms']:.2f}" if stats["p50_ms"] is not None else "-"
+            p95 = f"{stats['p95_ms']:.2f}" if stats["p95_ms"] is not None else "-"
+            print(f"{label:8} {kind:5} {stats['ops_per_second']:9.1f} ops/s"
+                  f"  p50 {p50:>8} ms  p95 {p95:>8} ms  errors {stats['errors']}")
+
+
+if __name__ == "__main__":
+    main()
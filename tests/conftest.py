@@ -1,28 +1,97 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 from app.main import app
+from app.core.cache import recent_writes
+from app.core.deps import user_cache
+from app.core.category_cache import global_categories, user_categories
 from app.db.base import Base
-from app.db.session import get_db
+from app.core.config import get_settings
+from app.core.request_timing import instrument_engine
+from app.db.session import get_async_db, get_async_reader_db, get_db, get_reader_db
+from app.db.sqlite import install_sqlite_pragmas, sqlite_pragmas
+from app.services.summary_service import summary_cache
 
-# Test database URL (in-memory SQLite)
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Test database file, shared by the sync and async engines (an in-memory
+# database would be private to each connection). Derived from the pid so
+# every import of this module points at the same file.
+TEST_DATABASE_PATH = os.path.join(
+    tempfile.gettempdir(), f"homebudget-test-{os.getpid()}.db")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{TEST_DATABASE_PATH}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_DATABASE_PATH}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
+install_sqlite_pragmas(engine, sqlite_pragmas(get_settings()))
 TestingSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    poolclass=NullPool,
+)
+install_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas(get_settings()))
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Read-only connections to the same file, standing in for a replica
+read_engine = create_engine(
+    f"sqlite:///file:{TEST_DATABASE_PATH}?mode=ro&uri=true",
+    connect_args={"check_same_thread": False},
+)
+install_sqlite_pragmas(read_engine, sqlite_pragmas(get_settings(), read_only=True))
+TestingReadSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=read_engine)
+
+async_read_engine = create_async_engine(
+    f"sqlite+aiosqlite:///file:{TEST_DATABASE_PATH}?mode=ro&uri=true",
+    poolclass=NullPool,
+)
+install_sqlite_pragmas(async_read_engine.sync_engine,
+                       sqlite_pragmas(get_settings(), read_only=True))
+TestingAsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine, autoflush=False, expire_on_commit=False)
+
+for test_engine in (engine, async_engine.sync_engine,
+                    read_engine, async_read_engine.sync_engine):
+    instrument_engine(test_engine)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-baseline", action="store_true", default=False,
+        help="Record benchmarks/baseline.json instead of checking against it")
+    parser.addoption(
+        "--gate-latency", action="store_true", default=False,
+        help="Also fail the performance gate on p50/p95 latency regressions")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    read_engine.dispose()
+    engine.dispose()
+    if os.path.exists(TEST_DATABASE_PATH):
+        os.remove(TEST_DATABASE_PATH)
+
 
 @pytest.fixture
 def db_session():
     """Create a fresh database session for each test."""
+    # Process-wide caches would otherwise leak rows between test databases
+    summary_cache.clear()
+    recent_writes.clear()
+    user_cache.clear()
+    global_categories.clear()
+    user_categories.clear()
     Base.metadata.create_all(bind=engine)
     session = TestingSessionLocal()
     try:
@@ -41,12 +110,45 @@ def client(db_session):
         finally:
             pass
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
+    def override_get_reader_db():
+        db = TestingReadSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_reader_db():
+        async with TestingAsyncReadSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_reader_db] = override_get_reader_db
+    app.dependency_overrides[get_async_reader_db] = override_get_async_reader_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def async_statements():
+    """SQL statements run by API requests, split by reader and writer engine."""
+    captured = {"reader": [], "writer": []}
+    listeners = []
+    for name, target in (("reader", async_read_engine), ("writer", async_engine)):
+        def record(conn, cursor, statement, *args, name=name):
+            captured[name].append(statement)
+        event.listen(target.sync_engine, "before_cursor_execute", record)
+        listeners.append((target.sync_engine, record))
+    yield captured
+    for target, record in listeners:
+        event.remove(target, "before_cursor_execute", record)
+
+
 @pytest.fixture
 def sample_user_data():
     """Sample user data for testing."""
@@ -148,3 +250,19 @@ def create_transaction_schema(category_id, description="Test transaction", amoun
             data["date"] = date
 
     return TransactionCreate(**data)
+
+
+@contextmanager
+def count_statements(db_session):
+    """Collect the SQL statements executed on the session's engine."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -177,6 +177,22 @@ class TestLoginEndpoint:
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
+    def test_login_when_hashing_pool_is_full(self, client, sample_user_data, monkeypatch):
+        """Test logins are refused with 503 while the hashing pool is saturated."""
+        from app.core.password_hashing import password_hasher
+
+        client.post("/auth/register", json=sample_user_data)
+        monkeypatch.setattr(password_hasher, "max_workers", 0)
+        monkeypatch.setattr(password_hasher, "max_queue", 0)
+
+        response = client.post("/auth/token", data={
+            "username": sample_user_data["email"],
+            "password": sample_user_data["password"]
+        })
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "1"
+
 
 class TestMeEndpoint:
     """Test the /auth/me endpoint."""
@@ -268,3 +284,17 @@ class TestMeEndpoint:
         for headers in malformed_headers:
             response = client.get("/auth/me", headers=headers)
             assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_legacy_token_without_user_id(self, client, sample_user_data):
+        """Test tokens issued before the uid claim keep working."""
+        from app.core.security import create_access_token
+
+        client.post("/auth/register", json=sample_user_data)
+        legacy_token = create_access_token(subject=sample_user_data["email"])
+
+        response = client.get(
+            "/transactions/",
+            headers={"Authorization": f"Bearer {legacy_token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
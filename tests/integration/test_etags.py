@@ -0,0 +1,141 @@
+from fastapi import status
+
+from app.crud.user import bump_user_data_version
+from app.models.category import Category
+from tests.conftest import (
+    authenticate_user, create_test_category, create_test_transaction_data
+)
+
+
+def _auth(token, etag=None):
+    headers = {"Authorization": f"Bearer {token}"}
+    if etag:
+        headers["If-None-Match"] = etag
+    return headers
+
+
+class TestConditionalGets:
+    """Test ETag / If-None-Match on the polled list endpoints."""
+
+    def test_list_endpoints_send_etag(self, client, sample_user_data):
+        """Test every polled endpoint tags its 200 response."""
+        token = authenticate_user(client, sample_user_data)
+
+        for path in ("/transactions/", "/categories/", "/summary/", "/summary/series"):
+            response = client.get(path, headers=_auth(token))
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["etag"].startswith('W/"')
+            assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_matching_etag_returns_304(self, client, sample_user_data):
+        """Test a matching If-None-Match gets an empty 304."""
+        token = authenticate_user(client, sample_user_data)
+
+        for path in ("/transactions/", "/categories/", "/summary/", "/summary/series"):
+            etag = client.get(path, headers=_auth(token)).headers["etag"]
+
+            response = client.get(path, headers=_auth(token, etag))
+
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+
+    def test_304_skips_main_query(self, client, sample_user_data):
+        """Test a revalidation runs only the data version lookup."""
+        token = authenticate_user(client, sample_user_data)
+        etag = client.get("/transactions/", headers=_auth(token)).headers["etag"]
+
+        response = client.get("/transactions/", headers=_auth(token, etag))
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["server-timing"].endswith('queries;desc="1"')
+
+    def test_write_changes_etag(self, client, sample_user_data):
+        """Test a committed write retires every tag the user holds."""
+        token = authenticate_user(client, sample_user_data)
+        paths = ("/transactions/", "/categories/", "/summary/")
+        etags = {path: client.get(path, headers=_auth(token)).headers["etag"]
+                 for path in paths}
+
+        category_id = create_test_category(client, token)
+        client.post("/transactions/", json=create_test_transaction_data(category_id),
+                    headers=_auth(token))
+
+        for path in paths:
+            response = client.get(path, headers=_auth(token, etags[path]))
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["etag"] != etags[path]
+
+    def test_update_changes_etag(self, client, sample_user_data):
+        """Test an update that keeps row count and dates still moves the tag."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+        transaction = client.post(
+            "/transactions/", json=create_test_transaction_data(category_id),
+            headers=_auth(token)).json()
+        etag = client.get("/transactions/", headers=_auth(token)).headers["etag"]
+
+        client.put(f"/transactions/{transaction['id']}",
+                   json={"description": "Renamed"}, headers=_auth(token))
+
+        response = client.get("/transactions/", headers=_auth(token, etag))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["description"] == "Renamed"
+
+    def test_etag_depends_on_query(self, client, sample_user_data):
+        """Test a tag from one filter does not validate another."""
+        token = authenticate_user(client, sample_user_data)
+        etag = client.get("/transactions/?limit=10", headers=_auth(token)).headers["etag"]
+
+        response = client.get("/transactions/?limit=20", headers=_auth(token, etag))
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_etag_is_per_user(self, client, sample_user_data):
+        """Test another user's tag does not validate, even at the same version."""
+        token = authenticate_user(client, sample_user_data)
+        other_token = authenticate_user(client, {
+            **sample_user_data, "email": "other@example.com"})
+        etag = client.get("/summary/", headers=_auth(token)).headers["etag"]
+
+        response = client.get("/summary/", headers=_auth(other_token, etag))
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_anonymous_categories_etag(self, client):
+        """Test the global category list revalidates without a token."""
+        etag = client.get("/categories/").headers["etag"]
+
+        response = client.get("/categories/", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_category_write_from_another_worker(self, client, db_session, sample_user_data):
+        """Test the category list and its tag follow a write this process never saw."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token, name="Groceries")
+        first = client.get("/categories/", headers=_auth(token))
+
+        # Renamed the way another worker would: no in-process invalidation
+        category = db_session.get(Category, category_id)
+        category.name = "Food"
+        bump_user_data_version(db_session, category.user_id)
+        db_session.commit()
+
+        response = client.get("/categories/", headers=_auth(token, first.headers["etag"]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != first.headers["etag"]
+        assert "Food" in [category["name"] for category in response.json()]
+        assert "Groceries" not in [category["name"] for category in response.json()]
+
+    def test_categories_body_and_etag_share_one_version_read(self, client, sample_user_data):
+        """Test the list is served at the version its tag was built from."""
+        token = authenticate_user(client, sample_user_data)
+        create_test_category(client, token)
+        client.get("/categories/", headers=_auth(token))
+
+        response = client.get("/categories/", headers=_auth(token))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["server-timing"].endswith('queries;desc="1"')
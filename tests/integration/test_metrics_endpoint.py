@@ -0,0 +1,30 @@
+from fastapi import status
+
+from app.core.metrics import CONTENT_TYPE, request_metrics
+from tests.conftest import authenticate_user
+
+
+class TestMetricsEndpoint:
+    """Test the Prometheus metrics endpoint."""
+
+    def test_metrics_text_format(self, client):
+        """Test /metrics serves the text exposition format without auth."""
+        response = client.get("/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert "# TYPE homebudget_http_request_duration_seconds histogram" in response.text
+        assert "homebudget_password_hash_workers" in response.text
+
+    def test_requests_counted_per_router(self, client, sample_user_data):
+        """Test API requests are recorded under their router."""
+        token = authenticate_user(client, sample_user_data)
+        before = request_metrics.groups["categories"].latency.count
+
+        client.get("/categories/", headers={"Authorization": f"Bearer {token}"})
+        client.get("/categories/", headers={"Authorization": "Bearer invalid"})
+
+        group = request_metrics.groups["categories"]
+        assert group.latency.count == before + 2
+        response = client.get("/metrics")
+        assert 'homebudget_http_responses_total{router="categories",status="4xx"}' in response.text
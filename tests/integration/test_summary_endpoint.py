@@ -173,3 +173,165 @@ class TestSummaryEndpoint:
         """Test summary endpoint without authentication."""
         response = client.get("/summary/")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestSummarySeriesEndpoint:
+    """Test the summary series endpoint functionality."""
+
+    def _create_transactions(self, client, token):
+        income_category_id = create_test_category(
+            client, token, "Salary", "income")
+        expense_category_id = create_test_category(
+            client, token, "Food", "expense")
+
+        for category_id, description, amount, day in [
+            (income_category_id, "January salary", "1000.00", "2025-01-31"),
+            (expense_category_id, "January food", "200.00", "2025-01-15"),
+            (expense_category_id, "March food", "50.25", "2025-03-02"),
+            (expense_category_id, "March snack", "4.75", "2025-03-03"),
+        ]:
+            response = client.post(
+                "/transactions/",
+                json=create_test_transaction_data(
+                    category_id, description, amount, day),
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+    def test_monthly_series(self, client):
+        """Test monthly buckets including an empty month."""
+        token = authenticate_user(client, {
+            "email": "series_user@example.com",
+            "password": "testpassword123"
+        })
+        self._create_transactions(client, token)
+
+        response = client.get(
+            "/summary/series?bucket=month&from_date=2025-01-01&to_date=2025-03-31",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        series = response.json()
+        assert series["bucket"] == "month"
+
+        points = series["points"]
+        assert [point["period_start"] for point in points] == [
+            "2025-01-01", "2025-02-01", "2025-03-01"]
+        assert Decimal(points[0]["income"]) == Decimal("1000.00")
+        assert Decimal(points[0]["expense"]) == Decimal("200.00")
+        assert Decimal(points[0]["net"]) == Decimal("800.00")
+        assert Decimal(points[1]["net"]) == Decimal("0")
+        assert Decimal(points[2]["expense"]) == Decimal("55.00")
+
+    def test_weekly_series_uses_iso_weeks(self, client):
+        """Test weekly buckets start on Monday."""
+        token = authenticate_user(client, {
+            "email": "weekly_user@example.com",
+            "password": "testpassword123"
+        })
+        self._create_transactions(client, token)
+
+        response = client.get(
+            "/summary/series?bucket=week&from_date=2025-03-01&to_date=2025-03-09",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        points = response.json()["points"]
+        # 2025-03-01 is a Saturday, 2025-03-02 a Sunday, 2025-03-03 a Monday
+        assert [point["period_start"] for point in points] == [
+            "2025-02-24", "2025-03-03"]
+        assert Decimal(points[0]["expense"]) == Decimal("50.25")
+        assert Decimal(points[1]["expense"]) == Decimal("4.75")
+
+    def test_series_without_transactions(self, client):
+        """Test series without data or date range is empty."""
+        token = authenticate_user(client, {
+            "email": "empty_series_user@example.com",
+            "password": "testpassword123"
+        })
+
+        response = client.get(
+            "/summary/series",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"bucket": "month", "points": []}
+
+    def test_series_invalid_bucket(self, client):
+        """Test an unknown bucket size is rejected."""
+        token = authenticate_user(client, {
+            "email": "bad_bucket_user@example.com",
+            "password": "testpassword123"
+        })
+
+        response = client.get(
+            "/summary/series?bucket=decade",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def _get_series(self, client, email, query):
+        token = authenticate_user(client, {"email": email, "password": "testpassword123"})
+        return client.get(f"/summary/series?{query}",
+                          headers={"Authorization": f"Bearer {token}"})
+
+    @pytest.mark.parametrize("path", ["/summary/", "/summary/series"])
+    def test_reversed_date_range_rejected(self, client, path):
+        """Test from_date after to_date is rejected."""
+        token = authenticate_user(client, {
+            "email": "reversed_user@example.com",
+            "password": "testpassword123"
+        })
+
+        response = client.get(
+            f"{path}?from_date=2025-03-01&to_date=2025-01-01",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.parametrize("query", [
+        "bucket=day&from_date=1900-01-01&to_date=2100-12-31",
+        "bucket=week&from_date=0001-01-01&to_date=9999-12-31",
+    ])
+    def test_too_many_buckets_rejected(self, client, query):
+        """Test ranges above the bucket cap are rejected before they are built."""
+        response = self._get_series(client, "wide_range_user@example.com", query)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_too_many_buckets_from_data_rejected(self, client):
+        """Test a range spanned by the data itself is capped as well."""
+        token = authenticate_user(client, {
+            "email": "wide_data_user@example.com",
+            "password": "testpassword123"
+        })
+        category_id = create_test_category(client, token)
+        for day in ["0001-01-01", "9999-12-31"]:
+            client.post("/transactions/", json=create_test_transaction_data(
+                category_id, "Far away", "1.00", day),
+                headers={"Authorization": f"Bearer {token}"})
+
+        response = client.get("/summary/series?bucket=day",
+                              headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.parametrize("bucket, from_date, points", [
+        ("day", "9999-12-25", 7),
+        ("week", "9999-12-01", 5),
+        ("month", "9999-01-01", 12),
+        ("year", "9990-01-01", 10),
+    ])
+    def test_series_ending_at_date_max(self, client, bucket, from_date, points):
+        """Test the last bucket before date.max ends the series without overflow."""
+        response = self._get_series(
+            client, "date_max_user@example.com",
+            f"bucket={bucket}&from_date={from_date}&to_date=9999-12-31")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["points"]) == points
@@ -1,3 +1,6 @@
+import csv
+import io
+import json
 import pytest
 from fastapi import status
 from decimal import Decimal
@@ -528,3 +531,606 @@ class TestTransactionFilters:
         assert transactions[0]["description"] == "Grocery shopping"
         assert transactions[0]["category_type"] == "expense"
         assert float(transactions[0]["amount"]) == 150.00
+
+
+class TestRequestTiming:
+    """Test API responses report request timing."""
+
+    def test_list_reports_server_timing(self, client, sample_user_data):
+        """Test the list endpoint reports its database time and statements."""
+        token = authenticate_user(client, sample_user_data)
+
+        response = client.get(
+            "/transactions/", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == status.HTTP_200_OK
+        timing = response.headers["server-timing"]
+        assert timing.startswith("total;dur=")
+        assert "db;dur=" in timing
+        # The data version behind the ETag, then the page
+        assert timing.endswith('queries;desc="2"')
+
+
+class TestTransactionCursorPagination:
+    """Test keyset pagination with the cursor parameter."""
+
+    def _collect_pages(self, client, token, query):
+        seen = []
+        cursor = None
+        while True:
+            url = f"/transactions/?limit=2&{query}"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = client.get(
+                url, headers={"Authorization": f"Bearer {token}"})
+            assert response.status_code == status.HTTP_200_OK
+            seen.extend(t["id"] for t in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                return seen
+
+    def test_cursor_pages_cover_all_sort_fields(self, client, sample_user_data):
+        """Test walking cursor pages returns every row once in sort order."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+
+        # Duplicate dates and amounts exercise the id tie-breaker
+        for description, amount, day in [
+            ("Coffee", "5.00", "2025-08-01"),
+            ("Book", "20.00", "2025-08-01"),
+            ("Bread", "5.00", "2025-08-02"),
+            ("Apples", "7.50", "2025-08-02"),
+            ("Dinner", "20.00", "2025-08-03"),
+        ]:
+            client.post(
+                "/transactions/",
+                json=create_test_transaction_data(
+                    category_id, description, amount, day),
+                headers={"Authorization": f"Bearer {token}"}
+            )
+
+        for sort_by in ["date", "amount", "description", "last_changed"]:
+            for order in ["asc", "desc"]:
+                query = f"sort_by={sort_by}&order={order}"
+                expected = [t["id"] for t in client.get(
+                    f"/transactions/?{query}",
+                    headers={"Authorization": f"Bearer {token}"}
+                ).json()]
+
+                assert self._collect_pages(client, token, query) == expected
+
+    def test_cursor_is_stable_under_inserts(self, client, sample_user_data):
+        """Test newer inserts do not shift the next page."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for day in ["2025-08-01", "2025-08-02", "2025-08-03"]:
+            client.post("/transactions/", json=create_test_transaction_data(
+                category_id, f"Spent {day}", "10.00", day), headers=headers)
+
+        first_page = client.get("/transactions/?limit=2", headers=headers)
+        cursor = first_page.headers["X-Next-Cursor"]
+
+        client.post("/transactions/", json=create_test_transaction_data(
+            category_id, "Newest", "10.00", "2025-08-04"), headers=headers)
+
+        second_page = client.get(
+            f"/transactions/?limit=2&cursor={cursor}", headers=headers)
+        assert second_page.status_code == status.HTTP_200_OK
+        assert [t["date"] for t in second_page.json()] == ["2025-08-01"]
+        assert "X-Next-Cursor" not in second_page.headers
+
+    def test_cursor_ignores_edits_to_its_row(self, client, sample_user_data):
+        """Test editing the last row of a page does not repeat or skip rows."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for day in ["2025-08-01", "2025-08-02", "2025-08-03", "2025-08-04", "2025-08-05"]:
+            client.post("/transactions/", json=create_test_transaction_data(
+                category_id, f"Spent {day}", "10.00", day), headers=headers)
+
+        first_page = client.get("/transactions/?limit=2", headers=headers)
+        assert [t["date"] for t in first_page.json()] == ["2025-08-05", "2025-08-04"]
+
+        client.put(f"/transactions/{first_page.json()[-1]['id']}",
+                   json={"date": "2025-08-10"}, headers=headers)
+
+        second_page = client.get(
+            f"/transactions/?limit=2&cursor={first_page.headers['X-Next-Cursor']}",
+            headers=headers)
+        assert [t["date"] for t in second_page.json()] == ["2025-08-03", "2025-08-02"]
+
+    def test_non_ascii_description_cursor(self, client, sample_user_data):
+        """Test cursors for long non-ASCII descriptions are accepted back."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+
+        for letter in "ščž":
+            client.post("/transactions/", json=create_test_transaction_data(
+                category_id, letter * 200, "10.00", "2025-08-01"),
+                headers={"Authorization": f"Bearer {token}"})
+
+        assert len(self._collect_pages(client, token, "sort_by=description")) == 3
+
+    def test_invalid_cursor(self, client, sample_user_data):
+        """Test malformed or mismatched cursors are rejected."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for day in ["2025-08-01", "2025-08-02"]:
+            client.post("/transactions/", json=create_test_transaction_data(
+                category_id, "Spent", "10.00", day), headers=headers)
+
+        response = client.get(
+            "/transactions/?cursor=not-a-cursor", headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        cursor = client.get(
+            "/transactions/?limit=1&sort_by=date", headers=headers
+        ).headers["X-Next-Cursor"]
+        response = client.get(
+            f"/transactions/?sort_by=amount&cursor={cursor}", headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestTransactionExport:
+    """Test streaming CSV and NDJSON exports."""
+
+    def _create_transactions(self, client, token):
+        category_id = create_test_category(client, token, "Food", "expense")
+        for description, amount, day in [
+            ("Groceries, weekly", "45.10", "2025-08-01"),
+            ("Coffee", "3.50", "2025-08-02"),
+            ("Dinner", "60.00", "2025-08-03"),
+        ]:
+            client.post(
+                "/transactions/",
+                json=create_test_transaction_data(
+                    category_id, description, amount, day),
+                headers={"Authorization": f"Bearer {token}"}
+            )
+
+    def test_export_csv(self, client, sample_user_data):
+        """Test CSV export streams a header and every transaction."""
+        token = authenticate_user(client, sample_user_data)
+        self._create_transactions(client, token)
+
+        response = client.get(
+            "/transactions/export?format=csv&order=asc",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "transactions.csv" in response.headers["content-disposition"]
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["description"] for row in rows] == [
+            "Groceries, weekly", "Coffee", "Dinner"]
+        assert rows[0]["amount"] == "45.10"
+        assert rows[0]["date"] == "2025-08-01"
+        assert rows[0]["category_name"] == "Food"
+        assert rows[0]["category_type"] == "expense"
+
+    def test_export_ndjson_with_filters(self, client, sample_user_data):
+        """Test NDJSON export honours the list filters."""
+        token = authenticate_user(client, sample_user_data)
+        self._create_transactions(client, token)
+
+        response = client.get(
+            "/transactions/export?format=ndjson&min_amount=40&sort_by=amount&order=desc",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith(
+            "application/x-ndjson")
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["description"] for row in rows] == [
+            "Dinner", "Groceries, weekly"]
+        assert rows[0]["amount"] == "60.00"
+
+    def test_export_is_not_limited_to_one_page(self, client, sample_user_data):
+        """Test the export is not capped by the list page size."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+        for index in range(105):
+            client.post(
+                "/transactions/",
+                json=create_test_transaction_data(
+                    category_id, f"Transaction {index}", "1.00"),
+                headers={"Authorization": f"Bearer {token}"}
+            )
+
+        response = client.get(
+            "/transactions/export?format=ndjson",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.text.splitlines()) == 105
+
+    def test_export_only_own_transactions(self, client, sample_user_data):
+        """Test other users' transactions are never exported."""
+        token = authenticate_user(client, sample_user_data)
+        self._create_transactions(client, token)
+
+        other_token = authenticate_user(client, {
+            "email": "other_exporter@example.com",
+            "password": "testpassword123"
+        })
+        response = client.get(
+            "/transactions/export",
+            headers={"Authorization": f"Bearer {other_token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text.strip() == (
+            "id,date,description,amount,category_id,category_name,category_type,last_changed")
+
+    def test_export_unauthenticated(self, client):
+        """Test export requires authentication."""
+        response = client.get("/transactions/export")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestTransactionBulkImport:
+    """Test importing many transactions in one request."""
+
+    def test_import_json_reports_row_errors(self, client, sample_user_data):
+        """Test valid rows are created and invalid rows reported by position."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+
+        response = client.post(
+            "/transactions/bulk",
+            json=[
+                create_test_transaction_data(category_id, "Rent", "500.00", "2025-08-01"),
+                {"category_id": category_id, "description": "No amount"},
+                create_test_transaction_data(category_id, "Negative", "-1.00"),
+                create_test_transaction_data(999999, "Unknown category", "1.00"),
+                create_test_transaction_data(category_id, "Coffee", "3.50", "2025-08-02"),
+            ],
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["created"] == 2
+        assert data["failed"] == 3
+        assert [error["row"] for error in data["errors"]] == [2, 3, 4]
+        assert data["errors"][0]["errors"][0].startswith("amount")
+        assert data["errors"][2]["errors"] == ["category_id: Invalid category ID."]
+
+        listed = client.get(
+            "/transactions/?sort_by=date&order=asc",
+            headers={"Authorization": f"Bearer {token}"}
+        ).json()
+        assert [item["description"] for item in listed] == ["Rent", "Coffee"]
+
+    def test_import_csv_upload(self, client, sample_user_data):
+        """Test a CSV file upload with a BOM and blank optional cells."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+        content = (
+            "\ufeffcategory_id,description,amount,date\r\n"
+            f"{category_id},Groceries,45.10,2025-08-01\r\n"
+            f"{category_id},No date,3.00,\r\n"
+            f"{category_id},Bad amount,abc,2025-08-01\r\n"
+        ).encode("utf-8")
+
+        response = client.post(
+            "/transactions/bulk",
+            files={"file": ("statement.csv", content, "text/csv")},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["created"] == 2
+        assert data["failed"] == 1
+        assert data["errors"][0]["row"] == 3
+
+        summary = client.get(
+            "/summary/", headers={"Authorization": f"Bearer {token}"}).json()
+        assert Decimal(summary["totals"]["expense"]) == Decimal("48.10")
+
+    def test_import_rejects_other_users_category(self, client, sample_user_data):
+        """Test rows pointing at another user's category are rejected."""
+        owner_token = authenticate_user(client, sample_user_data)
+        foreign_category_id = create_test_category(client, owner_token, "Private")
+
+        token = authenticate_user(client, {
+            "email": "importer@example.com",
+            "password": "testpassword123"
+        })
+        response = client.post(
+            "/transactions/bulk",
+            json=[create_test_transaction_data(foreign_category_id, "Sneaky", "1.00")],
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["created"] == 0
+        assert response.json()["failed"] == 1
+
+    def test_import_invalid_payload(self, client, sample_user_data):
+        """Test a body that is not a list of rows is rejected."""
+        token = authenticate_user(client, sample_user_data)
+
+        response = client.post(
+            "/transactions/bulk",
+            json={"category_id": 1},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_import_row_limit(self, client, sample_user_data, monkeypatch):
+        """Test uploads above the configured row limit are refused."""
+        from app.core.config import get_settings
+        monkeypatch.setattr(get_settings(), "bulk_import_max_rows", 1)
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+
+        response = client.post(
+            "/transactions/bulk",
+            json=[create_test_transaction_data(category_id)] * 2,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    def test_import_unauthenticated(self, client):
+        """Test bulk import requires authentication."""
+        response = client.post("/transactions/bulk", json=[])
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestReadRouting:
+    """Test GET traffic goes to the reader unless the user just wrote."""
+
+    def _create_transaction(self, client, token):
+        category_id = create_test_category(client, token)
+        client.post(
+            "/transactions/",
+            json=create_test_transaction_data(category_id, "Rent", "500.00"),
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+    def test_reads_use_reader_without_recent_writes(self, client, sample_user_data, async_statements, monkeypatch):
+        """Test list and summary reads run on the read-only connection."""
+        from app.core.cache import recent_writes
+        token = authenticate_user(client, sample_user_data)
+        self._create_transaction(client, token)
+        monkeypatch.setattr(recent_writes, "window_seconds", 0)
+        async_statements["reader"].clear()
+        async_statements["writer"].clear()
+
+        listed = client.get(
+            "/transactions/", headers={"Authorization": f"Bearer {token}"})
+        summary = client.get(
+            "/summary/", headers={"Authorization": f"Bearer {token}"})
+
+        assert [item["description"] for item in listed.json()] == ["Rent"]
+        assert summary.status_code == status.HTTP_200_OK
+        assert async_statements["reader"]
+        assert async_statements["writer"] == []
+
+    def test_reads_follow_writes_within_window(self, client, sample_user_data, async_statements):
+        """Test a user's reads go to the writer right after they write."""
+        token = authenticate_user(client, sample_user_data)
+        self._create_transaction(client, token)
+        async_statements["reader"].clear()
+
+        response = client.get(
+            "/transactions/", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert async_statements["reader"] == []
+        assert async_statements["writer"]
+
+    def test_writes_never_use_reader(self, client, sample_user_data, async_statements, monkeypatch):
+        """Test non-GET requests always run on the writer."""
+        from app.core.cache import recent_writes
+        monkeypatch.setattr(recent_writes, "window_seconds", 0)
+        token = authenticate_user(client, sample_user_data)
+        async_statements["reader"].clear()
+
+        self._create_transaction(client, token)
+
+        assert async_statements["reader"] == []
+
+
+class TestTransactionChanges:
+    """Test the delta sync endpoint."""
+
+    def _sync(self, client, token, since=None, limit=None):
+        params = {}
+        if since is not None:
+            params["since"] = since
+        if limit is not None:
+            params["limit"] = limit
+        response = client.get("/transactions/changes", params=params,
+                              headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def _create(self, client, token, category_id, description):
+        response = client.post(
+            "/transactions/",
+            json=create_test_transaction_data(category_id, description),
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        return response.json()["id"]
+
+    def test_full_sync_then_incremental(self, client, sample_user_data):
+        """Test a sync returns only what changed after its token."""
+        token = authenticate_user(client, sample_user_data)
+        headers = {"Authorization": f"Bearer {token}"}
+        category_id = create_test_category(client, token)
+        kept = self._create(client, token, category_id, "Kept")
+        removed = self._create(client, token, category_id, "Removed")
+
+        full = self._sync(client, token)
+        assert {item["id"] for item in full["changed"]} >= {kept, removed}
+        assert full["deleted"] == []
+        assert full["has_more"] is False
+
+        added = self._create(client, token, category_id, "Added")
+        client.put(f"/transactions/{kept}", json={"description": "Edited"}, headers=headers)
+        client.delete(f"/transactions/{removed}", headers=headers)
+
+        delta = self._sync(client, token, full["next_since"])
+        assert [(item["id"], item["description"]) for item in delta["changed"]] == [
+            (added, "Added"), (kept, "Edited")]
+        assert delta["deleted"] == [removed]
+
+        assert self._sync(client, token, delta["next_since"]) == {
+            "changed": [], "deleted": [], "next_since": delta["next_since"], "has_more": False}
+
+    def test_changed_items_match_transaction_response(self, client, sample_user_data):
+        """Test changed items have the shape of GET /transactions/{id}."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+        transaction_id = self._create(client, token, category_id, "Shape")
+
+        item = next(item for item in self._sync(client, token)["changed"]
+                    if item["id"] == transaction_id)
+        single = client.get(f"/transactions/{transaction_id}",
+                            headers={"Authorization": f"Bearer {token}"}).json()
+        assert item == single
+
+    def test_paged_sync(self, client, sample_user_data):
+        """Test has_more pages cover every change exactly once."""
+        token = authenticate_user(client, sample_user_data)
+        category_id = create_test_category(client, token)
+        since = self._sync(client, token)["next_since"]
+        ids = [self._create(client, token, category_id, f"Item {index}") for index in range(5)]
+
+        seen = []
+        while True:
+            page = self._sync(client, token, since, limit=2)
+            seen.extend(item["id"] for item in page["changed"])
+            since = page["next_since"]
+            if not page["has_more"]:
+                break
+
+        assert seen == ids
+
+    def test_invalid_token(self, client, sample_user_data):
+        """Test malformed tokens and other users' tokens are rejected."""
+        token = authenticate_user(client, sample_user_data)
+        other_token = authenticate_user(client, {
+            **sample_user_data, "email": "other@example.com"})
+        other_since = self._sync(client, other_token)["next_since"]
+
+        for since in ("garbage", other_since):
+            response = client.get("/transactions/changes", params={"since": since},
+                                  headers={"Authorization": f"Bearer {token}"})
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_requires_authentication(self, client):
+        """Test the sync is not served anonymously."""
+        response = client.get("/transactions/changes")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestTransactionBulkChanges:
+    """Test PATCH and DELETE /transactions/bulk."""
+
+    def _setup(self, client, sample_user_data, count=3):
+        token = authenticate_user(client, sample_user_data)
+        headers = {"Authorization": f"Bearer {token}"}
+        category_id = create_test_category(client, token)
+        ids = [
+            client.post("/transactions/", json=create_test_transaction_data(
+                category_id, f"Item {index}", str(10 * (index + 1))), headers=headers).json()["id"]
+            for index in range(count)
+        ]
+        return token, headers, category_id, ids
+
+    def test_patch_by_ids(self, client, sample_user_data):
+        """Test recategorising listed transactions returns the affected count."""
+        token, headers, _, ids = self._setup(client, sample_user_data)
+        target = create_test_category(client, token, name="Target")
+
+        response = client.patch("/transactions/bulk", json={
+            "ids": ids[:2], "changes": {"category_id": target}}, headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": 2}
+        listed = {item["id"]: item for item in client.get(
+            "/transactions/", params={"category_id": target}, headers=headers).json()}
+        assert set(listed) == set(ids[:2])
+        assert listed[ids[0]]["category_name"] == "Target"
+
+    def test_patch_updates_summary(self, client, sample_user_data):
+        """Test the summary reflects amounts changed in bulk."""
+        _, headers, _, ids = self._setup(client, sample_user_data)
+
+        client.patch("/transactions/bulk", json={
+            "filter": {"min_amount": "20"}, "changes": {"amount": "1.00"}}, headers=headers)
+
+        summary = client.get("/summary/", headers=headers).json()
+        assert Decimal(str(summary["totals"]["expense"])) == Decimal("12.00")
+
+    def test_delete_by_filter(self, client, sample_user_data):
+        """Test deleting everything matching a filter."""
+        _, headers, _, ids = self._setup(client, sample_user_data)
+
+        response = client.request("DELETE", "/transactions/bulk", json={
+            "filter": {"description_query": "item", "max_amount": "20"}}, headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": 2}
+        remaining = [item["id"] for item in client.get(
+            "/transactions/", params={"description_query": "item"}, headers=headers).json()]
+        assert remaining == [ids[2]]
+
+    def test_delete_reaches_delta_sync(self, client, sample_user_data):
+        """Test bulk deletes are reported by the delta sync."""
+        _, headers, _, ids = self._setup(client, sample_user_data)
+        since = client.get("/transactions/changes", headers=headers).json()["next_since"]
+
+        client.request("DELETE", "/transactions/bulk", json={"ids": ids}, headers=headers)
+
+        changes = client.get("/transactions/changes", params={"since": since},
+                             headers=headers).json()
+        assert sorted(changes["deleted"]) == sorted(ids)
+
+    def test_invalid_selection(self, client, sample_user_data):
+        """Test exactly one of ids or filter, and a non-empty change, are required."""
+        _, headers, _, ids = self._setup(client, sample_user_data, count=1)
+
+        for body in ({"changes": {"description": "x"}},
+                     {"ids": ids, "filter": {}, "changes": {"description": "x"}},
+                     {"ids": ids, "changes": {}}):
+            response = client.patch("/transactions/bulk", json=body, headers=headers)
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        response = client.request("DELETE", "/transactions/bulk", json={}, headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_patch_invalid_category(self, client, sample_user_data):
+        """Test an inaccessible target category is rejected."""
+        _, headers, _, ids = self._setup(client, sample_user_data, count=1)
+
+        response = client.patch("/transactions/bulk", json={
+            "ids": ids, "changes": {"category_id": 99999}}, headers=headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_id_limit(self, client, sample_user_data, monkeypatch):
+        """Test id lists over BULK_CHANGE_MAX_IDS are rejected."""
+        from app.core.config import get_settings
+        monkeypatch.setattr(get_settings(), "bulk_change_max_ids", 1)
+        _, headers, _, ids = self._setup(client, sample_user_data, count=2)
+
+        response = client.request("DELETE", "/transactions/bulk", json={"ids": ids}, headers=headers)
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
@@ -0,0 +1,36 @@
+import pytest
+
+from benchmarks.data import generate_dataset
+from benchmarks.regression import (
+    DETERMINISTIC_METRICS, GATE_DATASET, compare, format_comparisons, load_baseline,
+    measure, write_baseline
+)
+
+
+class TestPerformanceRegression:
+    """Gate transaction and summary SQL counts (and latency on request) on the baseline."""
+
+    def test_no_regression(self, client, db_session, request):
+        """Test no gated metric grows beyond its tolerance."""
+        dataset = generate_dataset(db_session.get_bind(), GATE_DATASET)
+        # One untimed pass warms connections, caches and lazy imports
+        measure(client, dataset, requests=2, seed=-1)
+        results = measure(client, dataset)
+
+        if request.config.getoption("--update-baseline"):
+            write_baseline(results)
+            return
+
+        baseline = load_baseline()
+        if not baseline:
+            pytest.fail("No benchmarks/baseline.json; record one with --update-baseline")
+
+        # Latency limits were recorded on one machine, so they are opt-in
+        gated = None if request.config.getoption("--gate-latency") else DETERMINISTIC_METRICS
+        comparisons = compare(baseline, results, gated)
+        regressions = [item for item in comparisons if item.regressed]
+        assert not regressions, (
+            "Performance regressed against benchmarks/baseline.json "
+            "(re-record with --update-baseline if intended):\n"
+            + format_comparisons(comparisons)
+        )
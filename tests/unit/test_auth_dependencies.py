@@ -1,17 +1,30 @@
+import asyncio
+
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event
+
+from tests.conftest import TestingAsyncSessionLocal, async_engine
 
-from app.core.deps import get_current_user
-from app.core.security import create_access_token, verify_token
+from app.core.deps import get_current_principal, get_current_user, user_cache
+from app.core.security import Principal, create_access_token, verify_token, verify_token_principal
 from app.crud.user import get_user_by_email
 
 
+def run_dependency(dependency, *args):
+    async def call():
+        async with TestingAsyncSessionLocal() as db:
+            return await dependency(db, *args)
+    return asyncio.run(call())
+
+
 class TestAuthenticationDependencies:
     """Test authentication dependency functions."""
 
     def test_get_current_user_success(self, db_session, sample_user):
-        """Test getting current user with valid email."""
-        user = get_current_user(db_session, sample_user.email)
+        """Test getting current user with a valid principal."""
+        user = run_dependency(
+            get_current_user, Principal(id=sample_user.id, email=sample_user.email))
         assert user is not None
         assert user.email == sample_user.email
         assert user.id == sample_user.id
@@ -19,18 +32,70 @@ class TestAuthenticationDependencies:
     def test_get_current_user_not_found(self, db_session):
         """Test getting current user when user doesn't exist in database."""
         with pytest.raises(HTTPException) as exc_info:
-            get_current_user(db_session, "nonexistent@example.com")
+            run_dependency(
+                get_current_user, Principal(id=999, email="nonexistent@example.com"))
 
         assert exc_info.value.status_code == 404
         assert "User not found" in str(exc_info.value.detail)
 
     def test_full_authentication_chain(self, db_session, sample_user):
         """Test the complete authentication dependency chain."""
-        token = create_access_token(subject=sample_user.email)
+        token = create_access_token(
+            subject=sample_user.email, user_id=sample_user.id)
 
         verified_email = verify_token(token)
         assert verified_email == sample_user.email
 
-        user = get_current_user(db_session, verified_email)
+        principal = run_dependency(get_current_principal, token)
+        user = run_dependency(get_current_user, principal)
         assert user.id == sample_user.id
         assert user.email == sample_user.email
+
+
+class TestCurrentPrincipal:
+    """Test the token-only principal dependency and the user cache."""
+
+    @pytest.fixture
+    def statements(self, db_session):
+        captured = []
+
+        def record(conn, cursor, statement, *args):
+            captured.append(statement)
+
+        engine = async_engine.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        yield captured
+        event.remove(engine, "before_cursor_execute", record)
+
+    def test_principal_from_uid_claim_skips_database(self, db_session, sample_user, statements):
+        """Test tokens carrying uid resolve without any query."""
+        token = create_access_token(
+            subject=sample_user.email, user_id=sample_user.id)
+        statements.clear()
+
+        principal = run_dependency(get_current_principal, token)
+
+        assert principal == Principal(id=sample_user.id, email=sample_user.email)
+        assert statements == []
+
+    def test_principal_from_legacy_token(self, db_session, sample_user):
+        """Test tokens without uid fall back to a lookup by email."""
+        token = create_access_token(subject=sample_user.email)
+        assert verify_token_principal(token).id is None
+
+        principal = run_dependency(get_current_principal, token)
+
+        assert principal.id == sample_user.id
+
+    def test_current_user_is_cached(self, db_session, sample_user, statements):
+        """Test the full user row is read from the database only once."""
+        principal = Principal(id=sample_user.id, email=sample_user.email)
+        run_dependency(get_current_user, principal)
+        statements.clear()
+
+        user = run_dependency(get_current_user, principal)
+
+        assert user.email == sample_user.email
+        assert user.full_name == sample_user.full_name
+        assert statements == []
+        assert user_cache.stats()["hits"] == 1
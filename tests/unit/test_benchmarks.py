@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+from sqlalchemy import func, select
+
+from app.models.category import Category
+from app.models.daily_category_total import DailyCategoryTotal
+from app.models.transaction import Transaction
+from app.models.user import User
+from benchmarks.data import DatasetConfig, generate_dataset
+from benchmarks.scenarios import percentile
+
+CONFIG = DatasetConfig(users=2, transactions_per_user=50, categories_per_user=2, seed=7)
+
+
+def transaction_rows(db_session):
+    return db_session.execute(
+        select(Transaction.description, Transaction.amount, Transaction.date)
+        .order_by(Transaction.id)
+    ).all()
+
+
+class TestBenchmarkData:
+    """Test the synthetic benchmark data generator."""
+
+    def test_generates_users_categories_and_transactions(self, db_session):
+        """Test the configured number of rows is created with matching rollups."""
+        dataset = generate_dataset(db_session.get_bind(), CONFIG)
+
+        assert len(dataset.users) == 2
+        assert all(len(user.category_ids) == 2 for user in dataset.users)
+        assert db_session.scalar(select(func.count(Transaction.id))) == 100
+        assert db_session.scalar(
+            select(func.sum(DailyCategoryTotal.transaction_count))) == 100
+        assert db_session.scalar(select(func.sum(DailyCategoryTotal.total_amount))) == \
+            db_session.scalar(select(func.sum(Transaction.amount)))
+
+    def test_same_seed_same_rows(self, db_session):
+        """Test generation is deterministic for a given seed."""
+        generate_dataset(db_session.get_bind(), CONFIG)
+        first = transaction_rows(db_session)
+        for model in (DailyCategoryTotal, Transaction, Category, User):
+            db_session.query(model).delete()
+        db_session.commit()
+
+        generate_dataset(db_session.get_bind(), CONFIG)
+        assert transaction_rows(db_session) == first
+
+    def test_amounts_have_two_decimals(self, db_session):
+        """Test generated amounts are valid transaction amounts."""
+        generate_dataset(db_session.get_bind(), CONFIG)
+
+        for _, amount, _ in transaction_rows(db_session):
+            assert Decimal("1.00") <= amount <= Decimal("500.00")
+            assert amount == amount.quantize(Decimal("0.01"))
+
+
+class TestPercentile:
+    """Test nearest-rank percentiles used in the report."""
+
+    def test_percentile(self):
+        """Test percentiles of a sorted list."""
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([], 50) is None
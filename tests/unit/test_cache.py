@@ -0,0 +1,185 @@
+import pytest
+from decimal import Decimal
+
+from tests.conftest import count_statements, create_transaction_schema
+
+from app.core.cache import RecentWrites, TTLCache, recent_writes
+from app.crud.transaction import create_transaction
+from app.crud.user import get_user_data_version
+from app.schemas.summary import SeriesQueryParams, SummaryQueryParams
+from app.services.summary_service import SummaryService, summary_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test the bounded LRU/TTL cache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test lookups are counted as hits and misses."""
+        cache = TTLCache(max_entries=2, ttl_seconds=10)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted at capacity."""
+        cache = TTLCache(max_entries=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiration(self):
+        """Test entries expire after the TTL."""
+        clock = FakeClock()
+        cache = TTLCache(max_entries=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_delete(self):
+        """Test deleting an entry, including a missing one."""
+        cache = TTLCache(max_entries=2, ttl_seconds=10)
+        cache.set("a", 1)
+
+        cache.delete("a")
+        cache.delete("missing")
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disabled_cache(self):
+        """Test a zero sized cache never stores entries."""
+        cache = TTLCache(max_entries=0, ttl_seconds=10)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+
+class TestRecentWrites:
+    """Test the last-write times behind read-your-writes."""
+
+    def test_written_recently_within_window(self):
+        """Test a write is recent for the window and only for its user."""
+        clock = FakeClock()
+        writes = RecentWrites(window_seconds=5, clock=clock)
+        assert not writes.written_recently(1)
+
+        writes.record(1)
+        clock.now = 4.9
+        assert writes.written_recently(1)
+        assert not writes.written_recently(2)
+
+        clock.now = 5.0
+        assert not writes.written_recently(1)
+
+    def test_expired_writes_are_dropped(self):
+        """Test only writes still inside the window are kept."""
+        clock = FakeClock()
+        writes = RecentWrites(window_seconds=5, clock=clock)
+        for user_id in range(100):
+            writes.record(user_id)
+
+        clock.now = 5.0
+        writes.record(100)
+
+        assert len(writes) == 1
+        assert writes.written_recently(100)
+
+    def test_rewrite_moves_user_to_newest(self):
+        """Test a repeated write keeps the user past older writers' expiry."""
+        clock = FakeClock()
+        writes = RecentWrites(window_seconds=5, clock=clock)
+        writes.record(1)
+        writes.record(2)
+        clock.now = 3.0
+        writes.record(1)
+
+        clock.now = 6.0
+        writes.record(3)
+
+        assert len(writes) == 2
+        assert writes.written_recently(1)
+        assert not writes.written_recently(2)
+
+
+class TestSummaryCache:
+    """Test summary responses are cached and invalidated on writes."""
+
+    def test_repeated_summary_is_cached(self, db_session, sample_user, sample_category):
+        """Test identical summary queries are served from the cache."""
+        service = SummaryService(db_session)
+        params = SummaryQueryParams()
+
+        first = service.get_user_summary(sample_user.id, params)
+        second = service.get_user_summary(sample_user.id, params)
+
+        assert first is second
+        assert summary_cache.stats()["hits"] == 1
+
+    def test_write_invalidates_summary(self, db_session, sample_user, sample_category):
+        """Test a new transaction invalidates the user's cached summary."""
+        service = SummaryService(db_session)
+        params = SummaryQueryParams()
+
+        before = service.get_user_summary(sample_user.id, params)
+
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Lunch", "12.00"), sample_user.id)
+        after = service.get_user_summary(sample_user.id, params)
+
+        assert before.totals.expense == Decimal("0")
+        assert after.totals.expense == Decimal("12.00")
+
+    def test_write_from_another_process_invalidates_summary(
+            self, db_session, sample_user, sample_category):
+        """Test the cache follows the persisted data version, not this process's counter."""
+        service = SummaryService(db_session)
+        params = SummaryQueryParams()
+        service.get_user_summary(sample_user.id, params)
+
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Lunch", "12.00"), sample_user.id)
+        # As seen by a worker that never heard of the write
+        recent_writes.clear()
+
+        after = service.get_user_summary(sample_user.id, params)
+        assert after.totals.expense == Decimal("12.00")
+
+    def test_summary_cached_under_given_version(self, db_session, sample_user, sample_category):
+        """Test a version already read by the caller is used as the key."""
+        service = SummaryService(db_session)
+        params = SeriesQueryParams()
+        version = get_user_data_version(db_session, sample_user.id)
+
+        with count_statements(db_session) as statements:
+            first = service.get_user_series(sample_user.id, params, data_version=version)
+            second = service.get_user_series(sample_user.id, params, data_version=version)
+
+        assert first is second
+        # Only the series query; the version was not read again
+        assert len(statements) == 1
+
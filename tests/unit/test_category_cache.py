@@ -0,0 +1,281 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.category_cache import CachedCategory, UserCategoryCache, global_categories
+from app.crud.category import (
+    create_category,
+    delete_category,
+    get_accessible_category_ids,
+    get_categories_by_type,
+    get_categories_for_user,
+    get_category_by_id,
+    get_category_by_name,
+    update_category
+)
+from app.crud.transaction import create_transaction
+from app.crud.user import bump_user_data_version, get_user_data_version
+from app.models.category import Category, CategoryType
+from app.models.user import User
+from app.schemas.category import CategoryCreate, CategoryUpdate
+from app.schemas.transaction import TransactionCreate
+from tests.conftest import TestingAsyncSessionLocal, count_statements
+
+
+@pytest.fixture
+def seeded_globals(db_session):
+    categories = [
+        Category(name="Salary", category_type=CategoryType.income, user_id=None),
+        Category(name="Other Income", category_type=CategoryType.income, user_id=None),
+        Category(name="Food & Dining", category_type=CategoryType.expense, user_id=None),
+    ]
+    db_session.add_all(categories)
+    db_session.commit()
+    return categories
+
+
+class TestGlobalCategoryCache:
+    """Test the process-wide snapshot of global categories."""
+
+    def test_lookups_after_first_load_run_no_queries(self, db_session, seeded_globals):
+        """Test global lookups are served from the snapshot."""
+        salary_id, other_income_id = seeded_globals[0].id, seeded_globals[1].id
+        global_categories.get(db_session)
+
+        with count_statements(db_session) as statements:
+            assert len(get_categories_for_user(db_session)) == 3
+            assert get_category_by_name(db_session, "Other Income").id == other_income_id
+            assert get_category_by_id(db_session, salary_id).name == "Salary"
+            assert [category.name for category in get_categories_by_type(
+                db_session, CategoryType.expense)] == ["Food & Dining"]
+
+        assert statements == []
+        assert global_categories.loads == 1
+
+    def test_snapshot_is_immutable(self, db_session, seeded_globals):
+        """Test cached categories and indexes cannot be modified."""
+        snapshot = global_categories.get(db_session)
+
+        assert isinstance(snapshot.categories[0], CachedCategory)
+        with pytest.raises(AttributeError):
+            snapshot.categories[0].name = "Changed"
+        with pytest.raises(TypeError):
+            snapshot.by_id[0] = snapshot.categories[0]
+
+    def test_committed_global_write_refreshes_snapshot(self, db_session, seeded_globals):
+        """Test adding a global category bumps the version and reloads."""
+        version = global_categories.get(db_session).version
+
+        db_session.add(Category(name="Travel", category_type=CategoryType.expense, user_id=None))
+        db_session.commit()
+
+        assert global_categories.version > version
+        assert get_category_by_name(db_session, "Travel") is not None
+        assert global_categories.loads == 2
+
+    def test_user_category_write_keeps_snapshot(self, db_session, sample_user, seeded_globals):
+        """Test user-owned categories do not invalidate the global snapshot."""
+        version = global_categories.get(db_session).version
+
+        db_session.add(Category(name="Mine", category_type=CategoryType.expense,
+                                user_id=sample_user.id))
+        db_session.commit()
+
+        assert global_categories.version == version
+
+    def test_rolled_back_write_keeps_snapshot(self, db_session, seeded_globals):
+        """Test a flushed but rolled back global write does not invalidate."""
+        version = global_categories.get(db_session).version
+
+        db_session.add(Category(name="Draft", category_type=CategoryType.expense, user_id=None))
+        db_session.flush()
+        db_session.rollback()
+
+        assert global_categories.version == version
+
+    def test_fingerprint_follows_content(self, db_session, seeded_globals):
+        """Test the fingerprint survives a reload and moves with the rows."""
+        fingerprint = global_categories.get(db_session).fingerprint
+        global_categories.clear()
+        assert global_categories.get(db_session).fingerprint == fingerprint
+
+        db_session.add(Category(name="Travel", category_type=CategoryType.expense, user_id=None))
+        db_session.commit()
+
+        assert global_categories.get(db_session).fingerprint != fingerprint
+
+
+
+    def test_concurrent_async_cold_loads(self, db_session, seeded_globals):
+        """Test concurrent cold loads on the async path do not block the event loop."""
+        async def load():
+            async with TestingAsyncSessionLocal() as session:
+                snapshot = await session.run_sync(global_categories.get)
+                return len(snapshot.categories)
+
+        async def load_concurrently():
+            return await asyncio.gather(*(load() for _ in range(6)))
+
+        # A blocked event loop cannot time itself out, so it runs in a thread
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.append(asyncio.run(load_concurrently())), daemon=True)
+        worker.start()
+        worker.join(timeout=10)
+
+        assert not worker.is_alive(), "concurrent cold loads blocked the event loop"
+        assert results == [[3] * 6]
+        assert global_categories.get(db_session).version == global_categories.version
+
+    def test_startup_preloads_snapshot(self, db_session, seeded_globals, client):
+        """Test the app loads the snapshot on startup, before any request."""
+        assert global_categories.loads == 1
+
+        with count_statements(db_session) as statements:
+            global_categories.get(db_session)
+
+        assert statements == []
+
+
+class TestUserCategoryCache:
+    """Test per-user category snapshots and write-through invalidation."""
+
+    def test_lookups_after_first_load_run_no_queries(self, db_session, sample_user, seeded_globals):
+        """Test lookups at a known data version are in memory once loaded."""
+        user_category = create_category(db_session, CategoryCreate(
+            name="Mine", category_type=CategoryType.expense), sample_user.id)
+        user_id, user_category_id = sample_user.id, user_category.id
+        salary_id = seeded_globals[0].id
+        version = get_user_data_version(db_session, user_id)
+        get_categories_for_user(db_session, user_id, version)
+
+        with count_statements(db_session) as statements:
+            assert [category.name for category in get_categories_for_user(
+                db_session, user_id, version)] == ["Salary", "Other Income", "Food & Dining", "Mine"]
+            assert get_category_by_id(db_session, user_category_id, user_id, version).name == "Mine"
+            assert [category.name for category in get_categories_by_type(
+                db_session, "expense", user_id, version)] == ["Food & Dining", "Mine"]
+
+        assert statements == []
+
+    def test_lookups_without_version_only_read_it(self, db_session, sample_user, seeded_globals):
+        """Test lookups that must find the data version read nothing else."""
+        user_category = create_category(db_session, CategoryCreate(
+            name="Mine", category_type=CategoryType.expense), sample_user.id)
+        user_id, user_category_id = sample_user.id, user_category.id
+        salary_id = seeded_globals[0].id
+        get_categories_for_user(db_session, user_id)
+
+        with count_statements(db_session) as statements:
+            assert get_category_by_name(db_session, "Mine", user_id).id == user_category_id
+            assert get_accessible_category_ids(
+                db_session, [salary_id, user_category_id], user_id) == {salary_id, user_category_id}
+
+        assert len(statements) == 2
+        assert all("SELECT users.data_version" in statement for statement in statements)
+
+    def test_write_from_another_process_reloads(self, db_session, sample_user):
+        """Test a snapshot is retired once the persisted data version moves."""
+        user_id = sample_user.id
+        category = create_category(db_session, CategoryCreate(
+            name="Mine", category_type=CategoryType.expense), user_id)
+        category_id = category.id
+        get_categories_for_user(db_session, user_id)
+
+        # Renamed the way another worker would: its own cache is not ours
+        db_session.get(Category, category_id).name = "Renamed"
+        bump_user_data_version(db_session, user_id)
+        db_session.commit()
+
+        assert [category.name for category in get_categories_for_user(
+            db_session, user_id)] == ["Renamed"]
+        assert get_category_by_id(db_session, category_id, user_id).name == "Renamed"
+
+    def test_transaction_write_keeps_snapshot(self, db_session, sample_user):
+        """Test a transaction write re-tags the snapshot instead of dropping it."""
+        user_id = sample_user.id
+        category = create_category(db_session, CategoryCreate(
+            name="Mine", category_type=CategoryType.expense), user_id)
+        category_id = category.id
+        get_categories_for_user(db_session, user_id)
+
+        with count_statements(db_session) as statements:
+            create_transaction(db_session, TransactionCreate(
+                category_id=category_id, description="Lunch", amount="12.50"), user_id)
+            get_categories_for_user(db_session, user_id, get_user_data_version(db_session, user_id))
+
+        assert not any("FROM categories" in statement for statement in statements)
+
+    @pytest.mark.parametrize("write", ["create", "update", "delete"])
+    def test_category_writes_invalidate(self, db_session, sample_user, write):
+        """Test create, update and delete drop the user's snapshot."""
+        user_id = sample_user.id
+        category = create_category(db_session, CategoryCreate(
+            name="Mine", category_type=CategoryType.expense), user_id)
+        category_id = category.id
+        get_categories_for_user(db_session, user_id)
+
+        if write == "create":
+            create_category(db_session, CategoryCreate(
+                name="Second", category_type=CategoryType.income), user_id)
+            expected = ["Mine", "Second"]
+        elif write == "update":
+            update_category(db_session, category_id, CategoryUpdate(name="Renamed"), user_id)
+            expected = ["Renamed"]
+        else:
+            delete_category(db_session, category_id, user_id)
+            expected = []
+
+        assert [category.name for category in get_categories_for_user(
+            db_session, user_id)] == expected
+
+    def test_other_users_are_not_invalidated(self, db_session, sample_user):
+        """Test a write only drops the writer's snapshot."""
+        other = User(email="other@example.com", hashed_password="x")
+        db_session.add(other)
+        db_session.commit()
+        other_id, user_id = other.id, sample_user.id
+        version = get_user_data_version(db_session, other_id)
+        get_categories_for_user(db_session, other_id, version)
+
+        create_category(db_session, CategoryCreate(
+            name="Mine", category_type=CategoryType.expense), user_id)
+
+        with count_statements(db_session) as statements:
+            get_categories_for_user(db_session, other_id, version)
+        assert statements == []
+
+    def test_stale_snapshot_finds_category_from_elsewhere(self, db_session, sample_user):
+        """Test an id missing from the snapshot is checked in the database."""
+        user_id = sample_user.id
+        get_categories_for_user(db_session, user_id)
+        # Written without the CRUD layer, like another process would
+        category = Category(name="Elsewhere", category_type=CategoryType.income, user_id=user_id)
+        db_session.add(category)
+        db_session.commit()
+        category_id = category.id
+
+        assert get_category_by_id(db_session, category_id, user_id).name == "Elsewhere"
+        assert get_accessible_category_ids(db_session, [category_id, 999], user_id) == {category_id}
+
+    def test_other_users_categories_are_not_accessible(self, db_session, sample_user):
+        """Test a category owned by someone else is rejected."""
+        other = User(email="other@example.com", hashed_password="x")
+        db_session.add(other)
+        db_session.commit()
+        foreign = create_category(db_session, CategoryCreate(
+            name="Theirs", category_type=CategoryType.expense), other.id)
+
+        assert get_category_by_id(db_session, foreign.id, sample_user.id) is None
+        assert get_accessible_category_ids(db_session, [foreign.id], sample_user.id) == set()
+
+    def test_cache_is_bounded(self, db_session):
+        """Test the least recently used users are evicted."""
+        cache = UserCategoryCache(max_entries=2, ttl_seconds=60)
+
+        for user_id in (1, 2, 3):
+            cache.get(db_session, user_id)
+
+        assert cache.stats()["size"] == 2
+        assert cache.stats()["evictions"] == 1
@@ -0,0 +1,177 @@
+import pytest
+from decimal import Decimal
+from datetime import date
+
+from tests.conftest import create_transaction_schema
+
+from app.crud.transaction import (
+    bulk_create_transactions,
+    bulk_delete_transactions,
+    bulk_update_transactions,
+    create_transaction,
+    update_transaction,
+    delete_transaction
+)
+from app.models.category import Category, CategoryType
+from app.models.daily_category_total import DailyCategoryTotal
+from app.schemas.transaction import TransactionUpdate
+
+
+def get_cells(db_session, user_id):
+    cells = db_session.query(DailyCategoryTotal).filter(
+        DailyCategoryTotal.user_id == user_id
+    ).all()
+    return {
+        (cell.category_id, cell.date): (
+            cell.total_amount, cell.transaction_count, cell.max_amount)
+        for cell in cells
+    }
+
+
+class TestDailyCategoryTotals:
+    """Test the daily rollup is maintained by transaction CRUD operations."""
+
+    def test_create_adds_to_cell(self, db_session, sample_user, sample_category):
+        """Test creating transactions accumulates into one day cell."""
+        for amount in ["10.50", "20.00"]:
+            create_transaction(db_session, create_transaction_schema(
+                sample_category.id, "Lunch", amount, "2025-08-01"), sample_user.id)
+
+        cells = get_cells(db_session, sample_user.id)
+        assert cells == {
+            (sample_category.id, date(2025, 8, 1)):
+                (Decimal("30.50"), 2, Decimal("20.00"))
+        }
+
+    def test_update_amount_recomputes_max(self, db_session, sample_user, sample_category):
+        """Test lowering the largest amount recomputes the cell maximum."""
+        small = create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Small", "10.00", "2025-08-01"), sample_user.id)
+        big = create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Big", "50.00", "2025-08-01"), sample_user.id)
+
+        update_transaction(db_session, big.id, TransactionUpdate(
+            amount=Decimal("5.00")), sample_user.id)
+
+        cells = get_cells(db_session, sample_user.id)
+        assert cells[(sample_category.id, date(2025, 8, 1))] == (
+            Decimal("15.00"), 2, Decimal("10.00"))
+
+    def test_update_amount_keeps_or_raises_max(self, db_session, sample_user, sample_category):
+        """Test amount changes below the maximum keep it and above it raise it."""
+        small = create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Small", "10.00", "2025-08-01"), sample_user.id)
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Big", "50.00", "2025-08-01"), sample_user.id)
+        cell = (sample_category.id, date(2025, 8, 1))
+
+        update_transaction(db_session, small.id, TransactionUpdate(
+            amount=Decimal("20.00")), sample_user.id)
+        assert get_cells(db_session, sample_user.id)[cell] == (
+            Decimal("70.00"), 2, Decimal("50.00"))
+
+        update_transaction(db_session, small.id, TransactionUpdate(
+            amount=Decimal("80.00")), sample_user.id)
+        assert get_cells(db_session, sample_user.id)[cell] == (
+            Decimal("130.00"), 2, Decimal("80.00"))
+
+    def test_update_moves_between_cells(self, db_session, sample_user, sample_category):
+        """Test changing date and category moves the amount between cells."""
+        other_category = Category(
+            name="Other", category_type=CategoryType.expense, user_id=sample_user.id)
+        db_session.add(other_category)
+        db_session.commit()
+
+        transaction = create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Move me", "42.00", "2025-08-01"), sample_user.id)
+
+        update_transaction(db_session, transaction.id, TransactionUpdate(
+            category_id=other_category.id, date=date(2025, 8, 2)), sample_user.id)
+
+        cells = get_cells(db_session, sample_user.id)
+        assert cells == {
+            (other_category.id, date(2025, 8, 2)):
+                (Decimal("42.00"), 1, Decimal("42.00"))
+        }
+
+    def test_update_description_keeps_cell(self, db_session, sample_user, sample_category):
+        """Test updates not touching amount, date or category leave the cell alone."""
+        transaction = create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Old", "42.00", "2025-08-01"), sample_user.id)
+
+        update_transaction(db_session, transaction.id, TransactionUpdate(
+            description="New"), sample_user.id)
+
+        cells = get_cells(db_session, sample_user.id)
+        assert cells[(sample_category.id, date(2025, 8, 1))] == (
+            Decimal("42.00"), 1, Decimal("42.00"))
+
+    def test_delete_removes_from_cell(self, db_session, sample_user, sample_category):
+        """Test deleting transactions shrinks and finally drops the cell."""
+        first = create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "First", "30.00", "2025-08-01"), sample_user.id)
+        second = create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Second", "12.00", "2025-08-01"), sample_user.id)
+
+        delete_transaction(db_session, first.id, sample_user.id)
+        cells = get_cells(db_session, sample_user.id)
+        assert cells[(sample_category.id, date(2025, 8, 1))] == (
+            Decimal("12.00"), 1, Decimal("12.00"))
+
+        delete_transaction(db_session, second.id, sample_user.id)
+        assert get_cells(db_session, sample_user.id) == {}
+
+    def test_bulk_create_adds_to_cells(self, db_session, sample_user, sample_category):
+        """Test bulk inserts roll up into existing and new cells across chunks."""
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Existing", "5.00", "2025-08-01"), sample_user.id)
+
+        created = bulk_create_transactions(db_session, [
+            create_transaction_schema(sample_category.id, "A", "10.00", "2025-08-01"),
+            create_transaction_schema(sample_category.id, "B", "2.50", "2025-08-01"),
+            create_transaction_schema(sample_category.id, "C", "7.00", "2025-08-02"),
+        ], sample_user.id, chunk_size=2)
+
+        assert created == 3
+        assert get_cells(db_session, sample_user.id) == {
+            (sample_category.id, date(2025, 8, 1)):
+                (Decimal("17.50"), 3, Decimal("10.00")),
+            (sample_category.id, date(2025, 8, 2)):
+                (Decimal("7.00"), 1, Decimal("7.00")),
+        }
+
+    def test_bulk_update_rebuilds_cells(self, db_session, sample_user, sample_category):
+        """Test a set-based recategorisation moves whole cells and keeps others."""
+        other_category = Category(
+            name="Other", category_type=CategoryType.expense, user_id=sample_user.id)
+        db_session.add(other_category)
+        db_session.commit()
+        moved = [create_transaction(db_session, create_transaction_schema(
+            sample_category.id, name, amount, "2025-08-01"), sample_user.id).id
+            for name, amount in [("A", "10.00"), ("B", "30.00")]]
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Stays", "4.00", "2025-08-01"), sample_user.id)
+
+        assert bulk_update_transactions(db_session, sample_user.id, {
+            "category_id": other_category.id}, ids=moved) == 2
+
+        assert get_cells(db_session, sample_user.id) == {
+            (sample_category.id, date(2025, 8, 1)):
+                (Decimal("4.00"), 1, Decimal("4.00")),
+            (other_category.id, date(2025, 8, 1)):
+                (Decimal("40.00"), 2, Decimal("30.00")),
+        }
+
+    def test_bulk_delete_rebuilds_cells(self, db_session, sample_user, sample_category):
+        """Test a set-based delete empties or shrinks the touched cells."""
+        for day, amount in [("2025-08-01", "10.00"), ("2025-08-01", "3.00"), ("2025-08-02", "8.00")]:
+            create_transaction(db_session, create_transaction_schema(
+                sample_category.id, "Item", amount, day), sample_user.id)
+
+        assert bulk_delete_transactions(db_session, sample_user.id, filters={
+            "min_amount": Decimal("8.00")}) == 2
+
+        assert get_cells(db_session, sample_user.id) == {
+            (sample_category.id, date(2025, 8, 1)):
+                (Decimal("3.00"), 1, Decimal("3.00")),
+        }
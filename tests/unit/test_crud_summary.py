@@ -0,0 +1,95 @@
+import pytest
+from decimal import Decimal
+from datetime import date
+
+from tests.conftest import create_transaction_schema
+
+from app.crud.summary import get_category_totals, get_largest_transactions
+from app.crud.transaction import create_transaction
+from app.models.category import Category, CategoryType
+
+
+@pytest.fixture
+def income_category(db_session, sample_user):
+    category = Category(
+        name="Test Income",
+        category_type=CategoryType.income,
+        user_id=sample_user.id
+    )
+    db_session.add(category)
+    db_session.commit()
+    db_session.refresh(category)
+    return category
+
+
+class TestSummaryAggregation:
+    """Test SQL-side summary aggregation queries."""
+
+    def test_category_totals(self, db_session, sample_user, sample_category, income_category):
+        """Test totals are grouped per category with their date span."""
+        for description, amount, day in [
+            ("Lunch", "10.50", "2025-08-01"),
+            ("Dinner", "20.25", "2025-08-05"),
+        ]:
+            create_transaction(db_session, create_transaction_schema(
+                sample_category.id, description, amount, day), sample_user.id)
+        create_transaction(db_session, create_transaction_schema(
+            income_category.id, "Salary", "3000.00", "2025-08-03"), sample_user.id)
+
+        rows = {
+            row.category_type: row
+            for row in get_category_totals(db_session, sample_user.id)
+        }
+
+        expense = rows[CategoryType.expense]
+        assert expense.category_name == "Test Category"
+        assert expense.total == Decimal("30.75")
+        assert expense.count == 2
+        assert expense.first_date == date(2025, 8, 1)
+        assert expense.last_date == date(2025, 8, 5)
+
+        income = rows[CategoryType.income]
+        assert income.total == Decimal("3000.00")
+        assert income.count == 1
+
+    def test_category_totals_with_filters(self, db_session, sample_user, sample_category):
+        """Test totals respect the date range filter."""
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Old", "100.00", "2025-07-01"), sample_user.id)
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "New", "50.00", "2025-08-01"), sample_user.id)
+
+        rows = get_category_totals(
+            db_session, sample_user.id, from_date=date(2025, 8, 1))
+
+        assert len(rows) == 1
+        assert rows[0].total == Decimal("50.00")
+
+    def test_category_totals_other_user(self, db_session, sample_user, sample_category):
+        """Test totals never include other users' transactions."""
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Mine", "100.00"), sample_user.id)
+
+        assert get_category_totals(db_session, sample_user.id + 999) == []
+
+    def test_largest_transactions(self, db_session, sample_user, sample_category, income_category):
+        """Test the largest transaction is picked per type, newest on ties."""
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Small", "10.00", "2025-08-01"), sample_user.id)
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Big old", "99.00", "2025-08-01"), sample_user.id)
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Big new", "99.00", "2025-08-02"), sample_user.id)
+        create_transaction(db_session, create_transaction_schema(
+            income_category.id, "Salary", "3000.00", "2025-08-03"), sample_user.id)
+
+        largest = get_largest_transactions(db_session, sample_user.id)
+
+        assert largest[CategoryType.expense].description == "Big new"
+        assert largest[CategoryType.expense].amount == Decimal("99.00")
+        assert largest[CategoryType.expense].category_name == "Test Category"
+        assert largest[CategoryType.income].description == "Salary"
+
+    def test_largest_transactions_empty(self, db_session, sample_user):
+        """Test no largest transactions without data."""
+        assert get_largest_transactions(db_session, sample_user.id) == {}
@@ -1,18 +1,36 @@
+import re
+
 import pytest
 from decimal import Decimal
-from datetime import date
-from tests.conftest import create_transaction_schema
+from datetime import date, datetime
+from tests.conftest import count_statements, create_transaction_schema
 
+from app.crud.category import create_category, update_category
 from app.crud.transaction import (
+    bulk_create_transactions,
+    bulk_delete_transactions,
+    bulk_update_transactions,
+    decode_cursor,
+    decode_sync_token,
+    encode_cursor,
+    encode_sync_token,
+    get_transaction_changes,
     get_transactions_for_user,
     get_transaction_by_id,
     create_transaction,
     update_transaction,
     delete_transaction
 )
+from app.db.fts import build_fts_match
+from app.crud.user import get_user_data_version
 from app.models.transaction import Transaction
+from app.models.transaction_tombstone import TransactionTombstone
 from app.models.category import Category, CategoryType
-from app.schemas.transaction import TransactionUpdate
+from app.models.user import User
+from app.schemas.category import CategoryCreate, CategoryUpdate
+from app.schemas.transaction import (
+    CURSOR_MAX_LENGTH, DESCRIPTION_MAX_LENGTH, TransactionQueryParams, TransactionUpdate
+)
 
 
 class TestTransactionCRUD:
@@ -68,11 +86,15 @@ class TestTransactionCRUD:
 
     def test_create_transaction_other_users_category(self, db_session, sample_user):
         """Test creating a transaction with another user's category."""
+        other_user = User(email="other@example.com", hashed_password="x")
+        db_session.add(other_user)
+        db_session.commit()
+
         # Create another user's category
         other_user_category = Category(
             name="Other User Category",
             category_type=CategoryType.expense,
-            user_id=sample_user.id + 999  # Different user
+            user_id=other_user.id  # Different user
         )
         db_session.add(other_user_category)
         db_session.commit()
@@ -427,3 +449,442 @@ class TestTransactionFiltering:
         )
         descriptions = [t.description for t in transactions]
         assert descriptions == sorted(descriptions)
+
+
+class TestTransactionCursor:
+    """Test keyset pagination cursors."""
+
+    def test_cursor_round_trip(self, db_session, sample_user, sample_category):
+        """Test a cursor decodes to the sort value and id it was built from."""
+        transaction = create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Test", "12.34", "2025-08-03"), sample_user.id)
+
+        assert decode_cursor(encode_cursor(transaction, "date"), "date") == (
+            date(2025, 8, 3), transaction.id)
+        assert decode_cursor(encode_cursor(transaction, "amount"), "amount") == (
+            Decimal("12.34"), transaction.id)
+
+    def test_cursor_for_deleted_row(self, db_session, sample_user, sample_category):
+        """Test a cursor keeps working after its anchor row is deleted."""
+        for day in ["2025-08-01", "2025-08-02", "2025-08-03"]:
+            create_transaction(db_session, create_transaction_schema(
+                sample_category.id, "Test", "10.00", day), sample_user.id)
+
+        first_page = get_transactions_for_user(
+            db_session, sample_user.id, limit=2)
+        after = decode_cursor(encode_cursor(first_page[-1], "date"), "date")
+        delete_transaction(db_session, first_page[-1].id, sample_user.id)
+
+        second_page = get_transactions_for_user(
+            db_session, sample_user.id, limit=2, after=after)
+        assert [t.date for t in second_page] == [date(2025, 8, 1)]
+
+    @pytest.mark.parametrize("character", ["\x01", "\"", "\U0001F600", "ž"])
+    def test_longest_cursors_pass_validation(self, character):
+        """Test every cursor the server can issue is accepted back."""
+        transaction = Transaction(
+            id=2 ** 63 - 1, description=character * DESCRIPTION_MAX_LENGTH)
+        cursor = encode_cursor(transaction, "description")
+
+        assert len(cursor) <= CURSOR_MAX_LENGTH
+        assert TransactionQueryParams(cursor=cursor, sort_by="description").cursor == cursor
+        assert decode_cursor(cursor, "description") == (
+            transaction.description, transaction.id)
+
+    def test_decode_invalid_cursor(self):
+        """Test malformed cursors decode to None."""
+        assert decode_cursor("not-a-cursor", "date") is None
+        assert decode_cursor("", "date") is None
+
+
+class TestDescriptionSearch:
+    """Test full-text description search."""
+
+    def test_build_fts_match(self):
+        """Test free text becomes an all-words prefix query."""
+        assert build_fts_match("rent") == '"rent"*'
+        assert build_fts_match('Rent "May" 2025') == '"Rent"* "May"* "2025"*'
+        assert build_fts_match("%%") is None
+
+    def test_search_matches_word_prefixes(self, db_session, sample_user, sample_category):
+        """Test every word of the query must prefix-match a word."""
+        for description in ["Monthly rental fee", "Rent May", "Parent gift"]:
+            create_transaction(db_session, create_transaction_schema(
+                sample_category.id, description, "10.00"), sample_user.id)
+
+        results = get_transactions_for_user(
+            db_session, sample_user.id, description_query="rent")
+        assert {t.description for t in results} == {
+            "Monthly rental fee", "Rent May"}
+
+        results = get_transactions_for_user(
+            db_session, sample_user.id, description_query="rent may")
+        assert [t.description for t in results] == ["Rent May"]
+
+    def test_search_follows_updates_and_deletes(self, db_session, sample_user, sample_category):
+        """Test the index is kept in sync with description changes."""
+        transaction = create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Groceries", "10.00"), sample_user.id)
+
+        update_transaction(db_session, transaction.id, TransactionUpdate(
+            description="Cinema tickets"), sample_user.id)
+        assert get_transactions_for_user(
+            db_session, sample_user.id, description_query="groceries") == []
+        assert len(get_transactions_for_user(
+            db_session, sample_user.id, description_query="cinema")) == 1
+
+        delete_transaction(db_session, transaction.id, sample_user.id)
+        assert get_transactions_for_user(
+            db_session, sample_user.id, description_query="cinema") == []
+
+    def test_search_is_scoped_to_user(self, db_session, sample_user, sample_category):
+        """Test matches of other users are not returned."""
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Rent", "10.00"), sample_user.id)
+
+        assert get_transactions_for_user(
+            db_session, sample_user.id + 999, description_query="rent") == []
+
+    def test_search_without_words_falls_back_to_like(self, db_session, sample_user, sample_category):
+        """Test punctuation-only queries still do a substring match."""
+        create_transaction(db_session, create_transaction_schema(
+            sample_category.id, "Discount 50%", "10.00"), sample_user.id)
+
+        results = get_transactions_for_user(
+            db_session, sample_user.id, description_query="%")
+        assert len(results) == 1
+
+
+class TestTransactionChangeTracking:
+    """Test change versions, tombstones and the delta sync query."""
+
+    def _create(self, db_session, user, category, description="Test"):
+        return create_transaction(
+            db_session, create_transaction_schema(category.id, description), user.id)
+
+    def _ids(self, rows):
+        return [row.id for row in rows]
+
+    def _stored(self, db_session, transaction_id):
+        db_session.expire_all()
+        return db_session.get(Transaction, transaction_id)
+
+    def test_update_refreshes_last_changed(self, db_session, sample_user, sample_category):
+        """Test last_changed is maintained on update, not only on insert."""
+        transaction = self._create(db_session, sample_user, sample_category)
+        self._stored(db_session, transaction.id).last_changed = datetime(2020, 1, 1)
+        db_session.commit()
+
+        updated = update_transaction(db_session, transaction.id, TransactionUpdate(
+            description="Renamed"), sample_user.id)
+
+        assert updated.last_changed.year > 2020
+
+    def test_writes_stamp_change_version(self, db_session, sample_user, sample_category):
+        """Test inserts and updates carry the data version of their write."""
+        transaction_id = self._create(db_session, sample_user, sample_category).id
+        assert self._stored(db_session, transaction_id).change_version == \
+            get_user_data_version(db_session, sample_user.id)
+
+        update_transaction(db_session, transaction_id, TransactionUpdate(
+            description="Renamed"), sample_user.id)
+        assert self._stored(db_session, transaction_id).change_version == \
+            get_user_data_version(db_session, sample_user.id)
+
+    def test_delete_leaves_tombstone(self, db_session, sample_user, sample_category):
+        """Test a delete records the id at the delete's version."""
+        transaction_id = self._create(db_session, sample_user, sample_category).id
+
+        delete_transaction(db_session, transaction_id, sample_user.id)
+
+        tombstone = db_session.query(TransactionTombstone).one()
+        assert tombstone.transaction_id == transaction_id
+        assert tombstone.change_version == get_user_data_version(db_session, sample_user.id)
+
+    def test_changes_after_watermark(self, db_session, sample_user, sample_category):
+        """Test only writes after `since` are returned, deletions included."""
+        kept = self._create(db_session, sample_user, sample_category, "Kept").id
+        removed = self._create(db_session, sample_user, sample_category, "Removed").id
+        since = get_user_data_version(db_session, sample_user.id)
+
+        added = self._create(db_session, sample_user, sample_category, "Added").id
+        update_transaction(db_session, kept, TransactionUpdate(amount=Decimal("5")), sample_user.id)
+        delete_transaction(db_session, removed, sample_user.id)
+        until = get_user_data_version(db_session, sample_user.id)
+
+        covered, rows, deleted = get_transaction_changes(
+            db_session, sample_user.id, since, until, limit=100)
+
+        assert covered == until
+        assert self._ids(rows) == [added, kept]
+        assert deleted == [removed]
+
+    def test_full_sync_skips_tombstones(self, db_session, sample_user, sample_category):
+        """Test a sync without `since` returns live rows only."""
+        kept = self._create(db_session, sample_user, sample_category).id
+        removed = self._create(db_session, sample_user, sample_category).id
+        delete_transaction(db_session, removed, sample_user.id)
+        until = get_user_data_version(db_session, sample_user.id)
+
+        covered, rows, deleted = get_transaction_changes(
+            db_session, sample_user.id, None, until, limit=100)
+
+        assert covered == until
+        assert self._ids(rows) == [kept]
+        assert deleted == []
+
+    def test_pages_end_on_version_boundary(self, db_session, sample_user, sample_category):
+        """Test paging walks every change once and splits no write."""
+        ids = [self._create(db_session, sample_user, sample_category).id for _ in range(5)]
+        until = get_user_data_version(db_session, sample_user.id)
+
+        seen, since = [], None
+        while True:
+            covered, rows, _ = get_transaction_changes(
+                db_session, sample_user.id, since, until, limit=2)
+            assert len(rows) <= 2
+            seen.extend(self._ids(rows))
+            since = covered
+            if covered == until:
+                break
+
+        assert seen == ids
+
+    def test_bulk_chunk_is_not_split(self, db_session, sample_user, sample_category):
+        """Test a write larger than the limit is returned whole."""
+        bulk_create_transactions(db_session, [
+            create_transaction_schema(sample_category.id) for _ in range(3)
+        ], sample_user.id)
+        after_bulk = get_user_data_version(db_session, sample_user.id)
+        self._create(db_session, sample_user, sample_category)
+        until = get_user_data_version(db_session, sample_user.id)
+
+        covered, rows, _ = get_transaction_changes(
+            db_session, sample_user.id, None, until, limit=2)
+
+        assert covered == after_bulk
+        assert len(rows) == 3
+
+    def test_category_rename_resends_transactions(self, db_session, sample_user, sample_category):
+        """Test a category rename re-stamps its transactions for the sync."""
+        transaction = self._create(db_session, sample_user, sample_category)
+        last_changed = transaction.last_changed
+        since = get_user_data_version(db_session, sample_user.id)
+
+        update_category(db_session, sample_category.id, CategoryUpdate(
+            name="Renamed"), sample_user.id)
+        until = get_user_data_version(db_session, sample_user.id)
+
+        _, rows, _ = get_transaction_changes(
+            db_session, sample_user.id, since, until, limit=100)
+        assert [(row.id, row.category_name) for row in rows] == [(transaction.id, "Renamed")]
+        assert self._stored(db_session, transaction.id).last_changed == last_changed
+
+    def test_sync_token_roundtrip(self):
+        """Test sync tokens decode only for the user they were issued to."""
+        token = encode_sync_token(7, 42)
+
+        assert decode_sync_token(token, 7) == 42
+        assert decode_sync_token(token, 8) is None
+        assert decode_sync_token("not-a-token", 7) is None
+        assert decode_sync_token(encode_cursor(Transaction(id=1, date=date(2025, 1, 1)), "date"), 7) is None
+
+
+class TestBulkTransactionChanges:
+    """Test set-based bulk update and delete."""
+
+    def _create(self, db_session, user, category, description, amount="10.00"):
+        return create_transaction(db_session, create_transaction_schema(
+            category.id, description, amount, "2025-08-01"), user.id).id
+
+    def _other_user_transaction(self, db_session):
+        other_user = User(email="other@example.com", hashed_password="x")
+        db_session.add(other_user)
+        db_session.commit()
+        other_category = Category(name="Theirs", category_type=CategoryType.expense,
+                                  user_id=other_user.id)
+        db_session.add(other_category)
+        db_session.commit()
+        return self._create(db_session, other_user, other_category, "Theirs")
+
+    def test_update_by_ids(self, db_session, sample_user, sample_category):
+        """Test only the listed transactions change, with a new version."""
+        first = self._create(db_session, sample_user, sample_category, "First")
+        second = self._create(db_session, sample_user, sample_category, "Second")
+        untouched = self._create(db_session, sample_user, sample_category, "Untouched")
+
+        updated = bulk_update_transactions(
+            db_session, sample_user.id, {"description": "Renamed"}, ids=[first, second])
+
+        assert updated == 2
+        version = get_user_data_version(db_session, sample_user.id)
+        rows = {transaction.id: transaction
+                for transaction in db_session.query(Transaction).all()}
+        assert rows[first].description == rows[second].description == "Renamed"
+        assert rows[first].change_version == version
+        assert rows[untouched].description == "Untouched"
+
+    def test_update_by_filter(self, db_session, sample_user, sample_category):
+        """Test list filters, category_type and description search included."""
+        self._create(db_session, sample_user, sample_category, "Coffee beans", "5.00")
+        self._create(db_session, sample_user, sample_category, "Coffee machine", "250.00")
+        self._create(db_session, sample_user, sample_category, "Rent", "900.00")
+
+        updated = bulk_update_transactions(db_session, sample_user.id, {"amount": Decimal("1.00")}, filters={
+            "description_query": "coffee", "max_amount": Decimal("300"),
+            "category_type": CategoryType.expense})
+
+        assert updated == 2
+        assert sorted(transaction.amount for transaction in get_transactions_for_user(
+            db_session, sample_user.id)) == [Decimal("1.00"), Decimal("1.00"), Decimal("900.00")]
+
+    def test_update_rejects_inaccessible_category(self, db_session, sample_user, sample_category):
+        """Test an invalid target category changes nothing."""
+        transaction_id = self._create(db_session, sample_user, sample_category, "Keep")
+        version = get_user_data_version(db_session, sample_user.id)
+
+        assert bulk_update_transactions(
+            db_session, sample_user.id, {"category_id": 999}, ids=[transaction_id]) is None
+
+        assert get_user_data_version(db_session, sample_user.id) == version
+        assert get_transaction_by_id(db_session, transaction_id, sample_user.id).category_id == sample_category.id
+
+    def test_other_users_transactions_untouched(self, db_session, sample_user, sample_category):
+        """Test ids of another user's transactions are ignored."""
+        theirs = self._other_user_transaction(db_session)
+        version = get_user_data_version(db_session, sample_user.id)
+
+        assert bulk_update_transactions(
+            db_session, sample_user.id, {"description": "Mine"}, ids=[theirs]) == 0
+        assert bulk_delete_transactions(db_session, sample_user.id, ids=[theirs]) == 0
+
+        assert db_session.get(Transaction, theirs).description == "Theirs"
+        # Nothing matched, so nothing was written
+        assert get_user_data_version(db_session, sample_user.id) == version
+
+    def test_delete_leaves_tombstones(self, db_session, sample_user, sample_category):
+        """Test a bulk delete records one tombstone per row at one version."""
+        ids = [self._create(db_session, sample_user, sample_category, f"Item {index}")
+               for index in range(3)]
+
+        assert bulk_delete_transactions(db_session, sample_user.id, ids=ids[:2]) == 2
+
+        version = get_user_data_version(db_session, sample_user.id)
+        tombstones = db_session.query(TransactionTombstone).order_by(
+            TransactionTombstone.transaction_id).all()
+        assert [(t.transaction_id, t.change_version) for t in tombstones] == [
+            (ids[0], version), (ids[1], version)]
+        assert [t.id for t in get_transactions_for_user(db_session, sample_user.id)] == [ids[2]]
+
+
+_TRANSACTIONS_STATEMENT = re.compile(
+    r"^(INSERT INTO|UPDATE|DELETE FROM|SELECT .*?\sFROM) transactions\b", re.S)
+
+
+class TestWriteRoundTrips:
+    """Test single-row writes reach the transactions table at most twice."""
+
+    def _transaction_statements(self, statements):
+        return [statement for statement in statements
+                if _TRANSACTIONS_STATEMENT.match(statement)]
+
+    def _create(self, db_session, user_id, category_id, description="Groceries"):
+        return create_transaction(db_session, create_transaction_schema(
+            category_id, description, "10.00", "2025-08-01"), user_id)
+
+    @pytest.fixture
+    def ids(self, db_session, sample_user, sample_category):
+        # Read before measuring: committed fixtures reload on attribute access
+        user_id, category_id = sample_user.id, sample_category.id
+        # Loads the user's category snapshot and keeps the rollup cell alive
+        self._create(db_session, user_id, category_id, "Warm-up")
+        return user_id, category_id
+
+    def test_create_inserts_with_returning(self, db_session, sample_category, ids):
+        """Test a create is one INSERT and is not read back after commit."""
+        user_id, category_id = ids
+
+        with count_statements(db_session) as statements:
+            transaction = self._create(db_session, user_id, category_id)
+
+        touched = self._transaction_statements(statements)
+        assert len(touched) == 1
+        assert touched[0].startswith("INSERT INTO transactions") and "RETURNING" in touched[0]
+        assert not any(statement.startswith("SELECT") for statement in statements)
+        # Bump the data version, insert, add to the rollup cell
+        assert len(statements) == 3
+        assert (transaction.category_name, transaction.category_type) == (
+            sample_category.name, sample_category.category_type.value)
+
+    def test_created_record_matches_stored_row(self, db_session, ids):
+        """Test the returned record carries the values the database stored."""
+        user_id, category_id = ids
+        transaction = create_transaction(db_session, create_transaction_schema(
+            category_id, "Defaults"), user_id)
+
+        stored = get_transaction_by_id(db_session, transaction.id, user_id)
+        assert transaction.date == stored.date == date.today()
+        assert transaction.last_changed == stored.last_changed
+        assert transaction.amount == stored.amount
+
+    def test_update_reads_once_and_writes_once(self, db_session, ids):
+        """Test an update reads the previous cell, then updates with RETURNING."""
+        user_id, category_id = ids
+        transaction_id = self._create(db_session, user_id, category_id).id
+
+        with count_statements(db_session) as statements:
+            updated = update_transaction(db_session, transaction_id, TransactionUpdate(
+                amount=Decimal("25.00")), user_id)
+
+        touched = self._transaction_statements(statements)
+        assert [statement.split()[0] for statement in touched] == ["SELECT", "UPDATE"]
+        assert "RETURNING" in touched[1]
+        # Nothing is selected once the row has been written
+        assert not any(statement.startswith("SELECT")
+                       for statement in statements[statements.index(touched[1]):])
+        # Read, bump, update, replace the amount in the rollup cell
+        assert len(statements) == 4
+        assert updated.amount == Decimal("25.00")
+
+    def test_update_moving_category_names_new_category(self, db_session, ids):
+        """Test the record names the target category without joining it."""
+        user_id, category_id = ids
+        other_id = create_category(db_session, CategoryCreate(
+            name="Other", category_type=CategoryType.income), user_id).id
+        transaction_id = self._create(db_session, user_id, category_id).id
+
+        with count_statements(db_session) as statements:
+            updated = update_transaction(db_session, transaction_id, TransactionUpdate(
+                category_id=other_id), user_id)
+
+        assert len(self._transaction_statements(statements)) == 2
+        assert (updated.category_name, updated.category_type) == ("Other", "income")
+
+    def test_delete_by_primary_key(self, db_session, ids):
+        """Test a delete is one guarded DELETE by primary key."""
+        user_id, category_id = ids
+        transaction_id = self._create(db_session, user_id, category_id).id
+
+        with count_statements(db_session) as statements:
+            assert delete_transaction(db_session, transaction_id, user_id) is True
+
+        touched = self._transaction_statements(statements)
+        assert len(touched) == 1
+        assert touched[0].startswith("DELETE FROM transactions WHERE transactions.id = ?")
+        assert "transactions.user_id = ?" in touched[0]
+        assert not any(statement.startswith("SELECT") for statement in statements)
+        # Delete, bump, tombstone; the warm-up row keeps the cell, so it is
+        # only updated
+        assert len(statements) == 4
+
+    def test_delete_other_users_transaction_writes_nothing(self, db_session, ids):
+        """Test a guarded delete that matches nothing stops after one statement."""
+        user_id, category_id = ids
+        transaction_id = self._create(db_session, user_id, category_id).id
+        version = get_user_data_version(db_session, user_id)
+
+        with count_statements(db_session) as statements:
+            assert delete_transaction(db_session, transaction_id, user_id + 1) is False
+
+        assert len(statements) == 1
+        assert get_user_data_version(db_session, user_id) == version
@@ -2,9 +2,15 @@ from datetime import datetime
 
 import pytest
 
-from app.crud.user import create_user, get_user_by_email
+from app.crud.category import create_category
+from app.crud.transaction import create_transaction, delete_transaction
+from app.crud.user import (
+    bump_user_data_version, create_user, get_user_by_email, get_user_data_version
+)
 from app.models.user import User
+from app.schemas.category import CategoryCreate
 from app.schemas.user import UserCreate
+from tests.conftest import create_transaction_schema
 
 
 class TestUserCRUD:
@@ -66,3 +72,42 @@ class TestUserCRUD:
         # Second user with same email should raise database constraint error
         with pytest.raises(Exception):  # SQLAlchemy will raise IntegrityError
             create_user(db_session, user_data2)
+
+
+class TestUserDataVersion:
+    """Test the persisted per-user write counter."""
+
+    def test_new_user_starts_at_zero(self, db_session, sample_user):
+        """Test a new user has data version 0."""
+        assert get_user_data_version(db_session, sample_user.id) == 0
+
+    def test_unknown_user_is_zero(self, db_session):
+        """Test an unknown user reads as version 0."""
+        assert get_user_data_version(db_session, 999) == 0
+
+    def test_writes_bump_version(self, db_session, sample_user, sample_category):
+        """Test transaction and category writes each bump the version once."""
+        transaction = create_transaction(
+            db_session, create_transaction_schema(sample_category.id), sample_user.id)
+        assert get_user_data_version(db_session, sample_user.id) == 1
+
+        create_category(db_session, CategoryCreate(
+            name="Other", category_type="income"), sample_user.id)
+        assert get_user_data_version(db_session, sample_user.id) == 2
+
+        assert delete_transaction(db_session, transaction.id, sample_user.id) is True
+        assert get_user_data_version(db_session, sample_user.id) == 3
+
+    def test_rejected_write_keeps_version(self, db_session, sample_user):
+        """Test a write refused for an inaccessible category does not bump."""
+        assert create_transaction(
+            db_session, create_transaction_schema(999), sample_user.id) is None
+
+        assert get_user_data_version(db_session, sample_user.id) == 0
+
+    def test_rolled_back_bump_is_discarded(self, db_session, sample_user):
+        """Test the bump belongs to the caller's transaction."""
+        bump_user_data_version(db_session, sample_user.id)
+        db_session.rollback()
+
+        assert get_user_data_version(db_session, sample_user.id) == 0
@@ -1,9 +1,15 @@
+import asyncio
+
 import pytest
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
+from tests.conftest import TestingAsyncSessionLocal
+
 from app.core.security import get_password_hash
 from app.crud.user import get_user_by_email
+from app.db.session import get_async_database_url, get_read_database_url
+from app.db.sqlite import run_sqlite_housekeeping
 from app.models.user import User
 
 
@@ -45,3 +51,91 @@ class TestDatabaseConnection:
         # Verify user was rolled back
         found_user = get_user_by_email(db_session, "rollback@test.com")
         assert found_user is None
+
+
+class TestAsyncDatabase:
+    """Test the async engine configuration and sessions."""
+
+    @pytest.mark.parametrize("database_url, expected", [
+        ("sqlite:///./data/homebudget.db", "sqlite+aiosqlite:///./data/homebudget.db"),
+        ("postgresql://user:pw@db/budget", "postgresql+asyncpg://user:pw@db/budget"),
+        ("postgresql+psycopg2://user:pw@db/budget", "postgresql+asyncpg://user:pw@db/budget"),
+        ("sqlite+aiosqlite:///./x.db", "sqlite+aiosqlite:///./x.db"),
+    ])
+    def test_async_url_derived_from_sync_url(self, database_url, expected):
+        """Test sync driver URLs map onto their async drivers."""
+        url = get_async_database_url(database_url)
+        assert url.render_as_string(hide_password=False) == expected
+
+    def test_async_url_override(self):
+        """Test an explicit async URL wins over the derived one."""
+        url = get_async_database_url(
+            "sqlite:///./a.db", "postgresql+asyncpg://user@db/budget")
+        assert url.drivername == "postgresql+asyncpg"
+
+    @pytest.mark.parametrize("database_url, expected", [
+        ("sqlite:///./data/homebudget.db", "sqlite:///file:./data/homebudget.db?mode=ro&uri=true"),
+        ("sqlite:///:memory:", None),
+        ("postgresql://user@db/budget", None),
+    ])
+    def test_read_url_derived_from_sync_url(self, database_url, expected):
+        """Test SQLite files get a read-only URI and other backends need a replica."""
+        url = get_read_database_url(database_url)
+        assert (url.render_as_string() if url else None) == expected
+
+    def test_read_url_override(self):
+        """Test an explicit replica URL is used as is."""
+        url = get_read_database_url(
+            "postgresql://user@db/budget", "postgresql://user@replica/budget")
+        assert url.host == "replica"
+
+    def test_reader_rejects_writes(self, db_session):
+        """Test the read-only connection refuses to write."""
+        from tests.conftest import TestingReadSessionLocal
+
+        with TestingReadSessionLocal() as reader:
+            assert reader.execute(text("SELECT count(*) FROM users")).scalar() == 0
+            with pytest.raises(SQLAlchemyError):
+                reader.execute(text(
+                    "INSERT INTO users (email, hashed_password) VALUES ('a@b.c', 'x')"))
+
+    def test_async_session_reads_committed_rows(self, db_session, sample_user):
+        """Test the async engine sees rows committed through the sync one."""
+        async def load_email():
+            async with TestingAsyncSessionLocal() as db:
+                user = await db.get(User, sample_user.id)
+                return user.email
+
+        assert asyncio.run(load_email()) == sample_user.email
+
+
+class TestSqliteTuning:
+    """Test the SQLite PRAGMAs applied on connect and housekeeping."""
+
+    def test_pragmas_applied_on_connect(self, db_session):
+        """Test every connection runs in WAL mode with the tuned settings."""
+        def pragma(name):
+            return db_session.execute(text(f"PRAGMA {name}")).scalar()
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == 5000
+        assert pragma("cache_size") == -20000
+        assert pragma("temp_store") == 2  # MEMORY
+        assert pragma("foreign_keys") == 1
+
+    def test_async_connections_get_pragmas(self, db_session):
+        """Test the async engine applies the same PRAGMAs."""
+        async def foreign_keys():
+            async with TestingAsyncSessionLocal() as db:
+                return (await db.execute(text("PRAGMA foreign_keys"))).scalar()
+
+        assert asyncio.run(foreign_keys()) == 1
+
+    def test_housekeeping_checkpoints_wal(self, db_session):
+        """Test housekeeping truncates the WAL without errors."""
+        checkpoint = run_sqlite_housekeeping(db_session.get_bind())
+
+        busy, wal_pages, checkpointed = checkpoint[0]
+        assert busy == 0
+        assert wal_pages == checkpointed
@@ -0,0 +1,76 @@
+from starlette.requests import Request
+
+from app.core.etag import etag_matches, not_modified, weak_etag
+
+
+def build_request(path="/transactions/", query="", if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({
+        "type": "http", "method": "GET", "path": path,
+        "query_string": query.encode(), "headers": headers
+    })
+
+
+class TestWeakEtag:
+    """Test ETag derivation from the request and data version."""
+
+    def test_weak_etag_format(self):
+        """Test tags are weak and quoted."""
+        etag = weak_etag(build_request(), 1, 7)
+
+        assert etag.startswith('W/"')
+        assert etag.endswith('"')
+
+    def test_same_inputs_same_tag(self):
+        """Test the tag is stable, so every process derives the same one."""
+        assert weak_etag(build_request(), 1, 7) == weak_etag(build_request(), 1, 7)
+
+    def test_tag_changes_with_version_user_and_url(self):
+        """Test the version, user, query string and path all enter the tag."""
+        etag = weak_etag(build_request(query="limit=10"), 1, 7)
+
+        assert weak_etag(build_request(query="limit=10"), 1, 8) != etag
+        assert weak_etag(build_request(query="limit=10"), 2, 7) != etag
+        assert weak_etag(build_request(query="limit=20"), 1, 7) != etag
+        assert weak_etag(build_request("/summary/", "limit=10"), 1, 7) != etag
+
+
+class TestEtagMatches:
+    """Test If-None-Match comparison."""
+
+    def test_missing_header_never_matches(self):
+        """Test requests without If-None-Match are not conditional."""
+        assert etag_matches(None, 'W/"abc"') is False
+        assert etag_matches("", 'W/"abc"') is False
+
+    def test_weak_comparison(self):
+        """Test weak and strong forms of the same tag match."""
+        assert etag_matches('W/"abc"', 'W/"abc"') is True
+        assert etag_matches('"abc"', 'W/"abc"') is True
+        assert etag_matches('W/"abd"', 'W/"abc"') is False
+
+    def test_tag_list_and_wildcard(self):
+        """Test any tag in a list matches, and * matches everything."""
+        assert etag_matches('"x", W/"abc" , "y"', 'W/"abc"') is True
+        assert etag_matches('"x", "y"', 'W/"abc"') is False
+        assert etag_matches("*", 'W/"abc"') is True
+
+
+class TestNotModified:
+    """Test the 304 short-circuit."""
+
+    def test_returns_304_with_tag(self):
+        """Test a matching request gets an empty 304 carrying the tag."""
+        response = not_modified(build_request(if_none_match='W/"abc"'), 'W/"abc"')
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_returns_none_when_stale(self):
+        """Test a request holding another tag proceeds."""
+        assert not_modified(build_request(if_none_match='W/"old"'), 'W/"abc"') is None
+        assert not_modified(build_request(), 'W/"abc"') is None
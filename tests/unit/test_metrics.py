@@ -0,0 +1,115 @@
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.core.metrics import Histogram, RequestMetrics, pool_stats, render_metrics
+
+HASHER_STATS = {
+    "workers": 4, "max_queue": 64, "in_flight": 0, "completed": 3, "rejected": 1,
+    "hash_seconds_total": 0.6, "hash_seconds_max": 0.25,
+    "wait_seconds_total": 0.0, "wait_seconds_max": 0.0
+}
+
+
+def build_metrics():
+    metrics = RequestMetrics()
+    for prefix in ("/auth", "/categories", "/transactions", "/summary"):
+        metrics.add_group(prefix)
+    return metrics
+
+
+class TestHistogram:
+    """Test fixed-bucket latency histograms."""
+
+    def test_observe_uses_upper_inclusive_buckets(self):
+        """Test a value equal to a bound lands in that bucket."""
+        histogram = Histogram((0.1, 1.0))
+
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(3.0)
+
+        assert histogram.counts == [1, 1, 1]
+        assert histogram.count == 3
+        assert histogram.sum == 3.6
+
+    def test_cumulative(self):
+        """Test exposition counts are cumulative and end with +Inf."""
+        histogram = Histogram((0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.05)
+        histogram.observe(2.0)
+
+        assert histogram.cumulative() == [(0.1, 2), (1.0, 2), (float("inf"), 3)]
+
+
+class TestRequestMetrics:
+    """Test grouping requests by router prefix."""
+
+    def test_group_for_matches_prefix_boundary(self):
+        """Test paths are grouped by their router and unknown paths by other."""
+        metrics = build_metrics()
+
+        assert metrics.group_for("/transactions/") is metrics.groups["transactions"]
+        assert metrics.group_for("/transactions/12") is metrics.groups["transactions"]
+        assert metrics.group_for("/summary") is metrics.groups["summary"]
+        assert metrics.group_for("/authors") is metrics.groups["other"]
+        assert metrics.group_for("/metrics") is metrics.groups["other"]
+
+    def test_observe(self):
+        """Test latency, status class and SQL counters are updated."""
+        metrics = build_metrics()
+
+        metrics.observe("/auth/login", 200, 0.02, 1, 0.001)
+        metrics.observe("/auth/login", 401, 0.3, 1, 0.002)
+
+        group = metrics.groups["auth"]
+        assert group.latency.count == 2
+        assert group.responses == [0, 1, 0, 1, 0]
+        assert group.queries == 2
+
+    def test_render_metrics(self):
+        """Test the text exposition output."""
+        metrics = build_metrics()
+        metrics.observe("/categories/", 200, 0.02, 2, 0.001)
+
+        output = render_metrics(metrics, [], HASHER_STATS)
+
+        assert "# TYPE homebudget_http_request_duration_seconds histogram" in output
+        assert ('homebudget_http_request_duration_seconds_bucket'
+                '{router="categories",le="0.025"} 1') in output
+        assert ('homebudget_http_request_duration_seconds_bucket'
+                '{router="categories",le="+Inf"} 1') in output
+        assert 'homebudget_http_responses_total{router="categories",status="2xx"} 1' in output
+        assert 'homebudget_http_request_queries_total{router="categories"} 2' in output
+        assert "homebudget_password_hash_rejected_total 1" in output
+        assert output.endswith("\n")
+
+
+class TestPoolStats:
+    """Test connection pool gauges."""
+
+    def test_queue_pool(self):
+        """Test a pooling engine reports its connection counts."""
+        engine = create_engine("sqlite:///:memory:", poolclass=QueuePool, pool_size=3)
+        try:
+            with engine.connect():
+                stats = pool_stats(engine)
+            assert stats["size"] == 3
+            assert stats["checked_out"] == 1
+        finally:
+            engine.dispose()
+
+    def test_non_pooling_engine(self):
+        """Test engines without a pool are skipped."""
+        engine = create_engine("sqlite:///:memory:", poolclass=NullPool)
+        assert pool_stats(engine) is None
+
+    def test_render_pool_samples(self):
+        """Test pool gauges are labelled by engine."""
+        engine = create_engine("sqlite:///:memory:", poolclass=QueuePool, pool_size=2)
+        try:
+            output = render_metrics(RequestMetrics(), [("primary", engine)], HASHER_STATS)
+        finally:
+            engine.dispose()
+
+        assert 'homebudget_db_pool_size{engine="primary"} 2' in output
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.password_hashing import PasswordHasher
+
+
+class TestPasswordHasher:
+    """Test the bounded bcrypt worker pool."""
+
+    def test_hash_and_verify(self):
+        """Test hashing and verification run on the pool and are timed."""
+        hasher = PasswordHasher(max_workers=2, max_queue=2)
+
+        async def scenario():
+            hashed = await hasher.hash("secret-password")
+            return (
+                await hasher.verify("secret-password", hashed),
+                await hasher.verify("wrong-password", hashed)
+            )
+
+        assert asyncio.run(scenario()) == (True, False)
+
+        stats = hasher.stats()
+        assert stats["completed"] == 3
+        assert stats["in_flight"] == 0
+        assert stats["hash_seconds_total"] > 0
+        assert stats["hash_seconds_max"] <= stats["hash_seconds_total"]
+
+    def test_rejects_when_queue_is_full(self):
+        """Test work beyond workers plus queue is refused with 503."""
+        hasher = PasswordHasher(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        async def scenario():
+            running = asyncio.ensure_future(hasher._run(release.wait))
+            queued = asyncio.ensure_future(hasher._run(release.wait))
+            await asyncio.sleep(0)
+
+            with pytest.raises(HTTPException) as exc_info:
+                await hasher._run(release.wait)
+
+            release.set()
+            await asyncio.gather(running, queued)
+            return exc_info.value
+
+        error = asyncio.run(scenario())
+
+        assert error.status_code == 503
+        assert error.headers["Retry-After"] == "1"
+        assert hasher.stats()["rejected"] == 1
+        assert hasher.stats()["in_flight"] == 0
@@ -0,0 +1,111 @@
+import itertools
+
+import pytest
+from decimal import Decimal
+from datetime import date, datetime
+from sqlalchemy import text
+
+from app.crud.transaction import build_transactions_query
+from app.models.category import CategoryType
+from app.schemas.transaction import SortField, SortOrder
+
+FILTERS = {
+    "category_id": 1,
+    "min_amount": Decimal("5.00"),
+    "max_amount": Decimal("50.00"),
+    "from_date": date(2025, 1, 1),
+    "to_date": date(2025, 12, 31),
+    "category_type": CategoryType.expense,
+    "description_query": "rent",
+}
+
+
+def explain(db_session, query) -> str:
+    statement = query.statement.compile(
+        dialect=db_session.get_bind().dialect,
+        compile_kwargs={"literal_binds": True}
+    )
+    rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {statement}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+def assert_uses_transaction_index(plan: str) -> None:
+    """The main lookup must search a user-scoped index; point lookups by
+    primary key (cursor anchors) are fine, full scans never are."""
+    transaction_steps = [
+        line for line in plan.splitlines()
+        if line.startswith(("SCAN transactions ", "SEARCH transactions "))
+    ]
+    assert transaction_steps, plan
+    assert any("INDEX ix_transactions_user_" in step
+               for step in transaction_steps), plan
+    for step in transaction_steps:
+        assert step.startswith("SEARCH"), plan
+        assert ("INDEX ix_transactions_user_" in step
+                or "INTEGER PRIMARY KEY (rowid=?)" in step), plan
+
+
+class TestTransactionQueryPlans:
+    """Test list queries are served by the composite transaction indexes."""
+
+    @pytest.mark.parametrize("as_rows", [False, True])
+    @pytest.mark.parametrize("filter_names", [
+        combination
+        for size in range(len(FILTERS) + 1)
+        for combination in itertools.combinations(FILTERS, size)
+    ])
+    def test_filter_combinations_use_index(self, db_session, filter_names, as_rows):
+        """Test every filter combination searches a user-scoped index."""
+        filters = {name: FILTERS[name] for name in filter_names}
+        query = build_transactions_query(
+            db_session, user_id=1, as_rows=as_rows, **filters)
+
+        assert_uses_transaction_index(explain(db_session, query))
+
+    @pytest.mark.parametrize("sort_by", [field.value for field in SortField])
+    @pytest.mark.parametrize("order", [order.value for order in SortOrder])
+    @pytest.mark.parametrize("as_rows", [False, True])
+    def test_sort_and_cursor_use_index(self, db_session, sort_by, order, as_rows):
+        """Test every sort field, with and without a cursor, reads in index order."""
+        query = build_transactions_query(
+            db_session, user_id=1, sort_by=sort_by, order=order, as_rows=as_rows)
+        plan = explain(db_session, query)
+        assert_uses_transaction_index(plan)
+        assert "TEMP B-TREE" not in plan, plan
+
+        cursor_values = {
+            "date": date(2025, 1, 1),
+            "amount": Decimal("10.00"),
+            "description": "rent",
+            "last_changed": datetime(2025, 1, 1),
+        }
+        query = build_transactions_query(
+            db_session, user_id=1, sort_by=sort_by, order=order, as_rows=as_rows,
+            after=(cursor_values[sort_by], 10))
+        plan = explain(db_session, query)
+        assert_uses_transaction_index(plan)
+        assert "TEMP B-TREE" not in plan, plan
+
+    @pytest.mark.parametrize("sort_by", ["date", "amount", "description", "last_changed"])
+    def test_cursor_seeks_on_sort_column(self, db_session, sort_by):
+        """Test keyset pages seek into the index on the sort column."""
+        cursor_values = {
+            "date": date(2025, 1, 1),
+            "amount": Decimal("10.00"),
+            "description": "rent",
+            "last_changed": datetime(2025, 1, 1),
+        }
+        query = build_transactions_query(
+            db_session, user_id=1, sort_by=sort_by, after=(cursor_values[sort_by], 10))
+
+        plan = explain(db_session, query)
+        assert f"(user_id=? AND {sort_by}<?)" in plan, plan
+
+    def test_description_search_uses_fts_index(self, db_session):
+        """Test description search is answered by the FTS5 index."""
+        query = build_transactions_query(
+            db_session, user_id=1, description_query="rent")
+
+        plan = explain(db_session, query)
+        assert "transactions_fts VIRTUAL TABLE INDEX" in plan, plan
+        assert_uses_transaction_index(plan)
@@ -0,0 +1,66 @@
+from benchmarks.regression import DETERMINISTIC_METRICS, Comparison, compare, format_comparisons
+
+BASELINE = {
+    "tolerances": {"p50_ms": {"ratio": 0.5, "minimum": 1.0},
+                   "queries": {"ratio": 0.0, "minimum": 0}},
+    "scenarios": {"summary": {"p50_ms": 10.0, "queries": 3}},
+}
+
+
+class TestRegressionCompare:
+    """Test comparing benchmark results with the stored baseline."""
+
+    def test_within_tolerance(self):
+        """Test growth inside the tolerance passes."""
+        comparisons = compare(BASELINE, {"summary": {"p50_ms": 14.9, "queries": 3}})
+
+        assert not any(item.regressed for item in comparisons)
+
+    def test_latency_regression(self):
+        """Test latency above baseline plus ratio is a regression."""
+        comparisons = compare(BASELINE, {"summary": {"p50_ms": 15.1, "queries": 3}})
+
+        assert [item.metric for item in comparisons if item.regressed] == ["p50_ms"]
+
+    def test_extra_query_regression(self):
+        """Test a single extra statement fails a zero tolerance."""
+        comparisons = compare(BASELINE, {"summary": {"p50_ms": 9.0, "queries": 4}})
+
+        assert [item.metric for item in comparisons if item.regressed] == ["queries"]
+
+    def test_minimum_tolerance(self):
+        """Test the absolute minimum applies to small baselines."""
+        baseline = {"tolerances": BASELINE["tolerances"],
+                    "scenarios": {"list": {"p50_ms": 0.5}}}
+
+        comparisons = compare(baseline, {"list": {"p50_ms": 1.4}})
+
+        assert comparisons[0].limit == 1.5
+        assert not comparisons[0].regressed
+
+    def test_new_scenario_is_not_gated(self):
+        """Test metrics missing from the baseline are reported but pass."""
+        comparisons = compare(BASELINE, {"export": {"p50_ms": 100.0}})
+
+        assert comparisons == [Comparison("export", "p50_ms", None, 100.0, None)]
+        assert "new" in format_comparisons(comparisons)
+
+    def test_ungated_metrics_are_reported_only(self):
+        """Test metrics outside `gated` never regress but keep their baseline."""
+        comparisons = compare(BASELINE, {"summary": {"p50_ms": 30.0, "queries": 4}},
+                              gated=DETERMINISTIC_METRICS)
+
+        assert [(item.metric, item.regressed) for item in comparisons] == [
+            ("p50_ms", False), ("queries", True)]
+        assert comparisons[0].baseline == 10.0
+        assert "not gated" in format_comparisons(comparisons)
+
+    def test_format_marks_regressions(self):
+        """Test the readable diff names the regressed metric."""
+        comparisons = compare(BASELINE, {"summary": {"p50_ms": 30.0, "queries": 3}})
+
+        table = format_comparisons(comparisons).splitlines()
+
+        assert table[0].split() == ["scenario", "metric", "baseline", "current", "limit"]
+        assert table[1].split() == ["summary", "p50_ms", "10", "30", "15", "REGRESSED"]
+        assert table[2].split()[-1] == "ok"
@@ -0,0 +1,84 @@
+import logging
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.request_timing import RequestTimingMiddleware, current_request_stats
+
+
+def build_app(db_session, query_budget):
+    app = FastAPI()
+    app.add_middleware(RequestTimingMiddleware, query_budget=query_budget)
+
+    @app.get("/queries/{count}")
+    def run_queries(count: int):
+        for _ in range(count):
+            db_session.execute(text("SELECT 1")).scalar()
+        return {"seen": current_request_stats().queries}
+
+    return app
+
+
+def parse_server_timing(header):
+    return {
+        match.group(1): match.group(2) or match.group(3)
+        for match in re.finditer(r'(\w+);(?:dur=([\d.]+)|desc="([^"]*)")', header)
+    }
+
+
+class TestRequestTimingMiddleware:
+    """Test per-request timing, SQL counting and the query budget."""
+
+    def test_server_timing_counts_queries(self, db_session):
+        """Test statements run by the endpoint are counted in Server-Timing."""
+        client = TestClient(build_app(db_session, query_budget=10))
+
+        response = client.get("/queries/3")
+
+        assert response.json() == {"seen": 3}
+        timing = parse_server_timing(response.headers["server-timing"])
+        assert timing["queries"] == "3"
+        assert float(timing["total"]) >= float(timing["db"])
+
+    def test_requests_are_counted_separately(self, db_session):
+        """Test counters start from zero on every request."""
+        client = TestClient(build_app(db_session, query_budget=10))
+
+        client.get("/queries/2")
+        response = client.get("/queries/1")
+
+        assert response.json() == {"seen": 1}
+
+    def test_log_fields(self, db_session, caplog):
+        """Test each request is logged with its timing fields."""
+        client = TestClient(build_app(db_session, query_budget=10))
+
+        with caplog.at_level(logging.INFO, logger="app.core.request_timing"):
+            client.get("/queries/2")
+
+        record = caplog.records[-1]
+        assert record.levelno == logging.INFO
+        assert record.fields["path"] == "/queries/2"
+        assert record.fields["status"] == 200
+        assert record.fields["queries"] == 2
+        assert "queries=2" in record.getMessage()
+
+    def test_query_budget_exceeded(self, db_session, caplog):
+        """Test requests over the query budget are logged as warnings."""
+        client = TestClient(build_app(db_session, query_budget=2))
+
+        with caplog.at_level(logging.INFO, logger="app.core.request_timing"):
+            client.get("/queries/3")
+
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        assert record.getMessage().startswith("query budget exceeded")
+
+    def test_statements_outside_requests_are_ignored(self, db_session):
+        """Test queries with no request in flight are not attributed."""
+        assert current_request_stats() is None
+        db_session.execute(text("SELECT 1")).scalar()
+        assert current_request_stats() is None
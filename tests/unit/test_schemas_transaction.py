@@ -1,13 +1,29 @@
 import pytest
+from collections import namedtuple
 from decimal import Decimal
-from datetime import date, datetime
-from pydantic import ValidationError
+from datetime import date, datetime, timezone
+from typing import List
+from pydantic import TypeAdapter, ValidationError
 
+from tests.conftest import create_transaction_schema
+
+from app.crud.transaction import (
+    create_transaction,
+    get_transaction_rows_for_user,
+    get_transactions_for_user
+)
+from app.models.category import CategoryType
 from app.schemas.transaction import (
     TransactionCreate,
     TransactionUpdate,
     TransactionResponse
 )
+from app.services.transaction_service import serialize_transaction_rows
+
+TransactionRow = namedtuple("TransactionRow", [
+    "category_id", "description", "amount", "date", "id", "user_id",
+    "last_changed", "category_name", "category_type"
+])
 
 
 class TestTransactionSchemas:
@@ -224,3 +240,37 @@ class TestTransactionSchemas:
         transaction_data["amount"] = Decimal("99")
         transaction = TransactionCreate(**transaction_data)
         assert transaction.amount == Decimal("99")
+
+
+class TestTransactionRowSerialization:
+    """Test the column-row JSON fast path matches the response model."""
+
+    def test_matches_response_model(self, db_session, sample_user, sample_category):
+        """Test rows serialize to the same JSON as validated ORM objects."""
+        for amount, day in (("99.99", date(2025, 8, 3)), ("0.50", date(2025, 1, 1)),
+                            ("1200.00", date(2024, 12, 31))):
+            create_transaction(db_session, create_transaction_schema(
+                sample_category.id, amount=amount, date=day), sample_user.id)
+
+        transactions = get_transactions_for_user(db_session, sample_user.id)
+        rows = get_transaction_rows_for_user(db_session, sample_user.id)
+
+        adapter = TypeAdapter(List[TransactionResponse])
+        expected = adapter.dump_json(adapter.validate_python(transactions, from_attributes=True))
+        assert serialize_transaction_rows(rows) == expected
+
+    def test_aware_datetimes_use_z(self):
+        """Test UTC timestamps are written like pydantic writes them."""
+        row = TransactionRow(
+            category_id=1, description="Coffee", amount=Decimal("3.10"),
+            date=date(2025, 1, 2), id=7, user_id=1,
+            last_changed=datetime(2025, 1, 2, 8, 30, tzinfo=timezone.utc),
+            category_name="Food", category_type=CategoryType.expense
+        )
+
+        expected = TransactionResponse.model_validate(row._asdict()).model_dump_json()
+        assert serialize_transaction_rows([row]) == f"[{expected}]".encode()
+
+    def test_empty_page(self):
+        """Test an empty page is an empty JSON array."""
+        assert serialize_transaction_rows([]) == b"[]"
@@ -10,6 +10,7 @@ from app.core.security import (
     get_password_hash,
     verify_password,
     verify_token,
+    verify_token_principal,
 )
 
 settings = get_settings()
@@ -130,3 +131,23 @@ class TestJWTTokens:
         payload = jwt.decode(token, settings.secret_key,
                              algorithms=[settings.jwt_algorithm])
         assert payload["sub"] == str(user_id)  # Should be converted to string
+
+    def test_token_carries_user_id(self):
+        """Test the uid claim is round-tripped into the principal."""
+        token = create_access_token(subject="uid@example.com", user_id=42)
+
+        principal = verify_token_principal(token)
+        assert principal.id == 42
+        assert principal.email == "uid@example.com"
+
+    def test_token_with_malformed_user_id(self):
+        """Test a non-integer uid claim is rejected."""
+        token = jwt.encode({
+            "sub": "uid@example.com",
+            "uid": "42",
+            "exp": datetime.now(timezone.utc) + timedelta(minutes=30)
+        }, settings.secret_key, algorithm=settings.jwt_algorithm)
+
+        with pytest.raises(HTTPException) as exc_info:
+            verify_token_principal(token)
+        assert exc_info.value.status_code == 401